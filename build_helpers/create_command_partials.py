@@ -38,6 +38,7 @@ def extract_command_partials():
         "backtesting",
         "backtesting-show",
         "backtesting-analysis",
+        "indicator-cache",
         "edge",
         "hyperopt",
         "hyperopt-list",
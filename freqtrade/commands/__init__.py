@@ -38,6 +38,7 @@ from freqtrade.commands.optimize_commands import (
     start_backtesting_show,
     start_edge,
     start_hyperopt,
+    start_indicator_cache,
     start_lookahead_analysis,
     start_recursive_analysis,
 )
@@ -59,6 +59,12 @@ ARGS_BACKTEST = [
     "exportdirectory",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_engine",
+    "backtest_jobs",
+    "backtest_shard_pairs",
+    "backtest_indicator_cache",
+    "backtest_profile_callbacks",
+    "backtest_stream_trades",
     "freqai_backtest_live_models",
     "backtest_notes",
 ]
@@ -81,7 +87,12 @@ ARGS_HYPEROPT = [
     "disableparamexport",
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
+    "hyperopt_worker_pool",
+    "hyperopt_pruning_rungs",
+    "hyperopt_study",
     "early_stop",
+    "backtest_engine",
+    "backtest_profile_callbacks",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -103,6 +114,8 @@ ARGS_BACKTEST_SHOW = [
     "backtest_breakdown",
 ]
 
+ARGS_INDICATOR_CACHE = ["indicator_cache_purge"]
+
 ARGS_LIST_EXCHANGES = [
     "print_one_column",
     "list_exchanges_all",
@@ -267,7 +280,19 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_breakdown",
+        "backtest_notes",
+        "backtest_engine",
+        "backtest_jobs",
+        "backtest_shard_pairs",
+        "backtest_indicator_cache",
+        "backtest_profile_callbacks",
+        "backtest_stream_trades",
+    )
 ] + [
     "minimum_trade_amount",
     "targeted_trade_amount",
@@ -286,6 +311,7 @@ NO_CONF_REQURIED = [
     "download-data",
     "hyperopt-list",
     "hyperopt-show",
+    "indicator-cache",
     "list-data",
     "list-freqaimodels",
     "list-hyperoptloss",
@@ -395,6 +421,7 @@ class Arguments:
             start_hyperopt,
             start_hyperopt_list,
             start_hyperopt_show,
+            start_indicator_cache,
             start_install_ui,
             start_list_data,
             start_list_exchanges,
@@ -524,6 +551,15 @@ class Arguments:
         backtesting_show_cmd.set_defaults(func=start_backtesting_show)
         self._build_args(optionlist=ARGS_BACKTEST_SHOW, parser=backtesting_show_cmd)
 
+        # Add indicator-cache subcommand
+        indicator_cache_cmd = subparsers.add_parser(
+            "indicator-cache",
+            help="Show or purge the backtesting indicator cache.",
+            parents=[_common_parser],
+        )
+        indicator_cache_cmd.set_defaults(func=start_indicator_cache)
+        self._build_args(optionlist=ARGS_INDICATOR_CACHE, parser=indicator_cache_cmd)
+
         # Add backtesting analysis subcommand
         analysis_cmd = subparsers.add_parser(
             "backtesting-analysis", help="Backtest Analysis module.", parents=[_common_parser]
@@ -268,6 +268,57 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Storage used for candle data while backtesting. "
+        "`columnar` keeps one contiguous array per column, reducing memory usage for "
+        f"large pairlists (default: {constants.BACKTEST_ENGINE_DEFAULT}).",
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "backtest_jobs": Arg(
+        "--jobs",
+        help="The number of backtest worker processes. Strategies from `--strategy-list` are "
+        "backtested concurrently, a single strategy is split by pair with `--shard-pairs`. "
+        "If -1, all CPUs are used, for -2, all CPUs but one "
+        "are used, etc. If 1 (default) is given, no parallel computing is used.",
+        type=int,
+        metavar="JOBS",
+    ),
+    "backtest_shard_pairs": Arg(
+        "--shard-pairs",
+        help="Backtest the pairs of a strategy in parallel worker processes (see `--jobs`). "
+        "Only valid if trades of one pair never influence trades of other pairs - "
+        "including entries rejected due to insufficient balance.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_indicator_cache": Arg(
+        "--indicator-cache",
+        help="Cache analyzed dataframes (the result of `populate_indicators()`) on disk, "
+        "and reuse them in later backtests with unchanged strategy, parameters and data.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_stream_trades": Arg(
+        "--stream-trades",
+        help="Write closed trades to disk in batches while backtesting, "
+        "instead of keeping all trades in memory.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_profile_callbacks": Arg(
+        "--profile-callbacks",
+        help="Record duration and call count of strategy callbacks and backtesting phases, "
+        "and show them in the backtest result.",
+        action="store_true",
+        default=False,
+    ),
+    "indicator_cache_purge": Arg(
+        "--purge",
+        help="Remove all entries from the indicator cache.",
+        action="store_true",
+        default=False,
+    ),
     # Hyperopt
     "hyperopt_path": Arg(
         "--hyperopt-path",
@@ -304,6 +355,25 @@ AVAILABLE_CLI_OPTIONS = {
         help="Run populate_indicators once per epoch.",
         action="store_true",
     ),
+    "hyperopt_worker_pool": Arg(
+        "--worker-pool",
+        help="Keep the processed data and the strategy loaded in the hyperopt worker "
+        "processes. Epochs only send the parameters to the workers.",
+        action="store_true",
+    ),
+    "hyperopt_pruning_rungs": Arg(
+        "--pruning-rungs",
+        help="Evaluate epochs on INT growing parts of the timerange first, "
+        "and stop epochs with poor intermediate results (successive halving pruning).",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "hyperopt_study": Arg(
+        "--study",
+        help="Join the hyperopt study NAME. Multiple hyperopt processes (also on different "
+        "machines, sharing the user data directory) can join the same study.",
+        metavar="NAME",
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
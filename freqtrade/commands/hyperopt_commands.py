@@ -30,8 +30,8 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
         config["user_data_dir"] / "hyperopt_results", config.get("hyperoptexportfilename")
     )
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - summaries are sufficient for the table and the csv export
+    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config, details=False)
 
     if not export_csv:
         try:
@@ -49,7 +49,7 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
 
     if epochs and not no_details:
         sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        results = HyperoptTools.load_epoch_details(results_file, sorted_epochs[0])
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
@@ -76,7 +76,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
     n = config.get("hyperopt_show_index", -1)
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config, details=False)
 
     filtered_epochs = len(epochs)
 
@@ -94,7 +94,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_epoch_details(results_file, epochs[n])
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
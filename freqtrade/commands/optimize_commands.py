@@ -1,4 +1,5 @@
 import logging
+from contextlib import nullcontext
 from typing import Any
 
 from freqtrade import constants
@@ -78,6 +79,43 @@ def start_backtesting_show(args: dict[str, Any]) -> None:
     show_sorted_pairlist(config, results)
 
 
+def start_indicator_cache(args: dict[str, Any]) -> None:
+    """
+    Show or purge the backtesting indicator cache
+    """
+    from freqtrade.configuration import setup_utils_configuration
+    from freqtrade.optimize.indicator_cache import IndicatorCache
+    from freqtrade.util import print_rich_table
+
+    config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+    cache = IndicatorCache(config)
+
+    if args["indicator_cache_purge"]:
+        removed = cache.purge()
+        logger.info(f"Removed {removed} entries from the indicator cache.")
+        return
+
+    entries = cache.get_entries()
+    per_strategy: dict[str, list] = {}
+    for entry in entries:
+        per_strategy.setdefault(entry.strategy, []).append(entry)
+    print_rich_table(
+        [
+            (
+                strategy,
+                str(len(strat_entries)),
+                str(len({(e.pair, e.timeframe) for e in strat_entries})),
+                f"{sum(e.size for e in strat_entries) / 1024 / 1024:.2f} MB",
+                max(e.last_used for e in strat_entries).strftime(constants.DATETIME_PRINT_FORMAT),
+            )
+            for strategy, strat_entries in sorted(per_strategy.items())
+        ],
+        ("Strategy", "Entries", "Pairs", "Size", "Last used"),
+        f"Indicator cache: {len(entries)} entries, "
+        f"{sum(e.size for e in entries) / 1024 / 1024:.2f} MB",
+    )
+
+
 def start_hyperopt(args: dict[str, Any]) -> None:
     """
     Start hyperopt script
@@ -101,7 +139,8 @@ def start_hyperopt(args: dict[str, Any]) -> None:
     lock = FileLock(Hyperopt.get_lock_filename(config))
 
     try:
-        with lock.acquire(timeout=1):
+        # Processes joining a study run simultaneously - each with its own data files.
+        with nullcontext() if config.get("hyperopt_study") else lock.acquire(timeout=1):
             # Remove noisy log messages
             logging.getLogger("hyperopt.tpe").setLevel(logging.WARNING)
             logging.getLogger("filelock").setLevel(logging.WARNING)
@@ -6,9 +6,14 @@ from freqtrade.constants import (
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
     BACKTEST_CACHE_AGE,
+    BACKTEST_ENGINES,
+    BACKTEST_STREAM_BATCH_SIZE_DEFAULT,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
+    HYPEROPT_INDICATOR_MEMO_SIZE_DEFAULT,
     HYPEROPT_LOSS_BUILTIN,
+    HYPEROPT_PRUNING_REDUCTION_FACTOR_DEFAULT,
+    INDICATOR_CACHE_SIZE_DEFAULT,
     MARGIN_MODES,
     ORDERTIF_POSSIBILITIES,
     ORDERTYPE_POSSIBILITIES,
@@ -236,6 +241,65 @@ CONF_SCHEMA = {
             "type": "string",
             "enum": BACKTEST_CACHE_AGE,
         },
+        "backtest_engine": {
+            "description": (
+                "Storage used for candle data while backtesting. "
+                "`columnar` keeps one contiguous array per column instead of a list per candle."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+        },
+        "backtest_jobs": {
+            "description": (
+                "The number of backtest worker processes. Strategies from `strategy_list` "
+                "are backtested concurrently, a single strategy is split by pair with "
+                "`backtest_shard_pairs`. "
+                "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+                "If 1 (default) is given, no parallel computing is used."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
+        "backtest_shard_pairs": {
+            "description": (
+                "Backtest the pairs of a strategy in parallel worker processes. "
+                "Only valid if trades of one pair never influence trades of other pairs."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_indicator_cache": {
+            "description": (
+                "Cache analyzed dataframes on disk, and reuse them in later backtests "
+                "with unchanged strategy, parameters and data."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_indicator_cache_size": {
+            "description": "Maximum size of the indicator cache in MB.",
+            "type": "integer",
+            "minimum": 1,
+            "default": INDICATOR_CACHE_SIZE_DEFAULT,
+        },
+        "backtest_profile_callbacks": {
+            "description": (
+                "Record duration and call count of strategy callbacks and backtesting phases."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_stream_trades": {
+            "description": "Write closed trades to disk in batches while backtesting.",
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_stream_batch_size": {
+            "description": "Closed trades written to disk at once (backtest_stream_trades).",
+            "type": "integer",
+            "minimum": 1,
+            "default": BACKTEST_STREAM_BATCH_SIZE_DEFAULT,
+        },
         # Hyperopt
         "hyperopt_path": {
             "description": "Specify additional lookup path for Hyperopt Loss functions.",
@@ -266,6 +330,56 @@ CONF_SCHEMA = {
             "description": "Perform analysis after each epoch in Hyperopt.",
             "type": "boolean",
         },
+        "hyperopt_indicator_memo_size": {
+            "description": (
+                "Memory budget (in MB, per worker process) for reusing indicators across "
+                "epochs with `analyze_per_epoch`. 0 disables reusing indicators."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": HYPEROPT_INDICATOR_MEMO_SIZE_DEFAULT,
+        },
+        "hyperopt_pruning_rungs": {
+            "description": (
+                "Number of partial backtests (growing parts of the timerange) used to prune "
+                "epochs with poor results. 0 disables pruning."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 0,
+        },
+        "hyperopt_pruning_reduction_factor": {
+            "description": (
+                "Pruning reduction factor - only the best 1/<factor> epochs of each partial "
+                "backtest continue."
+            ),
+            "type": "integer",
+            "minimum": 2,
+            "default": HYPEROPT_PRUNING_REDUCTION_FACTOR_DEFAULT,
+        },
+        "hyperopt_study": {
+            "description": (
+                "Name of a hyperopt study shared by multiple hyperopt processes. "
+                "Processes joining the same study write into the same results file."
+            ),
+            "type": "string",
+            "pattern": "^[A-Za-z0-9_.-]+$",
+        },
+        "hyperopt_study_storage": {
+            "description": (
+                "Storage of the hyperopt study - a database URL (e.g. sqlite:///study.sqlite) "
+                "or the path of a journal file. Defaults to a journal file in the hyperopt "
+                "results directory."
+            ),
+            "type": "string",
+        },
+        "hyperopt_worker_pool": {
+            "description": (
+                "Keep processed data and strategy loaded in the hyperopt worker processes."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "print_all": {
             "description": "Print all hyperopt trials, not just the best ones.",
             "type": "boolean",
@@ -327,6 +327,12 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_engine", "Parameter --backtest-engine={} detected ..."),
+            ("backtest_jobs", "Parameter --jobs detected: {}"),
+            ("backtest_shard_pairs", "Parameter --shard-pairs detected ..."),
+            ("backtest_indicator_cache", "Parameter --indicator-cache detected ..."),
+            ("backtest_profile_callbacks", "Parameter --profile-callbacks detected ..."),
+            ("backtest_stream_trades", "Parameter --stream-trades detected ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
@@ -342,6 +348,9 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_worker_pool", "Parameter --worker-pool detected."),
+            ("hyperopt_pruning_rungs", "Parameter --pruning-rungs detected: {}"),
+            ("hyperopt_study", "Parameter --study detected: {}"),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
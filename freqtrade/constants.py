@@ -77,6 +77,12 @@ AVAILABLE_DATAHANDLERS = ["json", "jsongz", "feather", "parquet"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month", "year", "weekday"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
+BACKTEST_ENGINES = ["lists", "columnar"]
+BACKTEST_ENGINE_DEFAULT = "lists"
+INDICATOR_CACHE_SIZE_DEFAULT = 2048
+HYPEROPT_INDICATOR_MEMO_SIZE_DEFAULT = 512
+HYPEROPT_PRUNING_REDUCTION_FACTOR_DEFAULT = 3
+BACKTEST_STREAM_BATCH_SIZE_DEFAULT = 10_000
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = "%Y-%m-%d %H:%M:%S"
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -111,6 +117,7 @@ TRADING_MODES = ["spot", "margin", "futures"]
 MARGIN_MODES = ["cross", "isolated", ""]
 
 LAST_BT_RESULT_FN = ".last_result.json"
+BT_CATALOG_FN = ".backtest_catalog.sqlite"
 FTHYPT_FILEVERSION = "fthypt_fileversion"
 
 USERPATH_HYPEROPTS = "hyperopts"
@@ -20,6 +20,7 @@ from .bt_fileutils import (
     load_trades,
     load_trades_from_db,
     trade_list_to_dataframe,
+    update_backtest_catalog,
     update_backtest_metadata,
 )
 from .historic_precision import get_tick_size_over_time
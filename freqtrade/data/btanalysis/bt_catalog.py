@@ -0,0 +1,166 @@
+"""
+SQLite catalog of stored backtest results.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from freqtrade.ft_types import BacktestHistoryEntryType
+
+
+# Increase when changing the schema - the catalog is rebuilt from the result files.
+CATALOG_VERSION = 1
+
+ENTRY_COLUMNS = [
+    "filename",
+    "strategy",
+    "run_id",
+    "notes",
+    "backtest_start_time",
+    "backtest_start_ts",
+    "backtest_end_ts",
+    "timeframe",
+    "timeframe_detail",
+]
+
+
+class BacktestCatalog:
+    """
+    Index of the backtest history entries (metadata) of all results in one directory.
+    Each result file is stored with the modification time of its metadata file - so changed
+    results can be detected without opening them.
+    The catalog only caches the result files - it can be deleted and rebuilt at any time.
+    """
+
+    def __init__(self, database: Path | str) -> None:
+        """
+        :param database: Path to the catalog file, or ":memory:"
+        """
+        self._conn = sqlite3.connect(database, timeout=30)
+        try:
+            self._init_schema()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def __enter__(self) -> "BacktestCatalog":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _init_schema(self) -> None:
+        with self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CATALOG_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, mtime REAL NOT NULL)"
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    filename TEXT NOT NULL,
+                    strategy TEXT NOT NULL,
+                    run_id TEXT NOT NULL,
+                    notes TEXT NOT NULL,
+                    backtest_start_time INTEGER NOT NULL,
+                    backtest_start_ts INTEGER,
+                    backtest_end_ts INTEGER,
+                    timeframe TEXT,
+                    timeframe_detail TEXT,
+                    PRIMARY KEY (name, position)
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_strategy ON entries (strategy)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_start_time ON entries (backtest_start_time)"
+            )
+            self._conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+
+    def get_files(self) -> dict[str, float]:
+        """
+        All cataloged result files.
+        :return: {file name: metadata modification time}
+        """
+        return dict(self._conn.execute("SELECT name, mtime FROM files").fetchall())
+
+    def update_files(self, files: dict[str, tuple[float, list[BacktestHistoryEntryType]]]) -> None:
+        """
+        Add or replace result files.
+        :param files: {file name: (metadata modification time, history entries)}
+        """
+        with self._conn:
+            self._delete(list(files.keys()))
+            self._conn.executemany(
+                "INSERT INTO files (name, mtime) VALUES (?, ?)",
+                [(name, mtime) for name, (mtime, _) in files.items()],
+            )
+            self._conn.executemany(
+                f"INSERT INTO entries (name, position, {', '.join(ENTRY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(ENTRY_COLUMNS) + 2))})",
+                [
+                    (name, position, *(entry[col] for col in ENTRY_COLUMNS))  # type: ignore
+                    for name, (_, entries) in files.items()
+                    for position, entry in enumerate(entries)
+                ],
+            )
+
+    def remove_files(self, names: list[str]) -> None:
+        with self._conn:
+            self._delete(names)
+
+    def _delete(self, names: list[str]) -> None:
+        params = [(name,) for name in names]
+        self._conn.executemany("DELETE FROM entries WHERE name = ?", params)
+        self._conn.executemany("DELETE FROM files WHERE name = ?", params)
+
+    def query(
+        self,
+        *,
+        strategy: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[BacktestHistoryEntryType]:
+        """
+        History entries, newest result file first.
+        :param strategy: Only entries of this strategy
+        :param start_ts: Only backtests starting at or after this timestamp (ms)
+        :param end_ts: Only backtests ending at or before this timestamp (ms)
+        :param since: Only backtests run at or after this time (seconds)
+        :param until: Only backtests run at or before this time (seconds)
+        :param limit: Maximum number of entries to return
+        :param offset: Number of entries to skip
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        for condition, value in (
+            ("strategy = ?", strategy),
+            ("backtest_start_ts >= ?", start_ts),
+            ("backtest_end_ts <= ?", end_ts),
+            ("backtest_start_time >= ?", since),
+            ("backtest_start_time <= ?", until),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.extend([-1 if limit is None else limit, offset])
+        rows = self._conn.execute(
+            f"SELECT {', '.join(ENTRY_COLUMNS)} FROM entries {where} "
+            "ORDER BY name DESC, position ASC LIMIT ? OFFSET ?",
+            params,
+        ).fetchall()
+        return [dict(zip(ENTRY_COLUMNS, row, strict=True)) for row in rows]  # type: ignore
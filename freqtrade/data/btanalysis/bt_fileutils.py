@@ -3,6 +3,7 @@ Helpers when analyzing backtest data
 """
 
 import logging
+import sqlite3
 import zipfile
 from copy import copy
 from datetime import UTC, datetime
@@ -12,8 +13,11 @@ from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
+import rapidjson
 
-from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import BT_CATALOG_FN, LAST_BT_RESULT_FN
+from freqtrade.data.btanalysis.bt_catalog import BacktestCatalog
 from freqtrade.exceptions import ConfigurationError, OperationalException
 from freqtrade.ft_types import BacktestHistoryEntryType, BacktestResultType
 from freqtrade.misc import file_dump_json, json_load
@@ -23,6 +27,8 @@ from freqtrade.persistence import LocalTrade, Trade, init_db
 
 logger = logging.getLogger(__name__)
 
+BT_RESULT_PATTERNS = ("backtest-result-*-[0-9][0-9]*.json", "backtest-result-*-[0-9][0-9]*.zip")
+
 # Newest format
 BT_DATA_COLUMNS = [
     "pair",
@@ -197,6 +203,7 @@ def load_backtest_stats(
         data = json_load(
             StringIO(load_file_from_zip(fn, fn.with_suffix(".json").name).decode("utf-8"))
         )
+        _restore_trades_from_parquet(fn, data)
     else:
         with fn.open() as file:
             data = json_load(file)
@@ -207,6 +214,27 @@ def load_backtest_stats(
     return data
 
 
+def _restore_trades_from_parquet(fn: Path, data: dict[str, Any]) -> None:
+    """
+    Add the trades of each strategy to the stats of a zipped backtest result.
+    Trades are only stored in the parquet members - older results keep them in the stats.
+    """
+    members = _get_zip_members(fn)
+    for strategy, strategy_stats in data.get("strategy", {}).items():
+        if "trades" in strategy_stats:
+            continue
+        member = f"{fn.stem}_{strategy}_trades.parquet"
+        if member not in members:
+            strategy_stats["trades"] = []
+            continue
+        df = _read_trades_parquet(fn, member)
+        # Same representation as trades loaded from json (dates as strings, missing as None)
+        for col in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            df[col] = df[col].astype(str)
+        df = df.astype(object).where(df.notna(), None)
+        strategy_stats["trades"] = df.to_dict(orient="records")
+
+
 def load_and_merge_backtest_result(strategy_name: str, filename: Path, results: dict[str, Any]):
     """
     Load one strategy from multi-strategy result and merge it with results
@@ -228,9 +256,14 @@ def load_and_merge_backtest_result(strategy_name: str, filename: Path, results:
 
 def _get_backtest_files(dirname: Path) -> list[Path]:
     # Get both json and zip files separately and combine the results
-    json_files = dirname.glob("backtest-result-*-[0-9][0-9]*.json")
-    zip_files = dirname.glob("backtest-result-*-[0-9][0-9]*.zip")
-    return list(reversed(sorted(list(json_files) + list(zip_files))))
+    files = [
+        file
+        for pattern in BT_RESULT_PATTERNS
+        for file in dirname.glob(pattern)
+        # Metadata files match the json pattern as well
+        if not file.name.endswith(".meta.json")
+    ]
+    return list(reversed(sorted(files)))
 
 
 def _extract_backtest_result(filename: Path) -> list[BacktestHistoryEntryType]:
@@ -260,15 +293,96 @@ def get_backtest_result(filename: Path) -> list[BacktestHistoryEntryType]:
     return _extract_backtest_result(filename)
 
 
-def get_backtest_resultlist(dirname: Path) -> list[BacktestHistoryEntryType]:
+def _get_metadata_mtime(filename: Path) -> float:
+    try:
+        return get_backtest_metadata_filename(filename).stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def _sync_backtest_catalog(catalog: BacktestCatalog, files: list[Path]) -> None:
     """
-    Get list of backtest results read from metadata files
+    Update the catalog with result files added, removed or changed since the last sync.
+    Only new or changed result files are read.
     """
-    return [
-        result
-        for filename in _get_backtest_files(dirname)
-        for result in _extract_backtest_result(filename)
-    ]
+    cataloged = catalog.get_files()
+    current = {file.name: file for file in files}
+    catalog.remove_files([name for name in cataloged if name not in current])
+    updates = {}
+    for name, file in current.items():
+        mtime = _get_metadata_mtime(file)
+        if cataloged.get(name) != mtime:
+            updates[name] = (mtime, _extract_backtest_result(file))
+    if updates:
+        catalog.update_files(updates)
+
+
+def update_backtest_catalog(filename: Path, deleted: bool = False) -> None:
+    """
+    Update the catalog entry of one result file.
+    Failures are only logged - the catalog is synced with the result files when it's used.
+    """
+    if filename.name.endswith(".meta.json") or not any(
+        filename.match(pattern) for pattern in BT_RESULT_PATTERNS
+    ):
+        return
+    try:
+        with BacktestCatalog(filename.parent / BT_CATALOG_FN) as catalog:
+            if deleted:
+                catalog.remove_files([filename.name])
+            else:
+                catalog.update_files(
+                    {
+                        filename.name: (
+                            _get_metadata_mtime(filename),
+                            _extract_backtest_result(filename),
+                        )
+                    }
+                )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not update backtest catalog: {e}")
+
+
+def get_backtest_resultlist(
+    dirname: Path,
+    *,
+    strategy: str | None = None,
+    timerange: TimeRange | None = None,
+    since: int | None = None,
+    until: int | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[BacktestHistoryEntryType]:
+    """
+    Get list of backtest results read from metadata files.
+    Uses the backtest catalog in dirname - so only new or changed result files are read.
+    :param strategy: Only return results of this strategy
+    :param timerange: Only return results of backtests within this timerange
+    :param since: Only return backtests run at or after this time (seconds)
+    :param until: Only return backtests run at or before this time (seconds)
+    :param limit: Maximum number of results to return
+    :param offset: Number of results to skip
+    """
+    files = _get_backtest_files(dirname)
+    query: dict[str, Any] = {
+        "strategy": strategy,
+        "start_ts": timerange.startts * 1000 if timerange and timerange.starttype else None,
+        "end_ts": timerange.stopts * 1000 if timerange and timerange.stoptype else None,
+        "since": since,
+        "until": until,
+        "limit": limit,
+        "offset": offset,
+    }
+    try:
+        with BacktestCatalog(dirname / BT_CATALOG_FN) as catalog:
+            _sync_backtest_catalog(catalog, files)
+            return catalog.query(**query)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not use backtest catalog in {dirname}: {e}")
+    # Read all result files (e.g. if the directory is read-only)
+    with BacktestCatalog(":memory:") as catalog:
+        _sync_backtest_catalog(catalog, files)
+        return catalog.query(**query)
 
 
 def delete_backtest_result(file_abs: Path):
@@ -281,6 +395,7 @@ def delete_backtest_result(file_abs: Path):
     for file in file_abs.parent.glob(f"{file_abs.stem}*"):
         logger.info(f"Deleting file: {file}")
         file.unlink()
+    update_backtest_catalog(file_abs, deleted=True)
 
 
 def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, Any]):
@@ -296,6 +411,7 @@ def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, A
     metadata[strategy].update(content)
     # Write data again.
     file_dump_json(get_backtest_metadata_filename(filename), metadata)
+    update_backtest_catalog(filename)
 
 
 def get_backtest_market_change(filename: Path, include_ts: bool = True) -> pd.DataFrame:
@@ -384,8 +500,55 @@ def _load_backtest_data_df_compatibility(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _read_trades_parquet(
+    fn: Path, member: str, columns: list[str] | None = None, pairs: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Read the trades parquet member of a zipped backtest result.
+    """
+    with zipfile.ZipFile(fn) as zipf:
+        with zipf.open(member) as file:
+            df = pd.read_parquet(
+                file, columns=columns, filters=[("pair", "in", pairs)] if pairs else None
+            )
+    if "orders" in df.columns:
+        df["orders"] = [rapidjson.loads(orders) for orders in df["orders"]]
+    return df
+
+
+def _load_backtest_data_parquet(
+    fn: Path, strategy: str | None, columns: list[str] | None, pairs: list[str] | None
+) -> pd.DataFrame | None:
+    """
+    Load trades from the parquet member of a zipped backtest result.
+    Strategies are determined from the metadata file - so the stats don't need to be parsed.
+    :return: Dataframe with the trades, or None if the result has no parquet trades.
+    """
+    if fn.suffix != ".zip":
+        return None
+    metadata = load_backtest_metadata(fn)
+    if not strategy and len(metadata) == 1:
+        strategy = next(iter(metadata.keys()))
+    if not strategy or strategy not in metadata:
+        # Let the regular loading raise the appropriate error
+        return None
+    member = f"{fn.stem}_{strategy}_trades.parquet"
+    if member not in _get_zip_members(fn):
+        return None
+    df = _read_trades_parquet(fn, member, columns, pairs)
+    if columns is None and not df.empty:
+        # Same compatibility handling as for json results
+        df = _load_backtest_data_df_compatibility(df)
+    return df
+
+
 def load_backtest_data(
-    file_or_directory: Path | str, strategy: str | None = None, filename: Path | str | None = None
+    file_or_directory: Path | str,
+    strategy: str | None = None,
+    filename: Path | str | None = None,
+    *,
+    columns: list[str] | None = None,
+    pairs: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Load backtest data file, returns a dataframe with the individual trades.
@@ -395,10 +558,34 @@ def load_backtest_data(
                      Can also serve as protection to load the correct result.
     :param filename: Optional filename to load from (if different from the main filename).
         Only valid when loading from a directory.
+    :param columns: Only load these columns (default: all columns)
+    :param pairs: Only load trades of these pairs (default: all pairs)
     :return: a dataframe with the analysis results
     :raise: ValueError if loading goes wrong.
     """
-    data = load_backtest_stats(file_or_directory, filename)
+    fn = _normalize_filename(file_or_directory, filename)
+    # open_date is required for sorting
+    read_columns = columns if columns is None or "open_date" in columns else [*columns, "open_date"]
+    df = _load_backtest_data_parquet(fn, strategy, read_columns, pairs)
+    if df is None:
+        df = _load_backtest_data_json(fn, strategy)
+        if not df.empty:
+            if pairs:
+                df = df.loc[df["pair"].isin(pairs)]
+            if read_columns:
+                df = df[read_columns]
+    if not df.empty:
+        df = df.sort_values("open_date").reset_index(drop=True)
+    if columns is not None and read_columns != columns:
+        df = df.drop(columns="open_date", errors="ignore")
+    return df
+
+
+def _load_backtest_data_json(fn: Path, strategy: str | None) -> pd.DataFrame:
+    """
+    Load trades from the backtest stats.
+    """
+    data = load_backtest_stats(fn)
     if not isinstance(data, list):
         # new, nested format
         if "strategy" not in data:
@@ -429,8 +616,6 @@ def load_backtest_data(
         raise OperationalException(
             "Backtest-results with only trades data are no longer supported."
         )
-    if not df.empty:
-        df = df.sort_values("open_date").reset_index(drop=True)
     return df
 
 
@@ -457,19 +642,69 @@ def load_file_from_zip(zip_path: Path, filename: str) -> bytes:
         raise ValueError(f"Bad zip file: {zip_path}.") from None
 
 
+def _get_zip_members(zip_path: Path) -> list[str]:
+    try:
+        with zipfile.ZipFile(zip_path) as zipf:
+            return zipf.namelist()
+    except (FileNotFoundError, zipfile.BadZipFile):
+        return []
+
+
+def _read_feather_member(
+    zipf: zipfile.ZipFile, member: str, columns: list[str] | None
+) -> pd.DataFrame:
+    with zipf.open(member) as file:
+        if columns is None:
+            return pd.read_feather(file)
+        from pyarrow import ipc
+
+        # Empty frames don't have any columns
+        available = ipc.open_file(file).schema.names
+        file.seek(0)
+        return pd.read_feather(file, columns=[col for col in columns if col in available])
+
+
+def _filter_analysis_data(
+    data: dict[str, dict[str, pd.DataFrame]],
+    strategy: str | None,
+    pairs: list[str] | None,
+    columns: list[str] | None,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Apply strategy / pair / column selection to fully loaded analysis data.
+    """
+    return {
+        strat: {
+            pair: df if columns is None else df[[col for col in columns if col in df.columns]]
+            for pair, df in pair_data.items()
+            if not pairs or pair in pairs
+        }
+        for strat, pair_data in data.items()
+        if not strategy or strat == strategy
+    }
+
+
 def load_backtest_analysis_data(
     file_or_directory: Path,
     name: Literal["signals", "rejected", "exited"],
     filename: Path | str | None = None,
+    *,
+    strategy: str | None = None,
+    pairs: list[str] | None = None,
+    columns: list[str] | None = None,
 ):
     """
-    Load backtest analysis data either from a pickle file or from within a zip file
+    Load backtest analysis data either from a zip file (feather or pickle)
+    or from a separate pickle file
     :param file_or_directory: pathlib.Path object, or string pointing to the directory,
         or absolute/relative path to the backtest results file.
     :param name: Name of the analysis data to load (signals, rejected, exited)
     :param filename: Optional filename to load from (if different from the main filename).
         Only valid when loading from a directory.
-    :return: Analysis data
+    :param strategy: Only load data of this strategy (default: all strategies)
+    :param pairs: Only load data of these pairs (default: all pairs)
+    :param columns: Only load these columns (default: all columns)
+    :return: Analysis data - {strategy: {pair: DataFrame}}
     """
     import joblib
 
@@ -477,6 +712,24 @@ def load_backtest_analysis_data(
 
     if zip_path.suffix == ".zip":
         # Load from zip file
+        index_name = f"{zip_path.stem}_{name}.json"
+        if index_name in _get_zip_members(zip_path):
+            with zipfile.ZipFile(zip_path) as zipf:
+                with zipf.open(index_name) as file:
+                    index = json_load(StringIO(file.read().decode("utf-8")))
+                loaded_data = {
+                    strat: {
+                        pair: _read_feather_member(zipf, member, columns)
+                        for pair, member in members.items()
+                        if not pairs or pair in pairs
+                    }
+                    for strat, members in index.items()
+                    if not strategy or strat == strategy
+                }
+            logger.info(f"Loaded {name} candles from zip: {str(zip_path)}:{index_name}")
+            return loaded_data
+
+        # Results stored before feather support
         analysis_name = f"{zip_path.stem}_{name}.pkl"
         data = load_file_from_zip(zip_path, analysis_name)
         if not data:
@@ -484,7 +737,7 @@ def load_backtest_analysis_data(
         loaded_data = joblib.load(BytesIO(data))
 
         logger.info(f"Loaded {name} candles from zip: {str(zip_path)}:{analysis_name}")
-        return loaded_data
+        return _filter_analysis_data(loaded_data, strategy, pairs, columns)
 
     else:
         # Load from separate pickle file
@@ -497,7 +750,7 @@ def load_backtest_analysis_data(
             with scpf.open("rb") as scp:
                 loaded_data = joblib.load(scp)
                 logger.info(f"Loaded {name} candles: {str(scpf)}")
-                return loaded_data
+                return _filter_analysis_data(loaded_data, strategy, pairs, columns)
         except Exception:
             logger.exception(f"Cannot load {name} data from pickled results.")
             return None
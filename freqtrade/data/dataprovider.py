@@ -7,6 +7,7 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -50,6 +51,7 @@ class DataProvider:
         self.__rpc = rpc
         self.__cached_pairs: dict[PairWithTimeframe, tuple[DataFrame, datetime]] = {}
         self.__slice_index: dict[str, int] = {}
+        self.__slice_index_resolver: Callable[[str], int] | None = None
         self.__slice_date: datetime | None = None
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
@@ -77,6 +79,15 @@ class DataProvider:
         """
         self.__slice_index[pair] = limit_index
 
+    def _set_dataframe_max_index_resolver(self, resolver: Callable[[str], int] | None):
+        """
+        Resolve the max index of pairs whose index isn't updated on every candle.
+        Only relevant in backtesting.
+        :param resolver: Callable returning the max index of a pair - 0 if the index
+            set via _set_dataframe_max_index() applies. None to disable.
+        """
+        self.__slice_index_resolver = resolver
+
     def _set_dataframe_max_date(self, limit_date: datetime):
         """
         Limit informative dataframe to max specified index.
@@ -410,6 +421,8 @@ class DataProvider:
                 df, date = self.__cached_pairs[pair_key]
             else:
                 df, date = self.__cached_pairs[pair_key]
+                if self.__slice_index_resolver and (index := self.__slice_index_resolver(pair)):
+                    self.__slice_index[pair] = index
                 if (max_index := self.__slice_index.get(pair)) is not None:
                     df = df.iloc[max(0, max_index - MAX_DATAFRAME_CANDLES) : max_index]
                 else:
@@ -2,6 +2,7 @@ import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
@@ -399,10 +400,13 @@ def calculate_calmar(
     min_date: datetime | None,
     max_date: datetime | None,
     starting_balance: float,
+    *,
+    max_drawdown: float | None = None,
 ) -> float:
     """
     Calculate calmar
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
+    :param max_drawdown: Relative account drawdown, if already calculated
     :return: calmar
     """
     if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
@@ -416,13 +420,14 @@ def calculate_calmar(
     expected_returns_mean = total_profit / days_period * 100
 
     # calculate max drawdown
-    try:
-        drawdown = calculate_max_drawdown(
-            trades, value_col="profit_abs", starting_balance=starting_balance
-        )
-        max_drawdown = drawdown.relative_account_drawdown
-    except ValueError:
-        max_drawdown = 0
+    if max_drawdown is None:
+        try:
+            drawdown = calculate_max_drawdown(
+                trades, value_col="profit_abs", starting_balance=starting_balance
+            )
+            max_drawdown = drawdown.relative_account_drawdown
+        except ValueError:
+            max_drawdown = 0
 
     if max_drawdown != 0:
         calmar_ratio = expected_returns_mean / max_drawdown * math.sqrt(365)
@@ -461,3 +466,100 @@ def calculate_sqn(trades: pd.DataFrame, starting_balance: float) -> float:
         sqn = -100.0
 
     return round(sqn, 4)
+
+
+class MetricsContext:
+    """
+    Metrics of one set of trades - each metric is calculated on first use, and only once.
+    Allows the hyperopt loss function and the result statistics of an epoch to share metrics.
+    """
+
+    def __init__(
+        self,
+        trades: pd.DataFrame,
+        min_date: datetime | None,
+        max_date: datetime | None,
+        starting_balance: float,
+    ) -> None:
+        """
+        :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
+        :param min_date: Backtest start date
+        :param max_date: Backtest end date
+        :param starting_balance: Starting balance of the trading system
+        """
+        self.trades = trades
+        self.min_date = min_date
+        self.max_date = max_date
+        self.starting_balance = starting_balance
+
+    @cached_property
+    def profit_total_abs(self) -> float:
+        return self.trades["profit_abs"].sum()
+
+    @cached_property
+    def winning_profit(self) -> float:
+        return self.trades.loc[self.trades["profit_abs"] > 0, "profit_abs"].sum()
+
+    @cached_property
+    def losing_profit(self) -> float:
+        return self.trades.loc[self.trades["profit_abs"] < 0, "profit_abs"].sum()
+
+    @cached_property
+    def expectancy(self) -> tuple[float, float]:
+        """
+        :return: expectancy, expectancy_ratio
+        """
+        return calculate_expectancy(self.trades)
+
+    @cached_property
+    def max_drawdown(self) -> DrawDownResult | None:
+        """
+        Max drawdown (by absolute drawdown) - None without trades.
+        """
+        try:
+            return calculate_max_drawdown(
+                self.trades, value_col="profit_abs", starting_balance=self.starting_balance
+            )
+        except ValueError:
+            return None
+
+    @cached_property
+    def max_relative_drawdown(self) -> DrawDownResult | None:
+        """
+        Max drawdown (by relative drawdown) - None without trades.
+        """
+        try:
+            return calculate_max_drawdown(
+                self.trades,
+                value_col="profit_abs",
+                starting_balance=self.starting_balance,
+                relative=True,
+            )
+        except ValueError:
+            return None
+
+    @property
+    def relative_account_drawdown(self) -> float:
+        return self.max_drawdown.relative_account_drawdown if self.max_drawdown else 0.0
+
+    @cached_property
+    def sharpe(self) -> float:
+        return calculate_sharpe(self.trades, self.min_date, self.max_date, self.starting_balance)
+
+    @cached_property
+    def sortino(self) -> float:
+        return calculate_sortino(self.trades, self.min_date, self.max_date, self.starting_balance)
+
+    @cached_property
+    def calmar(self) -> float:
+        return calculate_calmar(
+            self.trades,
+            self.min_date,
+            self.max_date,
+            self.starting_balance,
+            max_drawdown=self.relative_account_drawdown,
+        )
+
+    @cached_property
+    def sqn(self) -> float:
+        return calculate_sqn(self.trades, self.starting_balance)
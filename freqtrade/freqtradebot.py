@@ -267,9 +267,10 @@ class FreqtradeBot(LoggingMixin):
             self.strategy.gather_informative_pairs(),
         )
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-            current_time=datetime.now(UTC)
-        )
+        if self.strategy.ft_has_callback("bot_loop_start"):
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=datetime.now(UTC)
+            )
 
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
@@ -910,17 +911,19 @@ class FreqtradeBot(LoggingMixin):
         amount = (stake_amount / enter_limit_requested) * leverage
         order_type = ordertype or self.strategy.order_types["entry"]
 
-        if mode == "initial" and not strategy_safe_wrapper(
-            self.strategy.confirm_trade_entry, default_retval=True
-        )(
-            pair=pair,
-            order_type=order_type,
-            amount=amount,
-            rate=enter_limit_requested,
-            time_in_force=time_in_force,
-            current_time=datetime.now(UTC),
-            entry_tag=enter_tag,
-            side=trade_side,
+        if (
+            mode == "initial"
+            and self.strategy.ft_has_callback("confirm_trade_entry")
+            and not strategy_safe_wrapper(self.strategy.confirm_trade_entry, default_retval=True)(
+                pair=pair,
+                order_type=order_type,
+                amount=amount,
+                rate=enter_limit_requested,
+                time_in_force=time_in_force,
+                current_time=datetime.now(UTC),
+                entry_tag=enter_tag,
+                side=trade_side,
+            )
         ):
             logger.info(f"User denied entry for {pair}.")
             return False
@@ -1111,7 +1114,7 @@ class FreqtradeBot(LoggingMixin):
             enter_limit_requested = self.exchange.get_rate(
                 pair, side="entry", is_short=(trade_side == "short"), refresh=True
             )
-        if mode != "replace":
+        if mode != "replace" and self.strategy.ft_has_callback("custom_entry_price"):
             # Don't call custom_entry_price in order-adjust scenario
             custom_entry_price = strategy_safe_wrapper(
                 self.strategy.custom_entry_price, default_retval=enter_limit_requested
@@ -1133,6 +1136,8 @@ class FreqtradeBot(LoggingMixin):
             max_leverage = self.exchange.get_max_leverage(pair, stake_amount)
             if leverage_:
                 leverage = leverage_
+            elif not self.strategy.ft_has_callback("leverage"):
+                leverage = 1.0
             else:
                 leverage = strategy_safe_wrapper(self.strategy.leverage, default_retval=1.0)(
                     pair=pair,
@@ -1163,7 +1168,7 @@ class FreqtradeBot(LoggingMixin):
             pair, enter_limit_requested, leverage
         )
 
-        if trade is None:
+        if trade is None and self.strategy.ft_has_callback("custom_stake_amount"):
             stake_available = self.wallets.get_available_stake_amount()
             stake_amount = strategy_safe_wrapper(
                 self.strategy.custom_stake_amount, default_retval=stake_amount
@@ -2093,7 +2098,11 @@ class FreqtradeBot(LoggingMixin):
         custom_exit_price = limit
 
         current_profit = trade.calc_profit_ratio(limit)
-        if order_type == "limit" and not skip_custom_exit_price:
+        if (
+            order_type == "limit"
+            and not skip_custom_exit_price
+            and self.strategy.ft_has_callback("custom_exit_price")
+        ):
             custom_exit_price = strategy_safe_wrapper(
                 self.strategy.custom_exit_price, default_retval=proposed_limit_rate
             )(
@@ -2116,6 +2125,7 @@ class FreqtradeBot(LoggingMixin):
         if (
             exit_check.exit_type != ExitType.LIQUIDATION
             and not sub_trade_amt
+            and self.strategy.ft_has_callback("confirm_trade_exit")
             and not strategy_safe_wrapper(self.strategy.confirm_trade_exit, default_retval=True)(
                 pair=trade.pair,
                 trade=trade,
@@ -2358,9 +2368,10 @@ class FreqtradeBot(LoggingMixin):
 
     def _update_trade_after_fill(self, trade: Trade, order: Order, send_msg: bool) -> Trade:
         if order.status in constants.NON_OPEN_EXCHANGE_STATES:
-            strategy_safe_wrapper(self.strategy.order_filled, supress_error=True)(
-                pair=trade.pair, trade=trade, order=order, current_time=datetime.now(UTC)
-            )
+            if self.strategy.ft_has_callback("order_filled"):
+                strategy_safe_wrapper(self.strategy.order_filled, supress_error=True)(
+                    pair=trade.pair, trade=trade, order=order, current_time=datetime.now(UTC)
+                )
             # If a entry order was closed, force update on stoploss on exchange
             if order.ft_order_side == trade.entry_side:
                 if send_msg:
@@ -5,6 +5,7 @@ from pandas import DataFrame
 from typing_extensions import TypedDict
 
 from freqtrade.constants import Config
+from freqtrade.util.callback_profiler import ProfileStats
 
 
 class BacktestMetadataType(TypedDict):
@@ -55,6 +56,7 @@ class BacktestContentTypeIcomplete(TypedDict, total=False):
     backtest_start_time: int
     backtest_end_time: int
     run_id: str
+    callback_profile: list[ProfileStats]
 
 
 class BacktestContentType(BacktestContentTypeIcomplete, total=True):
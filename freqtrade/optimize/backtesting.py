@@ -6,15 +6,26 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
-from copy import deepcopy
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from copy import copy, deepcopy
 from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from numpy import isnan, nan
-from pandas import DataFrame, Series
+from joblib import Parallel, delayed, effective_n_jobs
+from numpy import diff, isnan, nan, ndarray
+from pandas import DataFrame, Series, concat
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
-from freqtrade.constants import DATETIME_PRINT_FORMAT, Config, IntOrInf, LongShort
+from freqtrade.constants import (
+    BACKTEST_STREAM_BATCH_SIZE_DEFAULT,
+    DATETIME_PRINT_FORMAT,
+    Config,
+    IntOrInf,
+    LongShort,
+)
 from freqtrade.data import history
 from freqtrade.data.btanalysis import (
     find_existing_backtest_stats,
@@ -49,7 +60,19 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.bt_columnar import ColumnarPairData, DetailPairData
+from freqtrade.optimize.bt_entry_schedule import EntrySchedule
+from freqtrade.optimize.bt_exit_scan import ExitScan
+from freqtrade.optimize.bt_funding_fees import FundingFeeSeries
+from freqtrade.optimize.bt_parallel import (
+    backtest_pairs_worker,
+    backtest_strategy_worker,
+    dump_shared_data,
+    register_pickle_by_value,
+)
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.bt_trade_sink import TradeSink
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -57,7 +80,10 @@ from freqtrade.optimize.optimize_reports import (
     show_backtest_results,
     store_backtest_results,
 )
+from freqtrade.optimize.pairlist_timeline import PairlistTimeline, PairlistTimelineCache
 from freqtrade.persistence import (
+    BacktestOrder,
+    BacktestTrade,
     CustomDataWrapper,
     LocalTrade,
     Order,
@@ -70,8 +96,9 @@ from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
 from freqtrade.strategy.interface import IStrategy
-from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise, dt_now
+from freqtrade.strategy.strategy_wrapper import set_callback_profiler, strategy_safe_wrapper
+from freqtrade.util import CallbackProfiler, FtPrecise, dt_now, dt_ts
+from freqtrade.util.callback_profiler import ProfileStats
 from freqtrade.util.migrations import migrate_data
 from freqtrade.wallets import Wallets
 
@@ -107,6 +134,17 @@ HEADERS = [
     "exit_tag",
 ]
 
+# Backtesting methods recorded as phases with --profile-callbacks (method: phase name)
+PROFILED_PHASES = {
+    "_get_ohlcv_as_lists": "populate_signals",
+    "backtest_loop": "backtest_loop",
+    "manage_open_orders": "manage_open_orders",
+    "_enter_trade": "enter_trade",
+    "_try_close_open_order": "order_fill",
+    "_check_trade_exit": "check_trade_exit",
+    "_process_exit_order": "process_exit_order",
+}
+
 
 class Backtesting:
     """
@@ -136,6 +174,11 @@ class Backtesting:
             "exited": {},
         }
         self.rejected_dict: dict[str, list] = {}
+        # Per pair - True for candles where a new trade can be entered (see _get_entry_candles)
+        self.entry_candles: dict[str, ndarray] = {}
+        # Per pair - candle dates as ms timestamps, to schedule the entry candles
+        self.candle_dates: dict[str, ndarray] = {}
+        self._entry_schedule: EntrySchedule | None = None
 
         self._exchange_name = self.config["exchange"]["name"]
         self.__initial_backtest = exchange is None
@@ -213,6 +256,24 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        self.backtest_jobs: int = self.config.get("backtest_jobs", 1)
+        self.indicator_cache: IndicatorCache | None = None
+        if self.config.get("backtest_indicator_cache", False) and not self.config.get(
+            "freqai", {}
+        ).get("enabled", False):
+            self.indicator_cache = IndicatorCache(self.config)
+        # Pairs allowed to open trades - set when backtesting a subset of pairs in a worker.
+        self.pair_shard: set[str] | None = None
+        # Whitelist per candle, used if dynamic pairlists are enabled.
+        self.pairlist_timeline: PairlistTimeline | None = None
+        self.profile_callbacks: bool = self.config.get("backtest_profile_callbacks", False)
+        self.callback_profiler: CallbackProfiler | None = None
+        self.stream_trades: bool = self.config.get("backtest_stream_trades", False)
+        # Skips exit checks of candles which can't trigger an exit - set per backtest run.
+        self.exit_scan: ExitScan | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -228,6 +289,16 @@ class Backtesting:
                 "PrecisionFilter not allowed for backtesting multiple strategies."
             )
 
+        if (
+            self.config.get("backtest_stream_trades", False)
+            and self.config.get("enable_dynamic_pairlist", False)
+            and "PerformanceFilter" in self.pairlists.name_list
+        ):
+            raise OperationalException(
+                "PerformanceFilter requires all closed trades - "
+                "it can't be used with dynamic pairlists and --stream-trades."
+            )
+
     def log_once(self, msg: str) -> None:
         """
         Partial reimplementation of log_once from the Login mixin.
@@ -271,7 +342,12 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        # Columnar detail data and offsets of the detail rows per main candle
+        self._detail_pair_data: dict[str, DetailPairData] = {}
+        self.detail_offsets: dict[str, tuple[ndarray, ndarray]] = {}
         self.futures_data: dict[str, DataFrame] = {}
+        # Cumulative funding fees per pair - built from futures_data on first use.
+        self._funding_fee_series: dict[str, FundingFeeSeries] = {}
 
     def init_backtest(self):
         self.reset_backtest(False)
@@ -462,17 +538,25 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(
+        self,
+        processed: dict[str, DataFrame],
+        signals: dict[str, dict[str, ndarray]] | None = None,
+    ) -> dict[str, tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
+        With the "columnar" backtest engine, the data is kept as one array per column instead.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :param signals: Signals evaluated from the strategy's conditions, by pair
         """
 
         data: dict = {}
+        self.entry_candles = {}
+        self.detail_offsets = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -484,7 +568,9 @@ class Backtesting:
             if not pair_data.empty:
                 # Cleanup from prior runs
                 pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
+            df_analyzed = self.strategy.ft_advise_signals(
+                pair_data, {"pair": pair}, signals.get(pair) if signals is not None else None
+            )
             # Update dataprovider cache
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
@@ -513,12 +599,49 @@ class Backtesting:
                     df_analyzed[col] = 0 if not tag_col else None
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            if not df_analyzed.empty:
+                self.entry_candles[pair] = self._get_entry_candles(df_analyzed)
+                self.candle_dates[pair] = (
+                    df_analyzed["date"].to_numpy(dtype="datetime64[ms]").astype("int64")
+                )
+                if self.exit_scan is not None:
+                    self.exit_scan.add_pair(pair, df_analyzed)
+                if self.pair_shard is not None and pair not in self.pair_shard:
+                    # Pair is backtested by another worker. Keep the candles so callbacks
+                    # can access them through the dataprovider - but never enter a trade.
+                    self.entry_candles[pair][:] = False
+                elif pair in self.detail_data:
+                    self.detail_offsets[pair] = self._get_detail_pair_data(pair).get_offsets(
+                        df_analyzed["date"], self.timeframe_td
+                    )
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if self.backtest_engine == "columnar":
+                # Keep contiguous arrays per column - rows are read through views.
+                data[pair] = ColumnarPairData(df_analyzed, HEADERS) if not df_analyzed.empty else []
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_entry_candles(self, df_analyzed: DataFrame) -> ndarray:
+        """
+        Vectorized version of check_for_trade_entry() for the whole (shifted) dataframe.
+        Candles outside of this index can't open a new trade - so pairs without open trades
+        don't need to be processed for these candles.
+        :param df_analyzed: Dataframe with shifted entry / exit signals
+        :return: boolean array with one entry per row
+        """
+        enter_long = df_analyzed["enter_long"].to_numpy() == 1
+        exit_long = df_analyzed["exit_long"].to_numpy() == 1
+        if self._can_short:
+            enter_short = df_analyzed["enter_short"].to_numpy() == 1
+            exit_short = df_analyzed["exit_short"].to_numpy() == 1
+            return (enter_long & ~(exit_long | enter_short)) | (
+                enter_short & ~(exit_short | enter_long)
+            )
+        return enter_long & ~exit_long
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -762,12 +885,13 @@ class Backtesting:
         if order and self._get_order_filled(order.ft_price, row):
             order.close_bt_order(current_date, trade)
             self._run_funding_fees(trade, current_date, force=True)
-            strategy_safe_wrapper(self.strategy.order_filled, supress_error=True)(
-                pair=trade.pair,
-                trade=trade,  # type: ignore[arg-type]
-                order=order,
-                current_time=current_date,
-            )
+            if self.strategy.ft_has_callback("order_filled"):
+                strategy_safe_wrapper(self.strategy.order_filled, supress_error=True)(
+                    pair=trade.pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    order=order,
+                    current_time=current_date,
+                )
 
             if self.margin_mode == MarginMode.CROSS or not (
                 order.ft_order_side == trade.exit_side and order.safe_amount == trade.amount
@@ -840,16 +964,18 @@ class Backtesting:
                     exit_reason = row[EXIT_TAG_IDX]
                 # Custom exit pricing only for exit-signals
                 if order_type == "limit":
-                    rate = strategy_safe_wrapper(
-                        self.strategy.custom_exit_price, default_retval=close_rate
-                    )(
-                        pair=trade.pair,
-                        trade=trade,  # type: ignore[arg-type]
-                        current_time=current_time,
-                        proposed_rate=close_rate,
-                        current_profit=current_profit,
-                        exit_tag=exit_reason,
-                    )
+                    rate = close_rate
+                    if self.strategy.ft_has_callback("custom_exit_price"):
+                        rate = strategy_safe_wrapper(
+                            self.strategy.custom_exit_price, default_retval=close_rate
+                        )(
+                            pair=trade.pair,
+                            trade=trade,  # type: ignore[arg-type]
+                            current_time=current_time,
+                            proposed_rate=close_rate,
+                            current_profit=current_profit,
+                            exit_tag=exit_reason,
+                        )
                     if rate is not None and rate != close_rate:
                         close_rate = price_to_precision(
                             rate, trade.price_precision, trade.precision_mode_price
@@ -863,19 +989,22 @@ class Backtesting:
             # Confirm trade exit:
             time_in_force = self.strategy.order_time_in_force["exit"]
 
-            if exit_.exit_type not in (
-                ExitType.LIQUIDATION,
-                ExitType.PARTIAL_EXIT,
-            ) and not strategy_safe_wrapper(self.strategy.confirm_trade_exit, default_retval=True)(
-                pair=trade.pair,
-                trade=trade,  # type: ignore[arg-type]
-                order_type=order_type,
-                amount=amount_,
-                rate=close_rate,
-                time_in_force=time_in_force,
-                sell_reason=exit_reason,  # deprecated
-                exit_reason=exit_reason,
-                current_time=current_time,
+            if (
+                exit_.exit_type not in (ExitType.LIQUIDATION, ExitType.PARTIAL_EXIT)
+                and self.strategy.ft_has_callback("confirm_trade_exit")
+                and not strategy_safe_wrapper(
+                    self.strategy.confirm_trade_exit, default_retval=True
+                )(
+                    pair=trade.pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    order_type=order_type,
+                    amount=amount_,
+                    rate=close_rate,
+                    time_in_force=time_in_force,
+                    sell_reason=exit_reason,  # deprecated
+                    exit_reason=exit_reason,
+                    current_time=current_time,
+                )
             ):
                 return None
 
@@ -903,7 +1032,7 @@ class Backtesting:
         if self.handle_similar_order(trade, close_rate, amount, trade.exit_side, exit_candle_time):
             return None
 
-        order = Order(
+        order = BacktestOrder(
             id=self.order_id_counter,
             ft_trade_id=trade.id,
             order_date=exit_candle_time,
@@ -926,7 +1055,7 @@ class Backtesting:
             ft_order_tag=exit_reason,
         )
         order._trade_bt = trade
-        trade.orders.append(order)
+        trade.add_order(order)
         return trade
 
     def _check_trade_exit(
@@ -956,6 +1085,39 @@ class Backtesting:
                     return t
         return None
 
+    def _check_trade_exit_scanned(
+        self, trade: LocalTrade, row: tuple, current_time: datetime
+    ) -> None:
+        """
+        _check_trade_exit(), skipping candles which can't trigger an exit (see ExitScan).
+        """
+        exit_scan = self.exit_scan
+        if exit_scan is not None and exit_scan.is_skipped(trade, row[DATE_IDX]):
+            if (
+                self.trading_mode != TradingMode.FUTURES
+                or current_time.timestamp() % self.funding_fee_timeframe_secs != 0
+            ):
+                return
+            # Funding fees change the trade's profit - so ROI must be checked again.
+            exit_scan.end_skip(trade)
+
+        self._check_trade_exit(trade, row, current_time)
+        if exit_scan is not None and trade.is_open and not trade.has_open_orders:
+            exit_scan.skip_candles(trade, trade.pair, row[DATE_IDX])
+
+    def _init_exit_scan(self) -> ExitScan | None:
+        """
+        Exit scan for the current strategy settings - None if exits must be checked on
+        every candle.
+        """
+        if (
+            self.timeframe_detail
+            or self.margin_mode == MarginMode.CROSS
+            or not ExitScan.is_supported(self.strategy)
+        ):
+            return None
+        return ExitScan(self.strategy)
+
     def _run_funding_fees(self, trade: LocalTrade, current_time: datetime, force: bool = False):
         """
         Calculate funding fees if necessary and add them to the trade.
@@ -963,15 +1125,37 @@ class Backtesting:
         if self.trading_mode == TradingMode.FUTURES:
             if force or (current_time.timestamp() % self.funding_fee_timeframe_secs) == 0:
                 # Funding fee interval.
-                trade.set_funding_fees(
-                    self.exchange.calculate_funding_fees(
-                        self.futures_data[trade.pair],
-                        amount=trade.amount,
-                        is_short=trade.is_short,
-                        open_date=trade.date_last_filled_utc,
-                        close_date=current_time,
-                    )
-                )
+                trade.set_funding_fees(self._calculate_funding_fees(trade, current_time))
+
+    def _calculate_funding_fees(self, trade: LocalTrade, current_time: datetime) -> float:
+        """
+        Funding fees of trade since its last fill.
+        Uses the cumulative funding fees of the pair - unless the exchange class implements
+        its own funding fee calculation.
+        """
+        if type(self.exchange).calculate_funding_fees is not Exchange.calculate_funding_fees:
+            return self.exchange.calculate_funding_fees(
+                self.futures_data[trade.pair],
+                amount=trade.amount,
+                is_short=trade.is_short,
+                open_date=trade.date_last_filled_utc,
+                close_date=current_time,
+            )
+        return self._get_funding_fee_series(trade.pair).calculate(
+            amount=trade.amount,
+            is_short=trade.is_short,
+            open_date=trade.date_last_filled_utc,
+            close_date=current_time,
+        )
+
+    def _get_funding_fee_series(self, pair: str) -> FundingFeeSeries:
+        """
+        Get the cumulative funding fees for this pair - calculated once from the futures data.
+        """
+        series = self._funding_fee_series.get(pair)
+        if series is None or series.source is not self.futures_data[pair]:
+            series = self._funding_fee_series[pair] = FundingFeeSeries(self.futures_data[pair])
+        return series
 
     def get_valid_entry_price_and_stake(
         self,
@@ -988,16 +1172,18 @@ class Backtesting:
         precision_mode_price: int,
     ) -> tuple[float, float, float, float]:
         if order_type == "limit":
-            new_rate = strategy_safe_wrapper(
-                self.strategy.custom_entry_price, default_retval=propose_rate
-            )(
-                pair=pair,
-                trade=trade,  # type: ignore[arg-type]
-                current_time=current_time,
-                proposed_rate=propose_rate,
-                entry_tag=entry_tag,
-                side=direction,
-            )  # default value is the open rate
+            new_rate = propose_rate  # default value is the open rate
+            if self.strategy.ft_has_callback("custom_entry_price"):
+                new_rate = strategy_safe_wrapper(
+                    self.strategy.custom_entry_price, default_retval=propose_rate
+                )(
+                    pair=pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    current_time=current_time,
+                    proposed_rate=propose_rate,
+                    entry_tag=entry_tag,
+                    side=direction,
+                )
             # We can't place orders higher than current high (otherwise it'd be a stop limit entry)
             # which freqtrade does not support in live.
             if new_rate is not None and new_rate != propose_rate:
@@ -1029,6 +1215,7 @@ class Backtesting:
                     entry_tag=entry_tag,
                 )
                 if self.trading_mode != TradingMode.SPOT
+                and self.strategy.ft_has_callback("leverage")
                 else 1.0
             )
             # Cap leverage between 1.0 and max_leverage.
@@ -1045,7 +1232,7 @@ class Backtesting:
         )
         stake_available = self.wallets.get_available_stake_amount()
 
-        if not pos_adjust:
+        if not pos_adjust and self.strategy.ft_has_callback("custom_stake_amount"):
             stake_amount = strategy_safe_wrapper(
                 self.strategy.custom_stake_amount, default_retval=stake_amount
             )(
@@ -1138,7 +1325,7 @@ class Backtesting:
             # Backcalculate actual stake amount.
             stake_amount = amount * propose_rate / leverage
 
-            if not pos_adjust:
+            if not pos_adjust and self.strategy.ft_has_callback("confirm_trade_entry"):
                 # Confirm trade entry:
                 if not strategy_safe_wrapper(
                     self.strategy.confirm_trade_entry, default_retval=True
@@ -1161,7 +1348,7 @@ class Backtesting:
             if trade is None:
                 # Enter trade
                 self.trade_id_counter += 1
-                trade = LocalTrade(
+                trade = BacktestTrade(
                     id=self.trade_id_counter,
                     pair=pair,
                     base_currency=base_currency,
@@ -1197,7 +1384,7 @@ class Backtesting:
 
             trade.adjust_stop_loss(trade.open_rate, self.strategy.stoploss, initial=True)
 
-            order = Order(
+            order = BacktestOrder(
                 id=self.order_id_counter,
                 ft_trade_id=trade.id,
                 ft_is_open=True,
@@ -1221,7 +1408,7 @@ class Backtesting:
                 ft_order_tag=entry_tag,
             )
             order._trade_bt = trade
-            trade.orders.append(order)
+            trade.add_order(order)
             self._try_close_open_order(order, trade, current_time, row)
             trade.recalc_trade_from_orders()
 
@@ -1233,6 +1420,8 @@ class Backtesting:
         """
         Handling of left open trades at the end of backtesting
         """
+        if self.exit_scan is not None:
+            self.exit_scan.end_all()
         for pair in open_trades.keys():
             for trade in list(open_trades[pair]):
                 if (
@@ -1284,7 +1473,7 @@ class Backtesting:
         Check if any open order needs to be cancelled or replaced.
         Returns True if the trade should be deleted.
         """
-        for order in [o for o in trade.orders if o.ft_is_open]:
+        for order in trade.open_orders:
             oc = self.check_order_cancel(trade, order, current_time)
             if oc:
                 # delete trade due to order timeout
@@ -1300,13 +1489,13 @@ class Backtesting:
         """
         Cancel all open orders for the given trade.
         """
-        for order in [o for o in trade.orders if o.ft_is_open]:
+        for order in trade.open_orders:
             if order.side == trade.entry_side:
                 self.canceled_entry_orders += 1
             elif order.side == trade.exit_side:
                 self.canceled_exit_orders += 1
             # canceled orders are removed from the trade
-            del trade.orders[trade.orders.index(order)]
+            trade.remove_order(order)
 
     def handle_similar_order(
         self, trade: LocalTrade, price: float, amount: float, side: str, current_time: datetime
@@ -1349,12 +1538,12 @@ class Backtesting:
                     return True
                 else:
                     # Close additional entry order
-                    del trade.orders[trade.orders.index(order)]
+                    trade.remove_order(order)
                     return False
             if order.side == trade.exit_side:
                 self.timedout_exit_orders += 1
                 # Close exit order and retry exiting on next signal.
-                del trade.orders[trade.orders.index(order)]
+                trade.remove_order(order)
                 return False
         return None
 
@@ -1368,7 +1557,10 @@ class Backtesting:
         Returns True if the trade should be deleted.
         """
         # only check on new candles for open entry orders
-        if current_time > order.order_date_utc:
+        # Without adjust_order_price, the order price remains unchanged.
+        if current_time > order.order_date_utc and self.strategy.ft_has_callback(
+            "adjust_order_price"
+        ):
             is_entry = order.side == trade.entry_side
             requested_rate = strategy_safe_wrapper(
                 self.strategy.adjust_order_price, default_retval=order.ft_price
@@ -1389,7 +1581,7 @@ class Backtesting:
                 # assumption: there can't be multiple open entry orders at any given time
                 return False
             else:
-                del trade.orders[trade.orders.index(order)]
+                trade.remove_order(order)
                 if is_entry:
                     self.canceled_entry_orders += 1
                 else:
@@ -1441,6 +1633,17 @@ class Backtesting:
             return None
         return row
 
+    def _check_for_trade_entry_indexed(
+        self, pair: str, row: tuple, row_index: int
+    ) -> LongShort | None:
+        """
+        check_for_trade_entry(), skipping the row evaluation for candles without entry signal.
+        """
+        pair_entries = self.entry_candles.get(pair)
+        if pair_entries is not None and not pair_entries[row_index]:
+            return None
+        return self.check_for_trade_entry(row)
+
     def _collate_rejected(self, pair, row):
         """
         Temporarily store rejected signal information for downstream use in backtesting_analysis
@@ -1506,7 +1709,8 @@ class Backtesting:
 
             # 4. Create exit orders (if any)
             if trade.has_open_position:
-                self._check_trade_exit(trade, row, current_time)  # Place exit order if necessary
+                # Place exit order if necessary
+                self._check_trade_exit_scanned(trade, row, current_time)
 
             # 5. Process exit orders.
             order = trade.select_order(trade.exit_side, is_open=True)
@@ -1517,26 +1721,26 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def _get_detail_pair_data(self, pair: str) -> DetailPairData:
         """
-        Spread into detail data
+        Get columnar detail data for this pair - converted once from the detail dataframe.
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        pair_data = self._detail_pair_data.get(pair)
+        if pair_data is None or pair_data.source is not self.detail_data[pair]:
+            pair_data = self._detail_pair_data[pair] = DetailPairData(self.detail_data[pair])
+        return pair_data
 
-        if len(detail_data) == 0:
+    def get_detail_data(self, pair: str, row: tuple, row_index: int) -> list[tuple] | None:
+        """
+        Spread into detail data
+        :param row_index: Index of the main candle - used to look up the detail offsets.
+        """
+        starts, ends = self.detail_offsets[pair]
+        start, end = int(starts[row_index]), int(ends[row_index])
+        if start == end:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        # Detail candles inherit signals and tags of the main candle
+        return self._detail_pair_data[pair].get_rows(start, end, row[LONG_IDX:])
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1560,14 +1764,133 @@ class Backtesting:
             i += 1
             current_time += self.timeframe_detail_td
 
-    def _time_pair_generator_det(self, current_time: datetime, pairs: list[str]):
+    def _time_pair_generator_det(
+        self, current_time: datetime, pairs: list[str], schedule: EntrySchedule | None = None
+    ):
         for current_time_det, is_first, has_detail, idx in self._time_generator_det(
             current_time, current_time + self.timeframe_td
         ):
+            open_pairs = [t.pair for t in LocalTrade.bt_trades_open]
+            if schedule is not None and is_first:
+                # Only pairs with an entry signal - besides pairs with open trades.
+                pairs = schedule.start_candle(current_time, open_pairs)
+                # Set for every pair with a candle in the sequential loop.
+                self.dataprovider._set_dataframe_max_date(current_time_det)
             # Pairs that have open trades should be processed first
-            new_pairlist = list(dict.fromkeys([t.pair for t in LocalTrade.bt_trades_open] + pairs))
+            new_pairlist = list(dict.fromkeys(open_pairs + pairs))
             for pair in new_pairlist:
                 yield current_time_det, is_first, has_detail, idx, pair
+            if schedule is not None:
+                schedule.end_pairs()
+
+    def prepare_pairlist_timeline(
+        self, start_date: datetime, end_date: datetime
+    ) -> PairlistTimeline | None:
+        """
+        Precompute the whitelist of each candle for dynamic pairlists.
+        The timeline is kept for further backtests of the same timerange (e.g. hyperopt epochs),
+        and stored on disk if the indicator cache is enabled.
+        :return: PairlistTimeline - or None if the pairlist has to be refreshed in the loop.
+        """
+        if not self.dynamic_pairlist:
+            return None
+        # Hyperopt drops the pairlists after precomputing the timeline.
+        if self.pairlist_timeline and self.pairlist_timeline.matches(start_date, end_date):
+            return self.pairlist_timeline
+        if not self.pairlists or not PairlistTimeline.is_supported(self.pairlists):
+            return None
+
+        if self.indicator_cache and PairlistTimelineCache.is_cacheable(self.pairlists):
+            self.pairlist_timeline = PairlistTimelineCache(self.config).get_timeline(
+                self.pairlists, self.available_pairs, start_date, end_date, self.timeframe_td
+            )
+        else:
+            self.pairlist_timeline = PairlistTimeline.generate(
+                self.pairlists, self.available_pairs, start_date, end_date, self.timeframe_td
+            )
+        return self.pairlist_timeline
+
+    def _get_whitelist(
+        self,
+        current_time: datetime,
+        pairs: list[str],
+        pairlist_timeline: PairlistTimeline | None,
+    ) -> list[str]:
+        """
+        Get the pairs to backtest for this candle - refreshed if dynamic pairlists are enabled.
+        """
+        if not self.dynamic_pairlist:
+            return pairs
+        if pairlist_timeline:
+            return pairlist_timeline.get_whitelist(current_time)
+        if not self.pairlists:
+            return pairs
+        self.pairlists.refresh_pairlist(pairs=self.available_pairs)
+        return self.pairlists.whitelist
+
+    def _get_entry_schedule(
+        self, start_date: datetime, pairs: list[str], data: dict
+    ) -> EntrySchedule | None:
+        """
+        Schedule of the entry candles of all pairs - so pairs without open trades are only
+        processed on candles with an entry signal.
+        Not used with dynamic pairlists, as the row index of a pair only advances
+        while the pair is part of the whitelist - nor for candles which aren't unique
+        and aligned to the loop, as row indexes are caught up by date.
+        :return: EntrySchedule - or None if all pairs have to be processed on every candle.
+        """
+        if self.dynamic_pairlist and (self.pairlists or self.pairlist_timeline):
+            return None
+        start_ms = dt_ts(start_date)
+        timeframe_ms = self.timeframe_secs * 1000
+        dates = {}
+        for pair in pairs:
+            if len(data[pair]) == 0:
+                continue
+            pair_dates = self.candle_dates.get(pair)
+            if (
+                pair_dates is None
+                or pair not in self.entry_candles
+                or len(pair_dates) != len(data[pair])
+                or pair_dates[0] < start_ms
+                or ((pair_dates - start_ms) % timeframe_ms).any()
+                or (len(pair_dates) > 1 and (diff(pair_dates) <= 0).any())
+            ):
+                return None
+            dates[pair] = pair_dates
+        return EntrySchedule(pairs, dates, self.entry_candles, self.timeframe_td)
+
+    def _get_dataframe_max_index(self, pair: str) -> int:
+        """
+        Dataframe max index of pairs which weren't processed on every candle.
+        """
+        if self._entry_schedule is None:
+            return 0
+        rows = self._entry_schedule.get_processed_rows(pair)
+        return self.required_startup + rows if rows else 0
+
+    def _get_main_row(
+        self,
+        data: dict,
+        pair: str,
+        indexes: dict[str, int],
+        current_time: datetime,
+        schedule: EntrySchedule | None,
+    ) -> tuple | None:
+        """
+        Row of the main candle at current_time - advancing the row index of the pair.
+        """
+        if schedule is not None:
+            # Catch up on the candles the pair was skipped for
+            indexes[pair] = schedule.process(pair)
+        row_index = indexes[pair]
+        row = self.validate_row(data, pair, row_index, current_time)
+        if row:
+            indexes[pair] = row_index + 1
+            self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index + 1)
+            if schedule is not None:
+                schedule.processed(pair, row_index)
+        return row
 
     def time_pair_generator(
         self,
@@ -1578,13 +1901,46 @@ class Backtesting:
     ):
         """
         Backtest time and pair generator
+        Pairs without open trades are only processed on candles with an entry signal -
+        unless dynamic pairlists are used.
         :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
             where is_last_row is a boolean indicating if this is the data end date.
         """
-        current_time = start_date + self.timeframe_td
         self.progress.init_step(
             BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
         )
+        pairlist_timeline = self.prepare_pairlist_timeline(start_date, end_date)
+        schedule = self._entry_schedule = self._get_entry_schedule(start_date, pairs, data)
+        if schedule is None:
+            yield from self._time_pair_generator(
+                start_date, end_date, pairs, data, pairlist_timeline
+            )
+            return
+
+        # Row indexes of skipped pairs are only caught up once they're processed again -
+        # the dataprovider resolves them on access.
+        self.dataprovider._set_dataframe_max_index_resolver(self._get_dataframe_max_index)
+        try:
+            yield from self._time_pair_generator(
+                start_date, end_date, pairs, data, pairlist_timeline, schedule
+            )
+            # For callbacks after the loop
+            for pair in pairs:
+                if index := self._get_dataframe_max_index(pair):
+                    self.dataprovider._set_dataframe_max_index(pair, index)
+        finally:
+            self.dataprovider._set_dataframe_max_index_resolver(None)
+            self._entry_schedule = None
+
+    def _time_pair_generator(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        pairs: list[str],
+        data: dict[str, list[tuple]],
+        pairlist_timeline: PairlistTimeline | None,
+        schedule: EntrySchedule | None = None,
+    ):
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
 
@@ -1592,22 +1948,21 @@ class Backtesting:
             # Loop for each main candle.
             self.check_abort()
 
-            if self.dynamic_pairlist and self.pairlists:
-                self.pairlists.refresh_pairlist(pairs=self.available_pairs)
-                pairs = self.pairlists.whitelist
+            pairs = self._get_whitelist(current_time, pairs, pairlist_timeline)
 
             # Reset open trade count for this candle
             # Critical to avoid exceeding max_open_trades in backtesting
             # when timeframe-detail is used and trades close within the opening candle.
-            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-                current_time=current_time
-            )
+            if self.strategy.ft_has_callback("bot_loop_start"):
+                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                    current_time=current_time
+                )
             pair_detail_cache: dict[str, list[tuple]] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
 
             for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
-                current_time, pairs
+                current_time, pairs, schedule
             ):
                 # Loop for each detail candle (if necessary) and pair
                 # Yields only the main date if no detail timeframe is set.
@@ -1616,18 +1971,11 @@ class Backtesting:
                 trade_dir: LongShort | None = None
                 if is_first:
                     # Main candle
-                    row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
+                    row = self._get_main_row(data, pair, indexes, current_time, schedule)
                     if not row:
                         continue
 
-                    row_index += 1
-                    indexes[pair] = row_index
-                    is_last_row = current_time == end_date
-                    self.dataprovider._set_dataframe_max_index(
-                        pair, self.required_startup + row_index
-                    )
-                    trade_dir = self.check_for_trade_entry(row)
+                    trade_dir = self._check_for_trade_entry_indexed(pair, row, indexes[pair] - 1)
                     pair_tradedir_cache[pair] = trade_dir
 
                 else:
@@ -1651,8 +1999,11 @@ class Backtesting:
                 self.dataprovider._set_dataframe_max_date(current_time_det)
 
                 pair_has_open_trades = len(LocalTrade.bt_trades_open_pp[pair]) > 0
-                if pair in pairs_with_open_trades and not pair_has_open_trades:
-                    # Pair has had open trades which closed in the current main candle.
+                if not pair_has_open_trades and (
+                    trade_dir is None or pair in pairs_with_open_trades
+                ):
+                    # Nothing to do for this pair on this candle (no trade, no entry signal),
+                    # or the pair has had open trades which closed in the current main candle.
                     # Skip this pair for this timeframe
                     continue
                 if pair_has_open_trades and pair not in pairs_with_open_trades:
@@ -1666,13 +2017,13 @@ class Backtesting:
                     and (trade_dir is not None or pair_has_open_trades)
                     and has_detail
                     and pair not in pair_detail_cache
-                    and pair in self.detail_data
+                    and pair in self.detail_offsets
                     and row
                 ):
                     # Spread candle into detail timeframe and cache that -
                     # only once per main candle
                     # and only if we can expect activity.
-                    pair_detail = self.get_detail_data(pair, row)
+                    pair_detail = self.get_detail_data(pair, row, indexes[pair] - 1)
                     if pair_detail is not None:
                         pair_detail_cache[pair] = pair_detail
                         row = pair_detail_cache[pair][idx]
@@ -1683,7 +2034,11 @@ class Backtesting:
             self.progress.increment()
 
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        signals: dict[str, dict[str, ndarray]] | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1696,52 +2051,128 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param signals: Signals evaluated from the strategy's conditions (by hyperopt),
+            by pair - see IStrategy.ft_advise_signals()
         :return: DataFrame with trades (results of backtesting)
         """
         self.reset_backtest(self.enable_protections)
-        # Ensure wallets are up-to-date (important for --strategy-list)
-        self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        self._start_profiler()
+        try:
+            self.exit_scan = self._init_exit_scan()
+            # Ensure wallets are up-to-date (important for --strategy-list)
+            self.wallets.update()
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data: dict = self._get_ohlcv_as_lists(processed, signals)
+            trade_sink = self._init_trade_sink()
 
-        # Loop timerange and get candle for each pair at that point in time
-        for (
-            current_time,
-            pair,
-            row,
-            is_last_row,
-            trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
-            if not self._can_short or trade_dir is None:
-                # No need to reverse position if shorting is disabled or there's no new signal
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-            else:
-                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
-                # a position closed and a new signal in the other direction is available.
+            # Loop timerange and get candle for each pair at that point in time
+            for (
+                current_time,
+                pair,
+                row,
+                is_last_row,
+                trade_dir,
+            ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
+                if trade_sink:
+                    trade_sink.maybe_flush(current_time)
+                if not self._can_short or trade_dir is None:
+                    # No need to reverse position if shorting is disabled or there's no new signal
+                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                else:
+                    # Conditionally call backtest_loop a 2nd time if shorting is enabled,
+                    # a position closed and a new signal in the other direction is available.
 
-                for _ in (0, 1):
-                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    if not a or a == trade_dir:
-                        # the trade didn't close or position change is in the same direction
-                        break
+                    for _ in (0, 1):
+                        a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                        if not a or a == trade_dir:
+                            # the trade didn't close or position change is in the same direction
+                            break
 
-        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
-        self.wallets.update()
+            self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+            self.wallets.update()
 
-        results = trade_list_to_dataframe(LocalTrade.bt_trades)
-        return {
-            "results": results,
-            "config": self.strategy.config,
-            "locks": PairLocks.get_all_locks(),
-            "rejected_signals": self.rejected_trades,
-            "timedout_entry_orders": self.timedout_entry_orders,
-            "timedout_exit_orders": self.timedout_exit_orders,
-            "canceled_trade_entries": self.canceled_trade_entries,
-            "canceled_entry_orders": self.canceled_entry_orders,
-            "replaced_entry_orders": self.replaced_entry_orders,
-            "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
-        }
+            if trade_sink:
+                results = trade_sink.load()
+                trade_sink.close()
+            else:
+                results = trade_list_to_dataframe(LocalTrade.bt_trades)
+            content: BacktestContentTypeIcomplete = {
+                "results": results,
+                "config": self.strategy.config,
+                "locks": PairLocks.get_all_locks(),
+                "rejected_signals": self.rejected_trades,
+                "timedout_entry_orders": self.timedout_entry_orders,
+                "timedout_exit_orders": self.timedout_exit_orders,
+                "canceled_trade_entries": self.canceled_trade_entries,
+                "canceled_entry_orders": self.canceled_entry_orders,
+                "replaced_entry_orders": self.replaced_entry_orders,
+                "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
+            }
+        finally:
+            # Also stop on errors (e.g. an aborted backtest) - so later backtests aren't profiled.
+            profile = self._stop_profiler()
+        if self.profile_callbacks:
+            content["callback_profile"] = profile
+        return content
+
+    def _init_trade_sink(self) -> TradeSink | None:
+        """
+        Trade sink for --stream-trades.
+        Closed trades are kept in memory as long as protections may look at them.
+        """
+        if not self.stream_trades:
+            return None
+        retention = timedelta(0)
+        if self.enable_protections:
+            retention = self.timeframe_td + timedelta(
+                minutes=max(
+                    (
+                        max(protection._lookback_period, protection._stop_duration)
+                        for protection in self.protections._protection_handlers
+                    ),
+                    default=0,
+                )
+            )
+        return TradeSink(
+            self.config.get("backtest_stream_batch_size", BACKTEST_STREAM_BATCH_SIZE_DEFAULT),
+            retention,
+        )
+
+    def _start_profiler(self) -> None:
+        """
+        Start recording strategy callbacks and backtesting phases (--profile-callbacks).
+        Continues the profile started by backtest_one_strategy() - if there is one.
+        """
+        if not self.profile_callbacks:
+            return
+        if self.callback_profiler is None:
+            self.callback_profiler = CallbackProfiler()
+        profiler = self.callback_profiler
+        set_callback_profiler(profiler)
+        for method, phase in PROFILED_PHASES.items():
+            setattr(self, method, profiler.wrap(phase, getattr(type(self), method).__get__(self)))
+        self.wallets.update = profiler.wrap(
+            "wallets_update", type(self.wallets).update.__get__(self.wallets)
+        )
+
+    def _stop_profiler(self) -> list[ProfileStats]:
+        """
+        Stop recording and return the profile.
+        """
+        if not self.profile_callbacks:
+            return []
+        set_callback_profiler(None)
+        for method in PROFILED_PHASES:
+            self.__dict__.pop(method, None)
+        self.wallets.__dict__.pop("update", None)
+        profiler, self.callback_profiler = self.callback_profiler, None
+        return profiler.get_stats() if profiler else []
+
+    def _profile_phase(self, phase: str) -> AbstractContextManager:
+        if self.callback_profiler:
+            return self.callback_profiler.measure(phase, "phase")
+        return nullcontext()
 
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
@@ -1751,9 +2182,14 @@ class Backtesting:
         logger.info(f"Running backtesting for Strategy {strategy_name}")
         backtest_start_time = dt_now()
         self._set_strategy(strat)
+        self.callback_profiler = CallbackProfiler() if self.profile_callbacks else None
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        with self._profile_phase("populate_indicators"):
+            if self.indicator_cache:
+                preprocessed = self.indicator_cache.advise_all_indicators(self.strategy, data)
+            else:
+                preprocessed = self.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1771,11 +2207,18 @@ class Backtesting:
             f"({(max_date - min_date).days} days)."
         )
         # Execute backtest and store results
-        results = self.backtest(
-            processed=preprocessed,
-            start_date=min_date,
-            end_date=max_date,
-        )
+        if self._use_pair_shards(len(preprocessed)):
+            results = self.backtest_pair_shards(
+                processed=preprocessed,
+                start_date=min_date,
+                end_date=max_date,
+            )
+        else:
+            results = self.backtest(
+                processed=preprocessed,
+                start_date=min_date,
+                end_date=max_date,
+            )
         backtest_end_time = dt_now()
         results.update(
             {
@@ -1800,6 +2243,185 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _run_in_workers(
+        self, worker: Callable, tasks: list[tuple], data: dict[str, DataFrame], jobs: int
+    ) -> list:
+        """
+        Run ``worker(backtesting, files, detail_files, *task)`` for every task in worker processes.
+        Candle data (and detail data) is shared through memory-mapped files
+        instead of being pickled for every task.
+        :param worker: Module level function to run in the worker processes
+        :param tasks: Additional arguments for every call to worker
+        :param data: Dictionary of <pair>: <DataFrame> to share with the workers
+        :param jobs: Number of worker processes (joblib semantics - -1 uses all CPUs)
+        :return: List of worker results, in task order
+        """
+        # The exchange connection can't be sent to the worker processes.
+        self.detach_exchange()
+        # Detail data is shared through files as well - don't pickle it with the object.
+        worker_bt = copy(self)
+        worker_bt.detail_data = {}
+        worker_bt._detail_pair_data = {}
+        worker_bt._funding_fee_series = {}
+
+        with TemporaryDirectory(prefix="freqtrade_bt_") as tmpdir:
+            data_dir = Path(tmpdir) / "data"
+            detail_dir = Path(tmpdir) / "detail"
+            data_dir.mkdir()
+            detail_dir.mkdir()
+            files = dump_shared_data(data, data_dir)
+            detail_files = dump_shared_data(self.detail_data, detail_dir)
+            with Parallel(n_jobs=min(jobs, len(tasks)) if jobs > 0 else jobs) as parallel:
+                logger.info(
+                    f"Running {len(tasks)} backtest tasks using "
+                    f"{parallel._effective_n_jobs()} parallel workers."
+                )
+                return parallel(
+                    delayed(worker)(worker_bt, files, detail_files, *task) for task in tasks
+                )
+
+    def backtest_strategies_parallel(
+        self, strategies: list[IStrategy], data: dict[str, DataFrame], jobs: int
+    ) -> tuple[datetime, datetime]:
+        """
+        Backtest multiple strategies in worker processes.
+        Results are merged into all_bt_content and analysis_results - the same way
+        backtest_one_strategy() does.
+        :param strategies: Strategies to backtest
+        :param data: Dictionary of <pair>: <DataFrame> as returned by load_bt_data()
+        :param jobs: Number of worker processes (joblib semantics - -1 uses all CPUs)
+        :return: Tuple of (min_date, max_date) of the backtested timerange
+        """
+        for strat in strategies:
+            register_pickle_by_value(strat.__class__.__bases__)
+        worker_results = self._run_in_workers(
+            backtest_strategy_worker,
+            [(strat.get_strategy_name(),) for strat in strategies],
+            data,
+            jobs,
+        )
+
+        for res in worker_results:
+            strategy_name = res["strategy_name"]
+            logger.info(f"Backtesting for Strategy {strategy_name} finished.")
+            self.all_bt_content[strategy_name] = res["results"]
+            for key, value in res["analysis_results"].items():
+                self.analysis_results[key][strategy_name] = value
+        return worker_results[-1]["min_date"], worker_results[-1]["max_date"]
+
+    def _use_pair_shards(self, pair_count: int) -> bool:
+        """
+        Check if pairs should be backtested in separate worker processes.
+        Only done with ``backtest_shard_pairs``, as trades of one pair must be independent of all
+        other pairs. This can't be verified for the wallet - a sequential backtest rejects entries
+        once open trades or losses of other pairs shrink the available balance.
+        :param pair_count: Number of pairs to backtest
+        """
+        if (
+            not self.config.get("backtest_shard_pairs", False)
+            or pair_count < 2
+            or effective_n_jobs(self.backtest_jobs) == 1
+        ):
+            return False
+        checks = [
+            (0 < self.strategy.max_open_trades < float("inf"), "max_open_trades is limited"),
+            (self.enable_protections, "protections are enabled"),
+            (self.strategy.position_adjustment_enable, "position adjustment is enabled"),
+            (self._position_stacking, "position stacking is enabled"),
+            (self.dynamic_pairlist, "dynamic pairlists are enabled"),
+            (self.profile_callbacks, "callbacks are profiled"),
+            (self.margin_mode == MarginMode.CROSS, "cross margin is used"),
+            (self.config.get("freqai", {}).get("enabled", False), "FreqAI is enabled"),
+        ]
+        reasons = [reason for failed, reason in checks if failed]
+        if reasons:
+            logger.warning(
+                f"Pairs can't be backtested in parallel, as {', '.join(reasons)}. "
+                "Running all pairs in one process."
+            )
+            return False
+
+        # Unlimited stake_amount requires limited max_open_trades - so it's a fixed amount.
+        tradable_balance = (
+            self.wallets.get_starting_balance() * self.config["tradable_balance_ratio"]
+        )
+        if (
+            self.strategy.ft_has_callback("custom_stake_amount")
+            or self.config["stake_amount"] * pair_count > tradable_balance
+        ):
+            logger.warning(
+                "Backtesting pairs in parallel, although the tradable balance may not cover one "
+                "stake for every pair. Results differ from a sequential backtest "
+                "if entries are rejected due to insufficient balance."
+            )
+        return True
+
+    def backtest_pair_shards(
+        self, processed: dict, start_date: datetime, end_date: datetime
+    ) -> BacktestContentTypeIcomplete:
+        """
+        Equivalent of backtest(), splitting the pairs across worker processes.
+        Only valid if trades are independent across pairs - see _use_pair_shards().
+        :param processed: a processed dictionary with format {pair, data}
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: Merged backtest results of all shards
+        """
+        pairs = list(processed.keys())
+        shard_count = min(effective_n_jobs(self.backtest_jobs), len(pairs))
+        # Round-robin distribution, so pairs with similar listing dates are spread over shards.
+        shards = [pairs[idx::shard_count] for idx in range(shard_count)]
+        logger.info(f"Backtesting {len(pairs)} pairs in {shard_count} independent shards.")
+        register_pickle_by_value(self.strategy.__class__.__bases__)
+
+        # All shards start with the same balance - required to merge the final balances.
+        self.reset_backtest(self.enable_protections)
+        self.wallets.update()
+        starting_balance = self.wallets.get_total(self.strategy.config["stake_currency"])
+
+        shard_results = self._run_in_workers(
+            backtest_pairs_worker,
+            [(shard, start_date, end_date) for shard in shards],
+            processed,
+            shard_count,
+        )
+
+        self.rejected_dict = {}
+        for res in shard_results:
+            self.rejected_dict.update(res["rejected_dict"])
+        contents = [res["results"] for res in shard_results]
+        results = concat([content["results"] for content in contents], ignore_index=True)
+        if len(results) > 0:
+            results = results.sort_values(
+                ["close_date", "open_date"], kind="stable", ignore_index=True
+            )
+
+        return {
+            "results": results,
+            "config": self.strategy.config,
+            "locks": [lock for content in contents for lock in content["locks"]],
+            "rejected_signals": sum(c["rejected_signals"] for c in contents),
+            "timedout_entry_orders": sum(c["timedout_entry_orders"] for c in contents),
+            "timedout_exit_orders": sum(c["timedout_exit_orders"] for c in contents),
+            "canceled_trade_entries": sum(c["canceled_trade_entries"] for c in contents),
+            "canceled_entry_orders": sum(c["canceled_entry_orders"] for c in contents),
+            "replaced_entry_orders": sum(c["replaced_entry_orders"] for c in contents),
+            "final_balance": starting_balance
+            + sum(c["final_balance"] - starting_balance for c in contents),
+        }
+
+    def detach_exchange(self) -> None:
+        """
+        Close the exchange connection, so this object can be pickled.
+        All data must be loaded before calling this - the exchange API can't be used afterwards.
+        """
+        self.exchange.close()
+        self.exchange._api = None
+        self.exchange._api_async = None
+        self.exchange.loop = None  # type: ignore
+        self.exchange._loop_lock = None  # type: ignore
+        self.exchange._cache_lock = None  # type: ignore
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
@@ -1838,12 +2460,25 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies: list[IStrategy] = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if (
+            self.backtest_jobs != 1
+            and len(strategies) > 1
+            and not self.config.get("freqai", {}).get("enabled", False)
+        ):
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, self.backtest_jobs
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
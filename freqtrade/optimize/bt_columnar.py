@@ -0,0 +1,144 @@
+"""
+Columnar storage of analyzed candle data for the backtesting engine.
+"""
+
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, Series
+
+
+class ColumnarRow:
+    """
+    Read-only view on one candle of a ColumnarPairData object.
+    Behaves like the row lists produced by the "lists" backtest engine, so it can be indexed
+    using the row index constants (``DATE_IDX``, ``OPEN_IDX``, ...) from backtesting.
+    Values are read from the underlying arrays on access - the row itself is never materialized.
+    """
+
+    __slots__ = ("_columns", "_dates", "_idx")
+
+    def __init__(self, dates, columns: list[np.ndarray], idx: int):
+        self._dates = dates
+        self._columns = columns
+        self._idx = idx
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self._columns)))]
+        if key == 0 or key == -len(self._columns):
+            return self._dates[self._idx]
+        # item() returns python scalars - identical to DataFrame.values.tolist()
+        return self._columns[key].item(self._idx)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColumnarRow | list | tuple):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarRow({list(self)})"
+
+
+class ColumnarPairData:
+    """
+    Analyzed candles of one pair, stored as one contiguous array per column.
+    Supports the subset of the list interface used by backtesting
+    (``len()``, positive and negative integer indexing).
+    """
+
+    __slots__ = ("_columns", "_dates", "_length")
+
+    def __init__(self, dataframe: DataFrame, columns: list[str]):
+        """
+        :param dataframe: Analyzed dataframe, with shifted signal columns.
+        :param columns: Columns to keep - in row-index order. The first column must be "date".
+        """
+        self._length = len(dataframe)
+        # DatetimeArray - indexing returns pandas Timestamps, like the list engine.
+        self._dates = dataframe[columns[0]].array
+        self._columns: list[np.ndarray] = [np.empty(0)] + [
+            np.ascontiguousarray(dataframe[col].to_numpy()) for col in columns[1:]
+        ]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> ColumnarRow:
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("ColumnarPairData index out of range")
+        return ColumnarRow(self._dates, self._columns, index)
+
+    def column(self, idx: int) -> np.ndarray:
+        """
+        Get the underlying array for one column.
+        :param idx: Column index (one of the row index constants)
+        """
+        if idx == 0:
+            return self._dates.asi8
+        return self._columns[idx]
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles of one pair, stored as one contiguous array per column.
+    Main candles are mapped to their detail rows through offset arrays (see get_offsets()),
+    so expanding a main candle into its detail rows doesn't need to search the data.
+    """
+
+    __slots__ = ("_columns", "_dates", "_dates_ns", "source")
+
+    def __init__(self, dataframe: DataFrame):
+        """
+        :param dataframe: Detail candles (date, open, high, low, close) - sorted by date.
+        """
+        # Keep a reference to the source, to detect when the detail data is replaced.
+        self.source = dataframe
+        self._dates = dataframe["date"].array
+        self._dates_ns = self._dates.as_unit("ns").asi8
+        self._columns = [
+            np.ascontiguousarray(dataframe[col].to_numpy())
+            for col in ("open", "high", "low", "close")
+        ]
+
+    def get_offsets(
+        self, candle_dates: Series, candle_td: timedelta
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Build the offset index for the given main candles.
+        :param candle_dates: Open dates of the main candles
+        :param candle_td: Duration of one main candle
+        :return: Tuple of (start, end) arrays, aligned with candle_dates.
+            Detail rows of main candle ``i`` are ``start[i]:end[i]``.
+        """
+        starts_ns = candle_dates.array.as_unit("ns").asi8
+        starts = np.searchsorted(self._dates_ns, starts_ns, side="left")
+        ends = np.searchsorted(
+            self._dates_ns, starts_ns + int(candle_td.total_seconds() * 1e9), side="left"
+        )
+        return starts, ends
+
+    def get_rows(self, start: int, end: int, signals: Sequence[Any]) -> list[Any]:
+        """
+        Get detail rows in row-list format.
+        :param start: First detail row (inclusive)
+        :param end: Last detail row (exclusive)
+        :param signals: Signal columns (entry/exit signals, tags) to append to every row
+        """
+        opens, highs, lows, closes = (col[start:end].tolist() for col in self._columns)
+        return [
+            [date, open_, high, low, close, *signals]
+            for date, open_, high, low, close in zip(
+                self._dates[start:end], opens, highs, lows, closes, strict=True
+            )
+        ]
@@ -0,0 +1,132 @@
+"""
+Event schedule for the backtest loop - pairs without open trades are only processed on candles
+with an entry signal.
+"""
+
+from datetime import datetime, timedelta
+from heapq import heappop, heappush
+
+import numpy as np
+
+from freqtrade.util import dt_ts
+
+
+class EntrySchedule:
+    """
+    Candles on which pairs without open trades have to be processed by the backtest loop.
+    Pairs are due on candles with an entry signal (see Backtesting._get_entry_candles()),
+    all candles in between are skipped.
+
+    The number of rows the sequential loop would have processed for a pair at any point is
+    derived from the candle dates - so the row index of a pair is caught up once it's
+    processed again, and the dataprovider can slice the dataframes of skipped pairs
+    exactly like the sequential loop did (see get_processed_rows()).
+    Requires unique candles aligned to the timeframe - as ensured when loading the data.
+    """
+
+    def __init__(
+        self,
+        pairs: list[str],
+        dates: dict[str, np.ndarray],
+        entry_candles: dict[str, np.ndarray],
+        timeframe_td: timedelta,
+    ) -> None:
+        """
+        :param pairs: Pairs in the order the backtest loop processes them
+        :param dates: Candle dates per pair - as ms timestamps
+        :param entry_candles: Candles with an entry signal per pair
+        :param timeframe_td: Timeframe of the candles
+        """
+        self._pos = {pair: pos for pos, pair in enumerate(pairs)}
+        self._dates = dates
+        self._entry_rows = {pair: np.flatnonzero(entry_candles[pair]) for pair in dates}
+        self._timeframe_ms = int(timeframe_td.total_seconds() * 1000)
+        # (date, position, pair, row) of the next entry of each pair
+        self._heap: list[tuple[int, int, str, int]] = []
+        # Row of the entry in the heap - None if the pair has no further entries.
+        # Pairs which are due, but not processed yet, aren't part of this.
+        self._pending: dict[str, int | None] = {}
+        for pair in dates:
+            self._schedule(pair, 0)
+
+        # Position of the backtest loop
+        self._time = 0
+        self._open_pairs: dict[str, int] = {}
+        self._current: tuple[int, int] | None = None
+
+    def __contains__(self, pair: str) -> bool:
+        return pair in self._dates
+
+    def _schedule(self, pair: str, start_row: int) -> None:
+        rows = self._entry_rows[pair]
+        idx = int(rows.searchsorted(start_row))
+        if idx < len(rows):
+            row = int(rows[idx])
+            self._pending[pair] = row
+            heappush(self._heap, (int(self._dates[pair][row]), self._pos[pair], pair, row))
+        else:
+            self._pending[pair] = None
+
+    def _key(self, pair: str) -> tuple[int, int]:
+        """
+        Processing order within a candle - pairs with open trades first.
+        """
+        if (open_pos := self._open_pairs.get(pair)) is not None:
+            return (0, open_pos)
+        return (1, self._pos.get(pair, -1))
+
+    def start_candle(self, current_time: datetime, open_pairs: list[str]) -> list[str]:
+        """
+        Start processing the pairs of a new candle.
+        :param current_time: Date of the candle
+        :param open_pairs: Pairs with open trades - processed first
+        :return: Pairs with an entry signal on this candle, in processing order
+        """
+        self._time = dt_ts(current_time)
+        self._open_pairs = {pair: pos for pos, pair in enumerate(open_pairs)}
+        # No pair has been processed for this candle yet.
+        self._current = (-1, -1)
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= self._time:
+            _, _, pair, row = heappop(heap)
+            if self._pending.get(pair) == row:
+                del self._pending[pair]
+                due.append(pair)
+        if len(due) > 1:
+            due.sort(key=self._pos.__getitem__)
+        return due
+
+    def process(self, pair: str) -> int:
+        """
+        Process pair on the current candle.
+        :return: Number of rows of this pair processed before the current candle
+        """
+        self._current = self._key(pair)
+        return int(self._dates[pair].searchsorted(self._time - self._timeframe_ms, "right"))
+
+    def processed(self, pair: str, row: int) -> None:
+        """
+        Row of pair was processed - schedule the next entry of the pair.
+        """
+        if pair not in self._pending:
+            self._schedule(pair, row + 1)
+
+    def end_pairs(self) -> None:
+        """
+        All pairs were processed for the current candle.
+        """
+        self._current = None
+
+    def get_processed_rows(self, pair: str) -> int:
+        """
+        Number of rows of pair the sequential backtest loop would have processed at this point.
+        Pairs are processed in order within each candle - pairs after the current pair
+        are still at the previous candle.
+        """
+        if (dates := self._dates.get(pair)) is None:
+            return 0
+        time = self._time
+        if self._current is not None and self._key(pair) > self._current:
+            time -= self._timeframe_ms
+        return int(dates.searchsorted(time, "right"))
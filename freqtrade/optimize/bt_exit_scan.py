@@ -0,0 +1,215 @@
+"""
+Vectorized exit precomputation for the backtesting engine.
+
+Without strategy callbacks, whether an open trade exits on a candle only depends on the
+candle's high / low, the exit signal and the trade's stoploss, liquidation price and ROI table.
+After a regular exit check, the candles which may trigger an exit are searched with numpy -
+and all candles before the first candidate skip strategy.should_exit() entirely.
+Candidates are selected conservatively, the candidate candle itself runs the regular exit check.
+"""
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+# Profit ratios of the regular exit check are rounded to 8 digits.
+ROI_TOLERANCE = 1e-6
+# Candles scanned at once - doubled until a candidate is found.
+INITIAL_WINDOW = 64
+
+
+class ExitScanPairData:
+    """
+    Columns of one pair used by the exit scan.
+    """
+
+    __slots__ = ("dates_ns", "dates_s", "exit_long", "exit_short", "highs", "lows")
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        """
+        :param dataframe: Analyzed dataframe, with shifted signal columns.
+        """
+        self.dates_ns = dataframe["date"].array.as_unit("ns").asi8
+        self.dates_s = self.dates_ns / 1e9
+        self.highs = np.ascontiguousarray(dataframe["high"].to_numpy(dtype=np.float64))
+        self.lows = np.ascontiguousarray(dataframe["low"].to_numpy(dtype=np.float64))
+        self.exit_long = dataframe["exit_long"].to_numpy() == 1
+        self.exit_short = dataframe["exit_short"].to_numpy() == 1
+
+
+class SkippedCandles:
+    """
+    Candles of one trade, which skip the exit check.
+    """
+
+    __slots__ = ("end_ns", "last_ns", "pair_data", "start")
+
+    def __init__(self, pair_data: ExitScanPairData, start: int, end: int) -> None:
+        self.pair_data = pair_data
+        # First skipped candle
+        self.start = start
+        # First candle which needs a regular exit check
+        self.end_ns = int(pair_data.dates_ns[end]) if end < len(pair_data.dates_ns) else None
+        # Last candle skipped so far
+        self.last_ns: int | None = None
+
+
+class ExitScan:
+    """
+    Exit scan for one backtest run - reads ROI, trailing stop and exit signal settings
+    from the strategy when created.
+    """
+
+    def __init__(self, strategy: IStrategy) -> None:
+        roi = sorted((int(k), float(v)) for k, v in strategy.minimal_roi.items())
+        self._roi_durations = np.array([k for k, _ in roi], dtype=np.float64)
+        self._roi_values = np.array([v for _, v in roi], dtype=np.float64)
+        self._trailing_stop = strategy.trailing_stop
+        self._use_exit_signal = strategy.use_exit_signal
+        self._pairs: dict[str, ExitScanPairData] = {}
+        self._skipped: dict[LocalTrade, SkippedCandles] = {}
+        # Trades which kept running after their stoploss was hit (e.g. the exit was rejected).
+        self._disabled: set[LocalTrade] = set()
+
+    @staticmethod
+    def is_supported(strategy: IStrategy) -> bool:
+        """
+        The exit scan can't predict callbacks - fall back to checking every candle if the
+        strategy may adjust trades or exits on any candle.
+        """
+        return not (
+            strategy.position_adjustment_enable
+            or strategy.use_custom_stoploss
+            or strategy.ft_has_callback("custom_exit")
+            or (strategy.use_custom_roi and strategy.ft_has_callback("custom_roi"))
+        )
+
+    def add_pair(self, pair: str, dataframe: DataFrame) -> None:
+        self._pairs[pair] = ExitScanPairData(dataframe)
+
+    def _get_candidates(
+        self, trade: LocalTrade, pair_data: ExitScanPairData, start: int, end: int
+    ) -> np.ndarray:
+        """
+        Candles in start:end which may trigger an exit of trade.
+        """
+        highs = pair_data.highs[start:end]
+        lows = pair_data.lows[start:end]
+        stop_loss = trade.stop_loss
+        liquidation_price = trade.liquidation_price
+        # Negated comparisons, so candles with missing data are candidates as well.
+        if trade.is_short:
+            candidates = ~(highs < stop_loss) | (highs <= 0)
+            if liquidation_price:
+                candidates |= highs >= liquidation_price
+            if self._trailing_stop:
+                # Trailing stops only move on new extremes
+                candidates |= lows < (trade.min_rate or trade.open_rate)
+            if self._use_exit_signal:
+                candidates |= pair_data.exit_short[start:end]
+            best_rates = lows
+        else:
+            candidates = ~(lows > stop_loss)
+            if liquidation_price:
+                candidates |= lows <= liquidation_price
+            if self._trailing_stop:
+                candidates |= highs > (trade.max_rate or trade.open_rate)
+            if self._use_exit_signal:
+                candidates |= pair_data.exit_long[start:end]
+            best_rates = highs
+
+        if len(self._roi_durations):
+            trade_dur = np.floor_divide(
+                pair_data.dates_s[start:end] - trade.open_date_utc.timestamp(), 60
+            )
+            roi_idx = np.searchsorted(self._roi_durations, trade_dur, side="right") - 1
+            min_roi = np.where(roi_idx >= 0, self._roi_values[np.maximum(roi_idx, 0)], np.inf)
+            candidates |= self._calc_profit_ratio(trade, best_rates) > min_roi - ROI_TOLERANCE
+        return candidates
+
+    @staticmethod
+    def _calc_profit_ratio(trade: LocalTrade, rates: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of trade.calc_profit_ratio().
+        Interest (margin) only grows with time, funding fee changes end the skipped candles -
+        so this never underestimates the profit of a candle.
+        """
+        fee = trade.fee_close or 0.0
+        interest = float(trade.calculate_interest())
+        funding_fees = trade.funding_fees or 0.0
+        if trade.is_short:
+            close_value = (trade.amount + interest) * rates * (1 + fee) - funding_fees
+            return (1 - close_value / trade.open_trade_value) * trade.leverage
+        close_value = trade.amount * rates * (1 - fee) - interest + funding_fees
+        return (close_value / trade.open_trade_value - 1) * trade.leverage
+
+    def skip_candles(self, trade: LocalTrade, pair: str, date: Timestamp) -> None:
+        """
+        Find the candles following date which don't need an exit check.
+        Called after the regular exit check of this candle.
+        """
+        pair_data = self._pairs.get(pair)
+        if pair_data is None or trade in self._disabled or not trade.stop_loss:
+            return
+        idx = int(np.searchsorted(pair_data.dates_ns, date.value))
+        stop_hit = (
+            pair_data.highs[idx] >= min(trade.stop_loss, trade.liquidation_price or np.inf)
+            if trade.is_short
+            else pair_data.lows[idx] <= max(trade.stop_loss, trade.liquidation_price or 0.0)
+        )
+        if stop_hit:
+            # The trade is still open - its exit may have been rejected.
+            self._disabled.add(trade)
+            return
+
+        start = idx + 1
+        length = len(pair_data.dates_ns)
+        end = start
+        window = INITIAL_WINDOW
+        while end < length:
+            window_end = min(end + window, length)
+            candidates = self._get_candidates(trade, pair_data, end, window_end)
+            if candidates.any():
+                end += int(candidates.argmax())
+                break
+            end = window_end
+            window *= 2
+        if end > start:
+            self._skipped[trade] = SkippedCandles(pair_data, start, end)
+
+    def is_skipped(self, trade: LocalTrade, date: Timestamp) -> bool:
+        """
+        Check if the exit check of trade can be skipped for the candle at date.
+        Ending the skipped candles catches up on the trade's min / max rates.
+        """
+        skipped = self._skipped.get(trade)
+        if skipped is None:
+            return False
+        date_ns = date.value
+        if skipped.end_ns is None or date_ns < skipped.end_ns:
+            skipped.last_ns = date_ns
+            return True
+        self.end_skip(trade)
+        return False
+
+    def end_skip(self, trade: LocalTrade) -> None:
+        """
+        Stop skipping exit checks for trade, and apply the skipped candles' high / low.
+        """
+        skipped = self._skipped.pop(trade, None)
+        if skipped is None or skipped.last_ns is None:
+            return
+        pair_data = skipped.pair_data
+        end = int(np.searchsorted(pair_data.dates_ns, skipped.last_ns, side="right"))
+        if end > skipped.start:
+            trade.adjust_min_max_rates(
+                float(pair_data.highs[skipped.start : end].max()),
+                float(pair_data.lows[skipped.start : end].min()),
+            )
+
+    def end_all(self) -> None:
+        for trade in list(self._skipped):
+            self.end_skip(trade)
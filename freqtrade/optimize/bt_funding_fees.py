@@ -0,0 +1,55 @@
+"""
+Cumulative funding fees for futures backtesting.
+"""
+
+from datetime import datetime
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+
+class FundingFeeSeries:
+    """
+    Funding fees (funding rate x mark price) of one pair, summed up over all funding candles.
+    The funding fees of a trade are the difference of two lookups - so the combined funding /
+    mark dataframe doesn't need to be filtered on every funding fee update.
+    """
+
+    __slots__ = ("_cum_fees", "_cum_nan", "_dates_ns", "source")
+
+    def __init__(self, dataframe: DataFrame):
+        """
+        :param dataframe: Combined funding and mark rates (see Exchange.combine_funding_and_mark())
+            - sorted by date.
+        """
+        # Keep a reference to the source, to detect when the futures data is replaced.
+        self.source = dataframe
+        if dataframe.empty:
+            self._dates_ns = np.empty(0, dtype=np.int64)
+            fees = np.empty(0, dtype=np.float64)
+        else:
+            self._dates_ns = dataframe["date"].array.as_unit("ns").asi8
+            fees = (dataframe["open_fund"] * dataframe["open_mark"]).to_numpy(dtype=np.float64)
+        missing = np.isnan(fees)
+        # Leading zero, so the fees of rows start:end are cum[end] - cum[start]
+        self._cum_fees = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, fees))))
+        self._cum_nan = np.concatenate(([0], np.cumsum(missing)))
+
+    def calculate(
+        self, amount: float, is_short: bool, open_date: datetime, close_date: datetime
+    ) -> float:
+        """
+        Sum of all funding fees between open_date and close_date (both inclusive).
+        Same result as Exchange.calculate_funding_fees().
+        :param amount: The quantity of the trade
+        :param is_short: trade direction
+        """
+        start = int(np.searchsorted(self._dates_ns, Timestamp(open_date).value, side="left"))
+        end = int(np.searchsorted(self._dates_ns, Timestamp(close_date).value, side="right"))
+        if end <= start or self._cum_nan[end] != self._cum_nan[start]:
+            # Missing funding rates or mark prices invalidate the whole sum
+            fees = 0.0
+        else:
+            fees = float(self._cum_fees[end] - self._cum_fees[start]) * amount
+        # Negate fees for longs as funding_fees expects it this way based on live endpoints.
+        return fees if is_short else -fees
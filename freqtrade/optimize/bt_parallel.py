@@ -0,0 +1,140 @@
+"""
+Helpers to run backtests in multiple processes.
+
+Candle data is written once to uncompressed feather files, which worker processes
+read through memory maps - so the data is neither pickled nor copied for every worker.
+Numeric columns of the loaded dataframes are read-only views of these memory maps.
+"""
+
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from joblib.externals import cloudpickle
+from pandas import DataFrame
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+
+
+logger = logging.getLogger(__name__)
+
+
+def register_pickle_by_value(bases: tuple[type, ...]) -> None:
+    """
+    Allow strategy inheritance across files when sending strategies to worker processes.
+    For this to properly work, we need to register the module of the imported class
+    to pickle as value.
+    :param bases: Base classes of the strategy class
+    """
+    for modules in bases:
+        if modules.__name__ != "IStrategy":
+            if mod := sys.modules.get(modules.__module__):
+                cloudpickle.register_pickle_by_value(mod)
+            register_pickle_by_value(modules.__bases__)
+
+
+def dump_shared_data(data: dict[str, DataFrame], directory: Path) -> dict[str, Path]:
+    """
+    Write candle data to uncompressed feather files, so it can be memory-mapped by workers.
+    :param data: Dictionary of <pair>: <DataFrame>
+    :param directory: Directory to write the files to
+    :return: Dictionary of <pair>: <filename>
+    """
+    files: dict[str, Path] = {}
+    for idx, (pair, df) in enumerate(data.items()):
+        # Pair names are not necessarily valid filenames - use a running number instead.
+        filename = directory / f"{idx}.feather"
+        # One record batch per file - columns spanning multiple batches are copied on load.
+        df.reset_index(drop=True).to_feather(
+            filename, compression="uncompressed", chunksize=max(len(df), 1)
+        )
+        files[pair] = filename
+    return files
+
+
+def load_shared_data(files: dict[str, Path]) -> dict[str, DataFrame]:
+    """
+    Load candle data written by dump_shared_data().
+    Numeric columns without missing values aren't copied, but use the memory-mapped
+    file (one block per column) - so they are read-only.
+    :param files: Dictionary of <pair>: <filename>
+    :return: Dictionary of <pair>: <DataFrame>
+    """
+    from pyarrow import feather
+
+    return {
+        pair: feather.read_table(filename, memory_map=True).to_pandas(
+            split_blocks=True, self_destruct=True
+        )
+        for pair, filename in files.items()
+    }
+
+
+def backtest_strategy_worker(
+    backtesting: "Backtesting",
+    files: dict[str, Path],
+    detail_files: dict[str, Path],
+    strategy_name: str,
+) -> dict[str, Any]:
+    """
+    Backtest one strategy - runs in a worker process.
+    :param backtesting: Backtesting instance, prepared for pickling
+    :param files: Shared candle data, as returned by dump_shared_data()
+    :param detail_files: Shared detail candle data, as returned by dump_shared_data()
+    :param strategy_name: Name of the strategy (from backtesting.strategylist) to run
+    :return: Dictionary with the backtest result and the analysis results of this strategy.
+    """
+    data = load_shared_data(files)
+    backtesting.detail_data = load_shared_data(detail_files)
+    # Workers don't spawn workers of their own.
+    backtesting.backtest_jobs = 1
+    strat = next(s for s in backtesting.strategylist if s.get_strategy_name() == strategy_name)
+    min_date, max_date = backtesting.backtest_one_strategy(strat, data, backtesting.timerange)
+    return {
+        "strategy_name": strategy_name,
+        "results": backtesting.all_bt_content[strategy_name],
+        "analysis_results": {
+            key: values[strategy_name]
+            for key, values in backtesting.analysis_results.items()
+            if strategy_name in values
+        },
+        "min_date": min_date,
+        "max_date": max_date,
+    }
+
+
+def backtest_pairs_worker(
+    backtesting: "Backtesting",
+    files: dict[str, Path],
+    detail_files: dict[str, Path],
+    pairs: list[str],
+    start_date: datetime,
+    end_date: datetime,
+) -> dict[str, Any]:
+    """
+    Backtest a subset of pairs of the current strategy - runs in a worker process.
+    Candles of all pairs are loaded, so callbacks can still access other pairs
+    through the dataprovider - but only ``pairs`` can open trades.
+    :param backtesting: Backtesting instance, prepared for pickling
+    :param files: Shared analyzed candle data, as returned by dump_shared_data()
+    :param detail_files: Shared detail candle data, as returned by dump_shared_data()
+    :param pairs: Pairs to backtest in this worker
+    :param start_date: backtesting timerange start datetime
+    :param end_date: backtesting timerange end datetime
+    :return: Dictionary with the backtest result and rejected signals of this shard.
+    """
+    processed = load_shared_data(files)
+    backtesting.detail_data = load_shared_data(detail_files)
+    backtesting.pair_shard = set(pairs)
+    try:
+        results = backtesting.backtest(processed, start_date, end_date)
+    finally:
+        backtesting.pair_shard = None
+    return {
+        "results": results,
+        "rejected_dict": backtesting.rejected_dict,
+    }
@@ -0,0 +1,82 @@
+"""
+Streaming storage of closed backtest trades.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import rapidjson
+from pandas import DataFrame, concat, read_parquet
+
+from freqtrade.data.btanalysis import trade_list_to_dataframe
+from freqtrade.persistence import LocalTrade
+
+
+logger = logging.getLogger(__name__)
+
+
+class TradeSink:
+    """
+    Writes closed backtest trades to parquet files in batches, and removes them from
+    ``LocalTrade.bt_trades`` - so long backtests don't keep every trade object in memory.
+    Trades closed within ``retention`` stay available (e.g. for protections).
+    """
+
+    def __init__(self, batch_size: int, retention: timedelta) -> None:
+        self._tmpdir = TemporaryDirectory(prefix="freqtrade_trades_")
+        self._batch_size = batch_size
+        self._retention = retention
+        self._files: list[Path] = []
+        self.trade_count = 0
+
+    def maybe_flush(self, current_time: datetime) -> None:
+        """
+        Write closed trades which are no longer needed - once a batch is complete.
+        """
+        if len(LocalTrade.bt_trades) >= self._batch_size:
+            self.flush(current_time - self._retention)
+
+    def flush(self, close_date: datetime | None = None) -> None:
+        """
+        Write closed trades to the sink.
+        :param close_date: Only write trades closed at or before this date - None for all trades.
+        """
+        trades = LocalTrade.bt_trades
+        count = len(trades)
+        if close_date is not None:
+            # Keep the order of the trades - only write the oldest trades.
+            count = next(
+                (idx for idx, trade in enumerate(trades) if trade.close_date_utc > close_date),
+                count,
+            )
+        if count == 0:
+            return
+
+        df = trade_list_to_dataframe(trades[:count])
+        df["orders"] = [rapidjson.dumps(orders) for orders in df["orders"]]
+        file = Path(self._tmpdir.name) / f"trades-{len(self._files):05d}.parquet"
+        df.to_parquet(file, index=False)
+        self._files.append(file)
+        self.trade_count += count
+        logger.debug(f"Wrote {count} trades to {file}.")
+        # New list object - so the closed trade index is rebuilt.
+        LocalTrade.bt_trades = trades[count:]
+
+    def load(self) -> DataFrame:
+        """
+        Write all remaining trades, and load all trades from the sink.
+        :return: Dataframe with BT_DATA_COLUMNS - identical to trade_list_to_dataframe()
+        """
+        self.flush()
+        if not self._files:
+            return trade_list_to_dataframe([])
+        # Columns without any value in one file can't be typed - infer types once combined.
+        df = concat([read_parquet(file) for file in self._files], ignore_index=True)
+        df = df.infer_objects()
+        df["orders"] = [rapidjson.loads(orders) for orders in df["orders"]]
+        return df
+
+    def close(self) -> None:
+        self._tmpdir.cleanup()
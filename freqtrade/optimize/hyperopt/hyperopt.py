@@ -6,13 +6,17 @@ This module contains the hyperopt logic
 
 import gc
 import logging
+import os
 import random
+import socket
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
 from math import ceil
 from pathlib import Path
 from typing import Any
 
 import rapidjson
+from filelock import FileLock
 from joblib import Parallel, cpu_count
 from optuna.trial import FrozenTrial, Trial, TrialState
 
@@ -21,6 +25,11 @@ from freqtrade.enums import HyperoptState
 from freqtrade.misc import file_dump_json, plural
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_signal_batch import CandidateSignals
+from freqtrade.optimize.hyperopt_results_index import (
+    get_hyperopt_index_filename,
+    open_hyperopt_results_index,
+)
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -51,14 +60,19 @@ class Hyperopt:
 
         time_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         strategy = str(self.config["strategy"])
-        self.results_file: Path = (
-            self.config["user_data_dir"]
-            / "hyperopt_results"
-            / f"strategy_{strategy}_{time_now}.fthypt"
-        )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
-        )
+        results_dir = self.config["user_data_dir"] / "hyperopt_results"
+        self.study_name: str | None = self.config.get("hyperopt_study")
+        file_suffix = ""
+        if self.study_name:
+            # All processes joining the study write into the same results file,
+            # other files are per process - also across machines sharing user_data.
+            self.results_file: Path = results_dir / f"strategy_{strategy}_{self.study_name}.fthypt"
+            file_suffix = f"_{socket.gethostname()}_{os.getpid()}"
+        else:
+            self.results_file = results_dir / f"strategy_{strategy}_{time_now}.fthypt"
+        self.data_pickle_file = results_dir / f"hyperopt_tickerdata{file_suffix}.pkl"
+        self.worker_pool = self.config.get("hyperopt_worker_pool", False)
+        self.optimizer_file = results_dir / f"hyperopt_optimizer{file_suffix}.pkl"
         self.total_epochs = config.get("epochs", 0)
 
         self.current_best_loss = 100
@@ -78,6 +92,7 @@ class Hyperopt:
 
         self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
         self.count_skipped_epochs = 0
+        self.count_pruned_epochs = 0
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -86,8 +101,12 @@ class Hyperopt:
     def clean_hyperopt(self) -> None:
         """
         Remove hyperopt pickle files to restart hyperopt.
+        The results file of a study is kept - it's shared with other processes.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        files = [self.data_pickle_file, self.optimizer_file]
+        if not self.study_name:
+            files += [self.results_file, get_hyperopt_index_filename(self.results_file)]
+        for f in files:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -101,14 +120,13 @@ class Hyperopt:
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
-                epoch,
-                f,
-                default=hyperopt_serializer,
-                number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
-            )
-            f.write("\n")
+        line = rapidjson.dumps(
+            epoch,
+            default=hyperopt_serializer,
+            number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+        )
+        with self._results_file_lock(), self.results_file.open("a") as f:
+            f.write(line + "\n")
 
         self.num_epochs_saved += 1
         logger.debug(
@@ -119,6 +137,29 @@ class Hyperopt:
         latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
         file_dump_json(latest_filename, {"latest_hyperopt": str(self.results_file.name)}, log=False)
 
+    def _results_file_lock(self) -> AbstractContextManager:
+        """
+        Lock for the results file - shared with other processes when using a study.
+        """
+        if self.study_name:
+            return FileLock(f"{self.results_file}.lock")
+        return nullcontext()
+
+    def _get_study_best_epoch(self) -> dict[str, Any] | None:
+        """
+        Best epoch of all processes which joined the study.
+        """
+        with (
+            self._results_file_lock(),
+            open_hyperopt_results_index(self.results_file) as index,
+        ):
+            position = index.get_best_position()
+            if position is not None:
+                epoch = index.get_epoch(position)
+                if HyperoptTools.is_best_loss(epoch, self.current_best_loss):
+                    return epoch
+        return self.current_best_epoch
+
     def print_results(self, results: dict[str, Any]) -> None:
         """
         Log results if it is better than any previous evaluation
@@ -134,14 +175,77 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def run_optimizer_parallel(
+        self,
+        parallel: Parallel,
+        asked: list[dict[str, Any]],
+        fraction: float = 1.0,
+        signals: list[CandidateSignals] | None = None,
+    ) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
+        epoch_signals: list[CandidateSignals | None] = (
+            list(signals) if signals is not None else [None] * len(asked)
+        )
+        if self.worker_pool:
+            return parallel(
+                self.hyperopter.get_pooled_job(self.optimizer_file, v, fraction, sig)
+                for v, sig in zip(asked, epoch_signals, strict=True)
+            )
+
+        return parallel(
+            self.hyperopter.generate_optimizer_wrapped(v, fraction=fraction, signals=sig)
+            for v, sig in zip(asked, epoch_signals, strict=True)
+        )
 
-        return parallel(self.hyperopter.generate_optimizer_wrapped(v) for v in asked)
+    def run_pruning_rungs(
+        self, parallel: Parallel, asked: list[Trial], signals: list[CandidateSignals] | None = None
+    ) -> list[int]:
+        """
+        Evaluate trials on growing parts of the timerange (successive halving).
+        Intermediate losses are reported to the trials - trials stopped by the pruner
+        are told as pruned. Without pruning, all trials are evaluated on the full timerange.
+        :param signals: Signals of each trial, from HyperOptimizer.get_batch_signals()
+        :return: Indexes of the trials which should be evaluated on the full timerange.
+        """
+        eta = self.hyperopter.pruning_reduction_factor
+        remaining = list(range(len(asked)))
+        for rung in range(self.hyperopter.pruning_rungs):
+            if not remaining:
+                break
+            step = eta**rung
+            fraction = step / eta**self.hyperopter.pruning_rungs
+            f_val = self.run_optimizer_parallel(
+                parallel,
+                [asked[idx].params for idx in remaining],
+                fraction,
+                [signals[idx] for idx in remaining] if signals is not None else None,
+            )
+            promoted = []
+            for idx, val in zip(remaining, f_val, strict=True):
+                asked[idx].report(val["loss"], step)
+                if asked[idx].should_prune():
+                    self.opt.tell(asked[idx], state=TrialState.PRUNED)
+                    self.count_pruned_epochs += 1
+                else:
+                    promoted.append(idx)
+            self.hyperopter.handle_mp_logging()
+            remaining = promoted
+        return remaining
 
     def _set_random_state(self, random_state: int | None) -> int:
+        if random_state and self.study_name:
+            # All processes would ask the same parameters.
+            logger.warning("Ignoring the random state - processes joining a study must differ.")
+            random_state = None
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
+    def _get_epoch_number(self, trial: Trial, epoch: int) -> int:
+        """
+        Human-friendly epoch number (starting at 1) - the trial number if using a study,
+        as multiple processes evaluate epochs at once.
+        """
+        return trial.number + 1 if self.study_name else epoch
+
     def get_optuna_asked_points(self, n_points: int, dimensions: dict) -> list[Any]:
         asked: list[list[Any]] = []
         for i in range(n_points):
@@ -216,6 +320,23 @@ class Hyperopt:
 
         self._save_result(val)
 
+    def _log_epoch_counts(self) -> None:
+        if self.count_skipped_epochs > 0:
+            logger.info(
+                f"{self.count_skipped_epochs} {plural(self.count_skipped_epochs, 'epoch')} "
+                f"skipped due to duplicate parameters."
+            )
+        if self.count_pruned_epochs > 0:
+            logger.info(
+                f"{self.count_pruned_epochs} {plural(self.count_pruned_epochs, 'epoch')} "
+                f"pruned after partial backtests."
+            )
+
+        logger.info(
+            f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
+            f"saved to '{self.results_file}'."
+        )
+
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
         logger.info(f"Using optimizer random state: {self.random_state}")
@@ -247,10 +368,19 @@ class Hyperopt:
                         )
                         f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
                         self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
+                        self.evaluate_result(
+                            f_val0, self._get_epoch_number(asked[0], 1), is_random[0]
+                        )
                         pbar.update(task, advance=1)
                         start += 1
 
+                    if self.hyperopter.signal_batching:
+                        logger.info("Evaluating the strategy's conditions for batches of epochs.")
+
+                    if self.worker_pool:
+                        # Workers load the optimizer (and the data) once, on their first epoch.
+                        self.hyperopter.dump_optimizer(self.optimizer_file)
+
                     evals = ceil((self.total_epochs - start) / jobs)
                     for i in range(evals):
                         # Correct the number of epochs to be processed for the last
@@ -261,19 +391,24 @@ class Hyperopt:
                         asked, is_random = self.get_asked_points(
                             n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
                         )
+                        signals = self.hyperopter.get_batch_signals([t.params for t in asked])
+                        indexes = self.run_pruning_rungs(parallel, asked, signals)
+                        pbar.update(task, advance=len(asked) - len(indexes))
 
                         f_val = self.run_optimizer_parallel(
                             parallel,
-                            [asked1.params for asked1 in asked],
+                            [asked[j].params for j in indexes],
+                            signals=[signals[j] for j in indexes] if signals is not None else None,
                         )
+                        del signals
 
                         f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
+                        for j, v in zip(indexes, f_val_loss, strict=False):
+                            self.opt.tell(asked[j], v)
 
-                        for j, val in enumerate(f_val):
+                        for j, val in zip(indexes, f_val, strict=False):
                             # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
+                            current = self._get_epoch_number(asked[j], i * jobs + j + 1 + start)
 
                             self.evaluate_result(val, current, is_random[j])
                             pbar.update(task, advance=1)
@@ -290,16 +425,12 @@ class Hyperopt:
         except KeyboardInterrupt:
             print("User interrupted..")
 
-        if self.count_skipped_epochs > 0:
-            logger.info(
-                f"{self.count_skipped_epochs} {plural(self.count_skipped_epochs, 'epoch')} "
-                f"skipped due to duplicate parameters."
-            )
+        if self.study_name:
+            # Per-process files are not reused by later runs.
+            self.clean_hyperopt()
+            self.current_best_epoch = self._get_study_best_epoch()
 
-        logger.info(
-            f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
-            f"saved to '{self.results_file}'."
-        )
+        self._log_epoch_counts()
 
         if self.current_best_epoch:
             HyperoptTools.try_export_params(
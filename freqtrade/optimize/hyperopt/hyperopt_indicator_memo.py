@@ -0,0 +1,106 @@
+"""
+In-memory cache of analyzed dataframes for hyperopt with --analyze-per-epoch.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from pandas import DataFrame
+
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import track_parameter_access
+
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorMemo:
+    """
+    Analyzed dataframes, keyed by pair and by the values of the parameters which were read
+    while populating the pair's indicators.
+    Parameters which are only used for entry / exit signals don't take part in the key -
+    so epochs which only change these, or which repeat indicator parameter values,
+    don't populate the indicators again.
+    Least recently used entries are evicted once the memory budget is exceeded.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: Memory budget in bytes
+        """
+        self._max_size = max_size
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, tuple[str, ...], tuple], tuple[DataFrame, int]] = (
+            OrderedDict()
+        )
+        # Parameter names the indicators of each pair were found to depend on.
+        # Usually one set per pair - more if the parameters read depend on parameter values.
+        self._param_names: dict[str, list[tuple[str, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Memoized equivalent of strategy.advise_all_indicators().
+        :param strategy: Strategy with the parameter values of the current epoch
+        :param data: Dictionary of <pair>: <DataFrame> with candle data
+        :return: Dictionary of <pair>: <DataFrame> with indicators
+        """
+        parameters = dict(strategy.enumerate_parameters())
+        result: dict[str, DataFrame] = {}
+        for pair, pair_data in data.items():
+            dataframe = self._get(pair, parameters)
+            if dataframe is None:
+                self.misses += 1
+                with track_parameter_access() as accessed:
+                    dataframe = strategy.advise_all_indicators({pair: pair_data})[pair]
+                names = tuple(
+                    sorted(name for name, param in parameters.items() if param in accessed)
+                )
+                self._put(pair, names, parameters, dataframe)
+            else:
+                self.hits += 1
+            # The backtest adds signal columns - entries must not be modified.
+            result[pair] = dataframe.copy()
+        return result
+
+    def _get(self, pair: str, parameters: dict[str, Any]) -> DataFrame | None:
+        for names in self._param_names.get(pair, []):
+            key = (pair, names, tuple(parameters[name].value for name in names))
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+        return None
+
+    def _put(
+        self, pair: str, names: tuple[str, ...], parameters: dict[str, Any], dataframe: DataFrame
+    ) -> None:
+        key = (pair, names, tuple(parameters[name].value for name in names))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values can't be memoized.
+            return
+        size = int(dataframe.memory_usage(index=True).sum())
+        if size > self._max_size:
+            return
+        pair_names = self._param_names.setdefault(pair, [])
+        if names not in pair_names:
+            pair_names.append(names)
+            logger.debug(f"Indicators of {pair} depend on the parameters {', '.join(names)}.")
+
+        self._entries[key] = (dataframe, size)
+        self._size += size
+        while self._size > self._max_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
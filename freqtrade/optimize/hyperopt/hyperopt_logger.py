@@ -7,13 +7,14 @@ from queue import Empty
 logger = logging.getLogger(__name__)
 
 
-def logging_mp_setup(log_queue: Queue, verbosity: int):
+def logging_mp_setup(log_queue: Queue, verbosity: int) -> QueueHandler | None:
     """
     Setup logging in a child process.
     Must be called in the child process before logging.
     log_queue MUST be passed to the child process via inheritance
         Which essentially means that the log_queue must be a global, created in the same
         file as Parallel is initialized.
+    :return: The added handler - None when called in the main process.
     """
     current_proc = current_process().name
     if current_proc != "MainProcess":
@@ -26,6 +27,8 @@ def logging_mp_setup(log_queue: Queue, verbosity: int):
         # and eventually from other libraries.
         if verbosity > logging.DEBUG:
             logging.getLogger("freqtrade").setLevel(logging.WARNING)
+        return h
+    return None
 
 
 def logging_mp_handle(q: Queue):
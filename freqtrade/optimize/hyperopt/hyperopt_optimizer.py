@@ -4,9 +4,13 @@ and will be sent to the hyperopt worker processes.
 """
 
 import logging
-import sys
 import warnings
+from collections import UserDict
+from collections.abc import Callable
 from datetime import datetime
+from functools import cached_property, partial
+from logging.handlers import QueueHandler
+from math import ceil
 from multiprocessing import Manager
 from pathlib import Path
 from typing import Any
@@ -15,22 +19,33 @@ import optuna
 from joblib import delayed, dump, load, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
 from pandas import DataFrame
 
+from freqtrade import constants
 from freqtrade.constants import DATETIME_PRINT_FORMAT, Config
 from freqtrade.data.converter import trim_dataframes
 from freqtrade.data.history import get_timerange
-from freqtrade.data.metrics import calculate_market_change
+from freqtrade.data.metrics import MetricsContext, calculate_market_change
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_prev_date
 from freqtrade.ft_types import BacktestContentType
 from freqtrade.misc import deep_merge_dicts, round_dict
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.bt_parallel import register_pickle_by_value
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_indicator_memo import IndicatorMemo
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_signal_batch import (
+    CandidateSignals,
+    evaluate_signal_batch,
+    expand_signals,
+)
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -42,6 +57,7 @@ from freqtrade.optimize.space import (
     ft_IntDistribution,
 )
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
+from freqtrade.strategy.interface import CONDITION_METHODS
 from freqtrade.util import dt_now
 from freqtrade.util.dry_run_wallet import get_dry_run_wallet
 
@@ -52,6 +68,21 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+
+class _LazyBacktestStats(UserDict):
+    """
+    Backtest statistics, generated on first access.
+    """
+
+    def __init__(self, generate: Callable[[], dict[str, Any]]) -> None:
+        # Don't call UserDict.__init__() - it would set data.
+        self._generate = generate
+
+    @cached_property
+    def data(self) -> dict[str, Any]:  # type: ignore[override]
+        return self._generate()
+
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -63,6 +94,14 @@ optuna_samplers_dict = {
 
 log_queue: Any
 
+# State of a hyperopt worker process when using the worker pool.
+_worker_optimizer: "HyperOptimizer | None" = None
+_worker_optimizer_key: tuple[str, int] | None = None
+_worker_log_handler: QueueHandler | None = None
+# Indicator memo of this process - kept across epochs, and across copies of the optimizer.
+_indicator_memo: IndicatorMemo | None = None
+_indicator_memo_key: tuple[str, int] | None = None
+
 
 class HyperOptimizer:
     """
@@ -83,11 +122,19 @@ class HyperOptimizer:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.indicator_memo_size = self.config.get(
+            "hyperopt_indicator_memo_size", constants.HYPEROPT_INDICATOR_MEMO_SIZE_DEFAULT
+        )
 
         self.custom_hyperopt = HyperOptAuto(self.config)
 
         self.backtesting._set_strategy(self.backtesting.strategylist[0])
         self.custom_hyperopt.strategy = self.backtesting.strategy
+        # Conditions are evaluated for each batch of epochs at once - unless indicators
+        # depend on the parameters of each epoch.
+        self.signal_batching = not self.analyze_per_epoch and any(
+            self.backtesting.strategy.ft_has_callback(method) for method, _ in CONDITION_METHODS
+        )
 
         self.hyperopt_pickle_magic(self.backtesting.strategy.__class__.__bases__)
         self.custom_hyperoptloss: IHyperOptLoss = HyperOptLossResolver.load_hyperoptloss(
@@ -96,9 +143,18 @@ class HyperOptimizer:
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
         self.data_pickle_file = data_pickle_file
+        # Processed data kept in memory by worker pool processes.
+        self.processed: dict[str, DataFrame] | None = None
+        # Processed data kept by the main process to evaluate batches of conditions.
+        self.batch_data: dict[str, DataFrame] | None = None
 
         self.market_change = 0.0
 
+        self.pruning_rungs = config.get("hyperopt_pruning_rungs", 0)
+        self.pruning_reduction_factor = config.get(
+            "hyperopt_pruning_reduction_factor", constants.HYPEROPT_PRUNING_REDUCTION_FACTOR_DEFAULT
+        )
+
         self.es_epochs = config.get("early_stop", 0)
         if self.es_epochs > 0 and self.es_epochs < 0.2 * config.get("epochs", 0):
             logger.warning(f"Early stop epochs {self.es_epochs} lower than 20% of total epochs")
@@ -118,6 +174,37 @@ class HyperOptimizer:
         log_queue = m.Queue()
         logger.info(f"manager queue {type(log_queue)}")
 
+    def get_pooled_job(
+        self,
+        optimizer_file: Path,
+        params_dict: dict[str, Any],
+        fraction: float = 1.0,
+        signals: CandidateSignals | None = None,
+    ) -> Any:
+        """
+        Job for the worker pool - only sends the parameters (and the optimizer filename)
+        to the worker process.
+        """
+        verbosity = logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
+        return delayed(generate_optimizer_pooled)(
+            optimizer_file, log_queue, verbosity, params_dict, fraction=fraction, signals=signals
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Jobs and the optimizer file don't need the data of the main process.
+        """
+        state = self.__dict__.copy()
+        state["batch_data"] = None
+        return state
+
+    def dump_optimizer(self, optimizer_file: Path) -> None:
+        """
+        Store the optimizer for the worker pool processes.
+        """
+        with optimizer_file.open("wb") as f:
+            cloudpickle.dump(self, f)
+
     def handle_mp_logging(self) -> None:
         """
         Handle logging from child processes.
@@ -132,12 +219,7 @@ class HyperOptimizer:
         self.prepare_hyperopt_data()
 
         # We don't need exchange instance anymore while running hyperopt
-        self.backtesting.exchange.close()
-        self.backtesting.exchange._api = None
-        self.backtesting.exchange._api_async = None
-        self.backtesting.exchange.loop = None  # type: ignore
-        self.backtesting.exchange._loop_lock = None  # type: ignore
-        self.backtesting.exchange._cache_lock = None  # type: ignore
+        self.backtesting.detach_exchange()
         # self.backtesting.exchange = None  # type: ignore
         self.backtesting.pairlists = None  # type: ignore
 
@@ -150,11 +232,7 @@ class HyperOptimizer:
         For this to properly work, we need to register the module of the imported class
         to pickle as value.
         """
-        for modules in bases:
-            if modules.__name__ != "IStrategy":
-                if mod := sys.modules.get(modules.__module__):
-                    cloudpickle.register_pickle_by_value(mod)
-                self.hyperopt_pickle_magic(modules.__bases__)
+        register_pickle_by_value(bases)
 
     def _get_params_details(self, params: dict) -> dict:
         """
@@ -259,15 +337,28 @@ class HyperOptimizer:
 
     @delayed
     @wrap_non_picklable_objects
-    def generate_optimizer_wrapped(self, params_dict: dict[str, Any]) -> dict[str, Any]:
+    def generate_optimizer_wrapped(
+        self,
+        params_dict: dict[str, Any],
+        fraction: float = 1.0,
+        signals: CandidateSignals | None = None,
+    ) -> dict[str, Any]:
         logging_mp_setup(log_queue, logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG)
-        return self.generate_optimizer(params_dict)
+        return self.generate_optimizer(params_dict, fraction=fraction, signals=signals)
 
-    def generate_optimizer(self, params_dict: dict[str, Any]) -> dict[str, Any]:
+    def generate_optimizer(
+        self,
+        params_dict: dict[str, Any],
+        fraction: float = 1.0,
+        signals: CandidateSignals | None = None,
+    ) -> dict[str, Any]:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param fraction: Part of the timerange to backtest - starting at the beginning.
+            Values below 1 are used for pruning, and require proportionally fewer trades.
+        :param signals: Signals of this epoch from get_batch_signals()
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
         backtest_start_time = dt_now()
@@ -312,14 +403,26 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        if self.processed is not None:
+            processed = self.processed
+        else:
+            with self.data_pickle_file.open("rb") as f:
+                processed = load(f, mmap_mode="r")
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
 
+        end_date = self.max_date
+        min_trades = self.config["hyperopt_min_trades"]
+        if fraction < 1:
+            end_date, processed = self._get_partial_data(processed, fraction)
+            min_trades = ceil(min_trades * fraction)
+
         bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+            processed=processed,
+            start_date=self.min_date,
+            end_date=end_date,
+            signals=expand_signals(signals, processed) if signals is not None else None,
         )
         backtest_end_time = dt_now()
         bt_results.update(
@@ -329,10 +432,33 @@ class HyperOptimizer:
             }
         )
         result = self._get_results_dict(
-            bt_results, self.min_date, self.max_date, params_dict, processed=processed
+            bt_results,
+            self.min_date,
+            end_date,
+            params_dict,
+            processed,
+            min_trades,
+            loss_only=fraction < 1,
         )
         return result
 
+    def _get_partial_data(
+        self, processed: dict[str, DataFrame], fraction: float
+    ) -> tuple[datetime, dict[str, DataFrame]]:
+        """
+        End date and data for a backtest of the first part of the timerange.
+        Candles after the end date are removed, so no signals are calculated for them.
+        """
+        end_date = timeframe_to_prev_date(
+            self.config["timeframe"], self.min_date + (self.max_date - self.min_date) * fraction
+        )
+        end_date = max(end_date, self.min_date)
+        partial = {
+            pair: df.iloc[: df["date"].searchsorted(end_date, side="right")]
+            for pair, df in processed.items()
+        }
+        return end_date, partial
+
     def _get_results_dict(
         self,
         backtesting_results: BacktestContentType,
@@ -340,10 +466,19 @@ class HyperOptimizer:
         max_date: datetime,
         params_dict: dict[str, Any],
         processed: dict[str, DataFrame],
+        min_trades: int,
+        loss_only: bool = False,
     ) -> dict[str, Any]:
-        params_details = self._get_params_details(params_dict)
-
-        strat_stats = generate_strategy_stats(
+        """
+        :param loss_only: Only calculate the loss (e.g. for pruning) - backtest statistics
+            are only generated if the loss function uses them.
+        """
+        results = backtesting_results["results"]
+        starting_balance = get_dry_run_wallet(self.config)
+        # Metrics are shared by the loss function and the backtest statistics.
+        metrics = MetricsContext(results, min_date, max_date, starting_balance)
+        generate_stats = partial(
+            generate_strategy_stats,
             self.pairlist,
             self.backtesting.strategy.get_strategy_name(),
             backtesting_results,
@@ -351,33 +486,40 @@ class HyperOptimizer:
             max_date,
             market_change=self.market_change,
             is_hyperopt=True,
+            metrics=metrics,
         )
-        results_explanation = HyperoptTools.format_results_explanation_string(
-            strat_stats, self.config["stake_currency"]
-        )
-
-        not_optimized = self.backtesting.strategy.get_no_optimize_params()
-        not_optimized = deep_merge_dicts(not_optimized, self._get_no_optimize_details())
-
-        trade_count = strat_stats["total_trades"]
-        total_profit = strat_stats["profit_total"]
+        strat_stats: dict[str, Any] = {} if loss_only else generate_stats()
+        trade_count = len(results)
 
         # If this evaluation contains too short amount of trades to be
         # interesting -- consider it as 'bad' (assigned max. loss value)
         # in order to cast this hyperspace point away from optimization
         # path. We do not want to optimize 'hodl' strategies.
         loss: float = MAX_LOSS
-        if trade_count >= self.config["hyperopt_min_trades"]:
+        if trade_count >= min_trades:
             loss = self.calculate_loss(
-                results=backtesting_results["results"],
+                results=results,
                 trade_count=trade_count,
                 min_date=min_date,
                 max_date=max_date,
                 config=self.config,
                 processed=processed,
-                backtest_stats=strat_stats,
-                starting_balance=get_dry_run_wallet(self.config),
+                backtest_stats=_LazyBacktestStats(generate_stats) if loss_only else strat_stats,
+                starting_balance=starting_balance,
+                metrics=metrics,
             )
+        if loss_only:
+            return {"loss": loss}
+
+        params_details = self._get_params_details(params_dict)
+        results_explanation = HyperoptTools.format_results_explanation_string(
+            strat_stats, self.config["stake_currency"]
+        )
+
+        not_optimized = self.backtesting.strategy.get_no_optimize_params()
+        not_optimized = deep_merge_dicts(not_optimized, self._get_no_optimize_details())
+
+        total_profit = strat_stats["profit_total"]
         return {
             "loss": loss,
             "params_dict": params_dict,
@@ -395,7 +537,11 @@ class HyperOptimizer:
                 original_dim,
                 ft_CategoricalDistribution | ft_IntDistribution | ft_FloatDistribution | SKDecimal,
             ):
-                o_dimensions[original_dim.name] = original_dim
+                o_dimensions[original_dim.name] = (
+                    self._to_base_distribution(original_dim)
+                    if self.config.get("hyperopt_study")
+                    else original_dim
+                )
             else:
                 raise OperationalException(
                     f"Unknown search space {original_dim.name} - {original_dim} / \
@@ -403,6 +549,26 @@ class HyperOptimizer:
                 )
         return o_dimensions
 
+    @staticmethod
+    def _to_base_distribution(
+        dimension: optuna.distributions.BaseDistribution,
+    ) -> optuna.distributions.BaseDistribution:
+        """
+        Plain optuna distribution - the storage of a study can only load optuna's own
+        distribution classes.
+        """
+        if isinstance(dimension, optuna.distributions.CategoricalDistribution):
+            return optuna.distributions.CategoricalDistribution(dimension.choices)
+        if isinstance(dimension, optuna.distributions.IntDistribution):
+            return optuna.distributions.IntDistribution(
+                dimension.low, dimension.high, log=dimension.log, step=dimension.step
+            )
+        if isinstance(dimension, optuna.distributions.FloatDistribution):
+            return optuna.distributions.FloatDistribution(
+                dimension.low, dimension.high, log=dimension.log, step=dimension.step
+            )
+        return dimension
+
     def get_optimizer(
         self,
         random_state: int,
@@ -435,10 +601,83 @@ class HyperOptimizer:
                 self.es_terminator = Terminator(BestValueStagnationEvaluator(self.es_epochs))
 
         logger.info(f"Using optuna sampler {o_sampler}.")
-        return optuna.create_study(sampler=sampler, direction="minimize")
+        pruner = None
+        if self.pruning_rungs > 0:
+            # Rung n is evaluated on reduction_factor ** (n - pruning_rungs) of the timerange.
+            # Steps are the reduction_factor ** n - so every rung is a promotion step.
+            pruner = optuna.pruners.SuccessiveHalvingPruner(
+                min_resource=1, reduction_factor=self.pruning_reduction_factor
+            )
+            logger.info(
+                f"Pruning epochs on {self.pruning_rungs} partial backtests "
+                f"with reduction factor {self.pruning_reduction_factor}."
+            )
+        study_name = self.config.get("hyperopt_study")
+        if study_name:
+            logger.info(f"Joining hyperopt study '{study_name}'.")
+            return optuna.create_study(
+                sampler=sampler,
+                direction="minimize",
+                pruner=pruner,
+                study_name=study_name,
+                storage=self._get_study_storage(study_name),
+                load_if_exists=True,
+            )
+        return optuna.create_study(sampler=sampler, direction="minimize", pruner=pruner)
+
+    def _get_study_storage(self, study_name: str) -> optuna.storages.BaseStorage | str:
+        """
+        Storage shared by all processes joining the study.
+        Either a database URL (e.g. sqlite:///study.sqlite), or the path of a journal file -
+        by default in the hyperopt results directory.
+        """
+        storage = self.config.get("hyperopt_study_storage")
+        if storage and "://" in storage:
+            return storage
+        path = (
+            Path(storage)
+            if storage
+            else self.config["user_data_dir"] / "hyperopt_results" / f"study_{study_name}.log"
+        )
+        return JournalStorage(JournalFileBackend(str(path)))
+
+    def get_batch_signals(self, params_list: list[dict[str, Any]]) -> list[CandidateSignals] | None:
+        """
+        Evaluate the strategy's conditions for a batch of epochs at once.
+        :param params_list: Parameter values of each epoch
+        :return: Signals of each epoch - None if each epoch evaluates the conditions itself.
+        """
+        if not self.signal_batching or not params_list:
+            return None
+        if self.batch_data is None:
+            with self.data_pickle_file.open("rb") as f:
+                self.batch_data = load(f, mmap_mode="r")
+        try:
+            return evaluate_signal_batch(self.backtesting.strategy, self.batch_data, params_list)
+        except OperationalException as e:
+            logger.warning(f"Evaluating conditions for each epoch: {e}")
+            self.signal_batching = False
+            return None
+
+    def _get_indicator_memo(self) -> IndicatorMemo | None:
+        """
+        Indicator memo for --analyze-per-epoch - reset when the hyperopt data changes.
+        """
+        global _indicator_memo, _indicator_memo_key
+        if self.indicator_memo_size <= 0:
+            return None
+        key = (str(self.data_pickle_file), self.data_pickle_file.stat().st_mtime_ns)
+        if _indicator_memo is None or _indicator_memo_key != key:
+            _indicator_memo = IndicatorMemo(self.indicator_memo_size * 1024 * 1024)
+            _indicator_memo_key = key
+        return _indicator_memo
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        memo = self._get_indicator_memo() if self.analyze_per_epoch else None
+        if memo is not None:
+            preprocessed = memo.advise_all_indicators(self.backtesting.strategy, data)
+        else:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -467,7 +706,48 @@ class HyperOptimizer:
                 f"up to {self.max_date.strftime(DATETIME_PRINT_FORMAT)} "
                 f"({(self.max_date - self.min_date).days} days).."
             )
+            # Evaluate dynamic pairlists once - reused by all epochs.
+            self.backtesting.prepare_pairlist_timeline(self.min_date, self.max_date)
             # Store non-trimmed data - will be trimmed after signal generation.
             dump(preprocessed, self.data_pickle_file)
         else:
             dump(data, self.data_pickle_file)
+        self.batch_data = None
+
+
+def _get_worker_optimizer(optimizer_file: Path, queue: Any, verbosity: int) -> HyperOptimizer:
+    """
+    Load the optimizer and the processed data once per worker process.
+    Reloaded if the optimizer file changes (a new hyperopt run reusing the worker).
+    """
+    global _worker_optimizer, _worker_optimizer_key, _worker_log_handler
+    key = (str(optimizer_file), optimizer_file.stat().st_mtime_ns)
+    if _worker_optimizer is None or _worker_optimizer_key != key:
+        # Release the previous optimizer before loading a new one.
+        _worker_optimizer = None
+        if _worker_log_handler:
+            logging.getLogger().removeHandler(_worker_log_handler)
+        _worker_log_handler = logging_mp_setup(queue, verbosity)
+
+        with optimizer_file.open("rb") as f:
+            optimizer: HyperOptimizer = cloudpickle.load(f)
+        with optimizer.data_pickle_file.open("rb") as f:
+            optimizer.processed = load(f, mmap_mode="r")
+        _worker_optimizer = optimizer
+        _worker_optimizer_key = key
+    return _worker_optimizer
+
+
+def generate_optimizer_pooled(
+    optimizer_file: Path,
+    queue: Any,
+    verbosity: int,
+    params_dict: dict[str, Any],
+    fraction: float = 1.0,
+    signals: CandidateSignals | None = None,
+) -> dict[str, Any]:
+    """
+    Run one epoch in a worker process of the worker pool.
+    """
+    optimizer = _get_worker_optimizer(optimizer_file, queue, verbosity)
+    return optimizer.generate_optimizer(params_dict, fraction=fraction, signals=signals)
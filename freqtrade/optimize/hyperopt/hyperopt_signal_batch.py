@@ -0,0 +1,102 @@
+"""
+Batched evaluation of strategy conditions for hyperopt.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import track_parameter_access
+
+
+logger = logging.getLogger(__name__)
+
+# Signals of one candidate - {pair: {signal column: indexes of the candles with the signal}}
+# Indexes instead of boolean arrays, as they are sent to the backtest job of each candidate.
+CandidateSignals = dict[str, dict[str, np.ndarray]]
+
+
+def evaluate_signal_batch(
+    strategy: IStrategy, data: dict[str, DataFrame], params_list: list[dict[str, Any]]
+) -> list[CandidateSignals]:
+    """
+    Evaluate the conditions of the strategy (populate_entry_conditions() /
+    populate_exit_conditions()) for a batch of candidates - in one vectorized pass per pair.
+    :param strategy: Strategy implementing conditions
+    :param data: Dictionary of <pair>: <DataFrame> with indicators
+    :param params_list: Parameter values of each candidate
+    :return: Signals of each candidate, in the order of params_list
+    :raises OperationalException: If the conditions can't be evaluated for a batch
+    """
+    parameters = dict(strategy.enumerate_parameters())
+    batched = {name for params in params_list for name in params if name in parameters}
+    values = {
+        name: np.array([[params.get(name, param.value) for params in params_list]])
+        for name, param in parameters.items()
+    }
+    batch_params = strategy.ft_signal_parameters(values)
+    count = len(params_list)
+
+    signals: list[CandidateSignals] = [{} for _ in params_list]
+    for pair, dataframe in data.items():
+        with track_parameter_access() as accessed:
+            try:
+                conditions = strategy.ft_evaluate_conditions(
+                    dataframe, {"pair": pair}, batch_params
+                )
+            except ValueError as e:
+                # Usually a dataframe column not converted with params.column()
+                raise OperationalException(
+                    f"Conditions can't be evaluated for a batch of parameter values: {e}"
+                ) from e
+        # Parameter objects only hold the value of a single candidate.
+        names = sorted(name for name in batched if parameters[name] in accessed)
+        if names:
+            raise OperationalException(
+                f"Conditions read the values of {', '.join(names)} from the parameter objects. "
+                "Use the parameter values passed to the conditions instead."
+            )
+        for column, condition in conditions.items():
+            condition = np.asarray(condition, dtype=bool)
+            if condition.ndim < 2:
+                # Condition not depending on parameter values
+                condition = condition.reshape(-1, 1)
+            try:
+                # One row per candidate
+                matrix = np.ascontiguousarray(np.broadcast_to(condition, (len(dataframe), count)).T)
+            except ValueError:
+                raise OperationalException(
+                    f"Condition for {column} has shape {condition.shape}, expected "
+                    f"({len(dataframe)}, {count}). Use params.column() for dataframe columns."
+                ) from None
+            for idx in range(count):
+                signals[idx].setdefault(pair, {})[column] = np.flatnonzero(matrix[idx]).astype(
+                    np.int32
+                )
+    return signals
+
+
+def expand_signals(
+    signals: CandidateSignals, data: dict[str, DataFrame]
+) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Boolean signal columns of a candidate, as used by the backtest.
+    :param signals: Signals of one candidate from evaluate_signal_batch()
+    :param data: Dictionary of <pair>: <DataFrame> to backtest - may be cut short (pruning)
+    :return: Dictionary of <pair>: {<signal column>: <boolean array>}
+    """
+    expanded: dict[str, dict[str, np.ndarray]] = {}
+    for pair, pair_signals in signals.items():
+        if pair not in data:
+            continue
+        length = len(data[pair])
+        expanded[pair] = {}
+        for column, indexes in pair_signals.items():
+            values = np.zeros(length, dtype=bool)
+            values[indexes[indexes < length]] = True
+            expanded[pair][column] = values
+    return expanded
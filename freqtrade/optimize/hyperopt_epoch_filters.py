@@ -23,15 +23,19 @@ def hyperopt_filter_epochs(epochs: list, filteroptions: dict, log: bool = True)
 
     epochs = _hyperopt_filter_epochs_objective(epochs, filteroptions)
     if log:
-        logger.info(
-            f"{len(epochs)} "
-            + ("best " if filteroptions["only_best"] else "")
-            + ("profitable " if filteroptions["only_profitable"] else "")
-            + "epochs found."
-        )
+        log_filtered_epochs(epochs, filteroptions)
     return epochs
 
 
+def log_filtered_epochs(epochs: list, filteroptions: dict) -> None:
+    logger.info(
+        f"{len(epochs)} "
+        + ("best " if filteroptions["only_best"] else "")
+        + ("profitable " if filteroptions["only_profitable"] else "")
+        + "epochs found."
+    )
+
+
 def _hyperopt_filter_epochs_trade(epochs: list, trade_count: int):
     """
     Filter epochs with trade-counts > trades
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_calmar
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -27,6 +27,7 @@ class CalmarHyperOptLoss(IHyperOptLoss):
         max_date: datetime,
         starting_balance: float,
         *args,
+        metrics: MetricsContext | None = None,
         **kwargs,
     ) -> float:
         """
@@ -34,6 +35,8 @@ class CalmarHyperOptLoss(IHyperOptLoss):
 
         Uses Calmar Ratio calculation.
         """
-        calmar_ratio = calculate_calmar(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = MetricsContext(results, min_date, max_date, starting_balance)
+        calmar_ratio = metrics.calmar
         # print(expected_returns_mean, max_drawdown, calmar_ratio)
         return -calmar_ratio
@@ -10,6 +10,7 @@ from typing import Any
 from pandas import DataFrame
 
 from freqtrade.constants import Config
+from freqtrade.data.metrics import MetricsContext
 
 
 class IHyperOptLoss(ABC):
@@ -32,6 +33,7 @@ class IHyperOptLoss(ABC):
         processed: dict[str, DataFrame],
         backtest_stats: dict[str, Any],
         starting_balance: float,
+        metrics: MetricsContext,
         **kwargs,
     ) -> float:
         """
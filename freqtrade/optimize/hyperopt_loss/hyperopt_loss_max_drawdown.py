@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -28,6 +28,7 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
         min_date: datetime,
         max_date: datetime,
         *args,
+        metrics: MetricsContext | None = None,
         **kwargs,
     ) -> float:
         """
@@ -36,10 +37,11 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
         Uses profit ratio weighted max_drawdown when drawdown is available.
         Otherwise directly optimizes profit ratio.
         """
-        total_profit = results["profit_abs"].sum()
-        try:
-            max_drawdown = calculate_max_drawdown(results, value_col="profit_abs")
-        except ValueError:
-            # No losing trade, therefore no drawdown.
+        if metrics is None:
+            metrics = MetricsContext(results, min_date, max_date, 0)
+        total_profit = metrics.profit_total_abs
+        max_drawdown = metrics.max_drawdown
+        if max_drawdown is None:
+            # No trade, therefore no drawdown.
             return -total_profit
         return -total_profit / max_drawdown.drawdown_abs
@@ -33,7 +33,7 @@ TARGET_TRADE_AMOUNT variable sets the minimum number of trades required to avoid
 import numpy as np
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_expectancy, calculate_max_drawdown
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -57,18 +57,19 @@ class MultiMetricHyperOptLoss(IHyperOptLoss):
         results: DataFrame,
         trade_count: int,
         starting_balance: float,
+        metrics: MetricsContext | None = None,
         **kwargs,
     ) -> float:
-        total_profit = results["profit_abs"].sum()
+        if metrics is None:
+            metrics = MetricsContext(results, None, None, starting_balance)
+        total_profit = metrics.profit_total_abs
 
         # Calculate profit factor
-        winning_profit = results.loc[results["profit_abs"] > 0, "profit_abs"].sum()
-        losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
-        profit_factor = winning_profit / (abs(losing_profit) + 1e-6)
+        profit_factor = metrics.winning_profit / (abs(metrics.losing_profit) + 1e-6)
         log_profit_factor = np.log(profit_factor + PF_CONST)
 
         # Calculate expectancy
-        _, expectancy_ratio = calculate_expectancy(results)
+        _, expectancy_ratio = metrics.expectancy
         log_expectancy_ratio = np.log(min(10, expectancy_ratio) + EXPECTANCY_CONST)
 
         # Calculate winrate
@@ -77,13 +78,7 @@ class MultiMetricHyperOptLoss(IHyperOptLoss):
         log_winrate_coef = np.log(WINRATE_CONST + winrate)
 
         # Calculate drawdown
-        try:
-            drawdown = calculate_max_drawdown(
-                results, starting_balance=starting_balance, value_col="profit_abs"
-            )
-            relative_account_drawdown = drawdown.relative_account_drawdown
-        except ValueError:
-            relative_account_drawdown = 0
+        relative_account_drawdown = metrics.relative_account_drawdown
 
         # Trade Count Penalty
         trade_count_penalty = 1.0  # Default: no penalty
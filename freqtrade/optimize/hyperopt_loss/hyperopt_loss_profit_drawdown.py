@@ -10,7 +10,7 @@ individual needs.
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -21,17 +21,16 @@ DRAWDOWN_MULT = 0.075
 class ProfitDrawDownHyperOptLoss(IHyperOptLoss):
     @staticmethod
     def hyperopt_loss_function(
-        results: DataFrame, starting_balance: float, *args, **kwargs
+        results: DataFrame,
+        starting_balance: float,
+        *args,
+        metrics: MetricsContext | None = None,
+        **kwargs,
     ) -> float:
-        total_profit = results["profit_abs"].sum()
-
-        try:
-            drawdown = calculate_max_drawdown(
-                results, starting_balance=starting_balance, value_col="profit_abs"
-            )
-            relative_account_drawdown = drawdown.relative_account_drawdown
-        except ValueError:
-            relative_account_drawdown = 0
+        if metrics is None:
+            metrics = MetricsContext(results, None, None, starting_balance)
+        total_profit = metrics.profit_total_abs
+        relative_account_drawdown = metrics.relative_account_drawdown
 
         return -1 * (
             total_profit - (relative_account_drawdown * total_profit) * (1 - DRAWDOWN_MULT)
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sharpe
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -27,6 +27,7 @@ class SharpeHyperOptLoss(IHyperOptLoss):
         max_date: datetime,
         starting_balance: float,
         *args,
+        metrics: MetricsContext | None = None,
         **kwargs,
     ) -> float:
         """
@@ -34,6 +35,8 @@ class SharpeHyperOptLoss(IHyperOptLoss):
 
         Uses Sharpe Ratio calculation.
         """
-        sharp_ratio = calculate_sharpe(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = MetricsContext(results, min_date, max_date, starting_balance)
+        sharp_ratio = metrics.sharpe
         # print(expected_returns_mean, up_stdev, sharp_ratio)
         return -sharp_ratio
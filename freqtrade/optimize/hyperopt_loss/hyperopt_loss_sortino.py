@@ -9,7 +9,7 @@ from datetime import datetime
 
 from pandas import DataFrame
 
-from freqtrade.data.metrics import calculate_sortino
+from freqtrade.data.metrics import MetricsContext
 from freqtrade.optimize.hyperopt import IHyperOptLoss
 
 
@@ -27,6 +27,7 @@ class SortinoHyperOptLoss(IHyperOptLoss):
         max_date: datetime,
         starting_balance: float,
         *args,
+        metrics: MetricsContext | None = None,
         **kwargs,
     ) -> float:
         """
@@ -34,6 +35,8 @@ class SortinoHyperOptLoss(IHyperOptLoss):
 
         Uses Sortino Ratio calculation.
         """
-        sortino_ratio = calculate_sortino(results, min_date, max_date, starting_balance)
+        if metrics is None:
+            metrics = MetricsContext(results, min_date, max_date, starting_balance)
+        sortino_ratio = metrics.sortino
         # print(expected_returns_mean, down_stdev, sortino_ratio)
         return -sortino_ratio
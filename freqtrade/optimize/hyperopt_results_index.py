@@ -0,0 +1,289 @@
+"""
+SQLite index of hyperopt results files.
+"""
+
+import logging
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+
+from freqtrade.exceptions import OperationalException
+
+
+logger = logging.getLogger(__name__)
+
+# Increase when changing the schema - the index is rebuilt from the results file.
+INDEX_VERSION = 1
+
+# Conditions matching the filters of hyperopt_filter_epochs(), in the same order.
+# Trade count filters are only applied with a value > 0, all others if they are set.
+FILTER_CONDITIONS = [
+    ("filter_min_trades", "COALESCE(total_trades, 0) > ?"),
+    ("filter_max_trades", "total_trades < ?"),
+    ("filter_min_avg_time", "holding_avg_min > ?"),
+    ("filter_max_avg_time", "holding_avg_min < ?"),
+    ("filter_min_avg_profit", "COALESCE(profit_mean, 0) * 100 > ?"),
+    ("filter_max_avg_profit", "COALESCE(profit_mean, 0) * 100 < ?"),
+    ("filter_min_total_profit", "COALESCE(profit_total_abs, 0) > ?"),
+    ("filter_max_total_profit", "COALESCE(profit_total_abs, 0) < ?"),
+    ("filter_min_objective", "loss < ?"),
+    ("filter_max_objective", "loss > ?"),
+]
+TRADE_COUNT_FILTERS = ("filter_min_trades", "filter_max_trades")
+
+
+def get_hyperopt_index_filename(results_file: Path) -> Path:
+    return results_file.with_name(f"{results_file.name}.index.sqlite")
+
+
+def open_hyperopt_results_index(results_file: Path) -> "HyperoptResultsIndex":
+    """
+    Open and sync the index of a results file.
+    If the index can't be written (e.g. in a read-only directory), an in-memory index is used.
+    """
+    try:
+        index = HyperoptResultsIndex(results_file)
+        try:
+            index.sync()
+        except sqlite3.Error:
+            index.close()
+            raise
+    except sqlite3.Error as e:
+        logger.warning(f"Could not use hyperopt results index of {results_file}: {e}")
+        index = HyperoptResultsIndex(results_file, ":memory:")
+        index.sync()
+    return index
+
+
+class HyperoptResultsIndex:
+    """
+    Index of the epochs in one hyperopt results file (.fthypt).
+    Each epoch is stored with the metrics used by the hyperopt-list filters in indexed columns,
+    a summary (the epoch with only the scalar results metrics) and its location in the results
+    file - so epochs can be filtered and listed without parsing the complete results file,
+    and single epochs are read from the results file directly.
+    Results files are only appended to - so only new epochs are read on each sync.
+    The index can be deleted and rebuilt at any time.
+    """
+
+    def __init__(self, results_file: Path, database: Path | str | None = None) -> None:
+        """
+        :param results_file: Hyperopt results file
+        :param database: Path to the index file, or ":memory:".
+            Defaults to <results_file>.index.sqlite
+        """
+        self._results_file = results_file
+        self._conn = sqlite3.connect(
+            database or get_hyperopt_index_filename(results_file), timeout=30, isolation_level=None
+        )
+        try:
+            self._init_schema()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def __enter__(self) -> "HyperoptResultsIndex":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM epochs").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == INDEX_VERSION:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute("DROP TABLE IF EXISTS epochs")
+            self._conn.execute("DROP TABLE IF EXISTS state")
+            self._conn.execute(
+                """
+                CREATE TABLE epochs (
+                    position INTEGER PRIMARY KEY,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    loss REAL,
+                    is_best INTEGER NOT NULL,
+                    total_trades INTEGER,
+                    profit_mean REAL,
+                    profit_total REAL,
+                    profit_total_abs REAL,
+                    holding_avg_min REAL,
+                    summary TEXT NOT NULL
+                )
+                """
+            )
+            for column in ("loss", "total_trades", "profit_total_abs"):
+                self._conn.execute(f"CREATE INDEX epochs_{column} ON epochs ({column})")
+            # Size of the indexed part of the results file, and location / checksum of the
+            # last indexed epoch - to detect replaced results files.
+            self._conn.execute(
+                "CREATE TABLE state (size INTEGER NOT NULL, last_offset INTEGER NOT NULL, "
+                "last_crc INTEGER NOT NULL)"
+            )
+            self._conn.execute("INSERT INTO state VALUES (0, 0, 0)")
+            self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def sync(self) -> None:
+        """
+        Add the epochs appended to the results file since the last sync.
+        The index is rebuilt if the results file was replaced.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._sync()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _sync(self) -> None:
+        size, last_offset, last_crc = self._conn.execute(
+            "SELECT size, last_offset, last_crc FROM state"
+        ).fetchone()
+        with self._results_file.open("rb") as f:
+            if size > 0:
+                f.seek(last_offset)
+                if zlib.crc32(f.read(size - last_offset)) != last_crc:
+                    logger.info(f"Rebuilding the hyperopt results index of {self._results_file}.")
+                    self._conn.execute("DELETE FROM epochs")
+                    size = last_offset = last_crc = 0
+            position = len(self)
+            offset = size
+            rows = []
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Epoch which is still being written
+                    break
+                if line.strip():
+                    epoch = rapidjson.loads(line)
+                    if position == 0 and epoch.get("is_best") is None:
+                        raise OperationalException(
+                            "The file with HyperoptTools results is incompatible with this "
+                            "version of Freqtrade and cannot be loaded."
+                        )
+                    rows.append(self._get_row(position, offset, len(line), epoch))
+                    position += 1
+                    last_offset = offset
+                offset += len(line)
+            if offset > size:
+                f.seek(last_offset)
+                last_crc = zlib.crc32(f.read(offset - last_offset))
+
+        self._conn.executemany(
+            f"INSERT INTO epochs VALUES ({', '.join('?' * 11)})",
+            rows,
+        )
+        self._conn.execute(
+            "UPDATE state SET size = ?, last_offset = ?, last_crc = ?",
+            (offset, last_offset, last_crc),
+        )
+
+    @staticmethod
+    def _get_row(position: int, offset: int, length: int, epoch: dict[str, Any]) -> tuple:
+        metrics = epoch.get("results_metrics", {})
+        summary = {
+            **epoch,
+            "results_metrics": {
+                key: value for key, value in metrics.items() if not isinstance(value, list | dict)
+            },
+        }
+        holding_avg_s = metrics.get("holding_avg_s")
+        return (
+            position,
+            offset,
+            length,
+            epoch["loss"],
+            bool(epoch["is_best"]),
+            metrics.get("total_trades"),
+            metrics.get("profit_mean"),
+            metrics.get("profit_total"),
+            metrics.get("profit_total_abs"),
+            holding_avg_s // 60 if holding_avg_s is not None else None,
+            rapidjson.dumps(summary),
+        )
+
+    def _get_filter_conditions(self, filteroptions: dict[str, Any]) -> tuple[list[str], list]:
+        conditions = []
+        params: list[Any] = []
+        if filteroptions["only_best"]:
+            conditions.append("is_best")
+        if filteroptions["only_profitable"]:
+            conditions.append("COALESCE(profit_total, 0) > 0")
+        for option, condition in FILTER_CONDITIONS:
+            value = filteroptions[option]
+            if option in TRADE_COUNT_FILTERS:
+                if (value or 0) <= 0:
+                    continue
+            elif value is None:
+                continue
+            else:
+                conditions.append("COALESCE(total_trades, 0) > 0")
+            if option in ("filter_min_avg_time", "filter_max_avg_time"):
+                self._check_holding_avg(conditions, params)
+            conditions.append(condition)
+            params.append(value)
+        return conditions, params
+
+    def _check_holding_avg(self, conditions: list[str], params: list) -> None:
+        missing = self._conn.execute(
+            f"SELECT 1 FROM epochs WHERE {' AND '.join(conditions)} "
+            "AND holding_avg_min IS NULL LIMIT 1",
+            params,
+        ).fetchone()
+        if missing:
+            raise OperationalException(
+                "Holding-average not available. Please omit the filter on average time, "
+                "or rerun hyperopt with this version"
+            )
+
+    def query(self, filteroptions: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Summaries of the epochs matching the filters, in the order of the results file.
+        Applies the same filters as hyperopt_filter_epochs().
+        Summaries only contain the scalar results metrics, plus the position of the epoch.
+        :param filteroptions: Filter options, as used by hyperopt_filter_epochs()
+        """
+        conditions, params = self._get_filter_conditions(filteroptions)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._conn.execute(
+            f"SELECT position, summary FROM epochs {where} ORDER BY position", params
+        ).fetchall()
+        return [{**rapidjson.loads(summary), "position": position} for position, summary in rows]
+
+    def get_best_position(self) -> int | None:
+        """
+        Position of the epoch with the lowest loss (the first one, if multiple epochs share it).
+        """
+        row = self._conn.execute(
+            "SELECT position FROM epochs WHERE loss IS NOT NULL ORDER BY loss, position LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_epoch(self, position: int) -> dict[str, Any]:
+        """
+        Complete epoch, read from the results file.
+        :param position: Position of the epoch in the results file (0-based)
+        """
+        row = self._conn.execute(
+            "SELECT offset, length FROM epochs WHERE position = ?", (position,)
+        ).fetchone()
+        if row is None:
+            raise OperationalException(f"Epoch at position {position} not found.")
+        with self._results_file.open("rb") as f:
+            f.seek(row[0])
+            return rapidjson.loads(f.read(row[1]))
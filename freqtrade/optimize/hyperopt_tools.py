@@ -13,7 +13,8 @@ from freqtrade.constants import FTHYPT_FILEVERSION, HYPEROPT_BUILTIN_SPACES, Con
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_dict, safe_value_fallback2
-from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_epoch_filters import log_filtered_epochs
+from freqtrade.optimize.hyperopt_results_index import open_hyperopt_results_index
 
 
 logger = logging.getLogger(__name__)
@@ -144,7 +145,17 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+    def load_filtered_results(
+        results_file: Path, config: Config, details: bool = True
+    ) -> tuple[list, int]:
+        """
+        Load the epochs matching the hyperopt-list filters of the configuration.
+        Epochs are filtered using the results index - only matching epochs are read.
+        :param details: Load the complete epochs. Otherwise, only summaries are loaded -
+            without nested results metrics, but with the position of the epoch
+            (see load_epoch_details()).
+        :return: tuple of the epochs and the total number of epochs
+        """
         filteroptions = {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
@@ -164,24 +175,27 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded."
-                )
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
-
-        logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
+        logger.info(f"Reading epochs from '{results_file}'")
+        with open_hyperopt_results_index(results_file) as index:
+            total_epochs = len(index)
+            logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
+            epochs = index.query(filteroptions)
+            if details:
+                epochs = [index.get_epoch(epoch["position"]) for epoch in epochs]
 
-        # Final filter run ...
-        epochs = hyperopt_filter_epochs(epochs, filteroptions, log=True)
+        log_filtered_epochs(epochs, filteroptions)
 
         return epochs, total_epochs
 
+    @staticmethod
+    def load_epoch_details(results_file: Path, epoch: dict[str, Any]) -> dict[str, Any]:
+        """
+        Load the complete epoch from the results file.
+        :param epoch: Epoch summary, as returned by load_filtered_results(details=False)
+        """
+        with open_hyperopt_results_index(results_file) as index:
+            return index.get_epoch(epoch["position"])
+
     @staticmethod
     def show_epoch_details(
         results,
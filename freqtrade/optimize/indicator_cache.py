@@ -0,0 +1,282 @@
+"""
+On-disk cache of analyzed (post populate_indicators) dataframes for backtesting.
+
+Entries are content-addressed - the key combines a hash of the strategy source,
+a hash of the strategy parameters and the state of the pair's data file (plus the first
+loaded candle). Entries are trimmed to the loaded candles - so backtests ending earlier reuse
+the entry of a longer backtest.
+Changing any of these results in a new entry, so entries are never invalidated explicitly.
+Old entries are evicted once the cache exceeds its size limit (least recently used first).
+"""
+
+import hashlib
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import rapidjson
+from pandas import DataFrame, RangeIndex, read_feather
+from pandas.util import hash_pandas_object
+
+from freqtrade import __version__, constants
+from freqtrade.constants import Config
+from freqtrade.data.history.datahandlers.idatahandler import get_datahandlerclass
+from freqtrade.enums import CandleType
+from freqtrade.misc import pair_to_filename
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Configuration keys the indicators may depend on.
+RELEVANT_CONFIG_KEYS = (
+    "timeframe",
+    "stake_currency",
+    "trading_mode",
+    "margin_mode",
+    "candle_type_def",
+)
+
+
+@dataclass
+class IndicatorCacheEntry:
+    strategy: str
+    pair: str
+    timeframe: str
+    size: int
+    last_used: datetime
+
+
+def get_indicator_cache_dir(config: Config) -> Path:
+    return config["user_data_dir"] / "cache" / "indicators"
+
+
+class IndicatorCache:
+    """
+    Cache of analyzed dataframes, one file per strategy / pair / candle data combination.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._cache_dir = get_indicator_cache_dir(config)
+        self._max_size = (
+            config.get("backtest_indicator_cache_size", constants.INDICATOR_CACHE_SIZE_DEFAULT)
+            * 1024
+            * 1024
+        )
+
+    @staticmethod
+    def get_source_hash(strategy: IStrategy) -> str:
+        """
+        Hash of the strategy source - including user defined base classes.
+        """
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(__version__.encode("utf-8"))
+        files = [Path(strategy.__file__)]
+        for cls in type(strategy).__mro__[1:]:
+            if cls.__module__.split(".")[0] in ("freqtrade", "builtins"):
+                continue
+            mod_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+            if mod_file and Path(mod_file) not in files:
+                files.append(Path(mod_file))
+        for file in files:
+            digest.update(file.read_bytes())
+        return digest.hexdigest().lower()
+
+    def get_params_hash(self, strategy: IStrategy) -> str:
+        """
+        Hash of everything besides the source and the pair's candles
+        the indicators may depend on.
+        Informative pairs are included through the state (size, modification time)
+        of their data files.
+        """
+        digest = hashlib.sha1()  # noqa: S324
+        params = {name: param.value for name, param in strategy.enumerate_parameters()}
+        config = {key: self._config.get(key) for key in RELEVANT_CONFIG_KEYS}
+        informative_files = {}
+        handler = get_datahandlerclass(self._config.get("dataformat_ohlcv", "feather"))
+        for pair, timeframe, candle_type in sorted(strategy.gather_informative_pairs()):
+            filename = handler._pair_data_filename(
+                self._config["datadir"], pair, timeframe, candle_type
+            )
+            stat = filename.stat() if filename.is_file() else None
+            informative_files[str(filename)] = (stat.st_size, stat.st_mtime_ns) if stat else None
+        digest.update(
+            rapidjson.dumps(
+                [params, strategy._ft_params_from_file, config, informative_files],
+                default=str,
+                number_mode=rapidjson.NM_NAN,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest().lower()
+
+    def get_data_key(self, pair: str, dataframe: DataFrame) -> str:
+        """
+        Key of the candle data of one pair - independent of the end of the loaded timerange.
+        Uses the state (size, modification time) of the pair's data file and the first
+        loaded candle - or a hash of the candles if the data file doesn't exist.
+        """
+        handler = get_datahandlerclass(self._config.get("dataformat_ohlcv", "feather"))
+        filename = handler._pair_data_filename(
+            self._config["datadir"],
+            pair,
+            self._config["timeframe"],
+            self._config.get("candle_type_def", CandleType.SPOT),
+        )
+        if not filename.is_file() or dataframe.empty or "date" not in dataframe:
+            return self.get_data_hash(dataframe)
+        stat = filename.stat()
+        return (
+            f"{filename.name}-{stat.st_size}-{stat.st_mtime_ns}-"
+            f"{dataframe['date'].iloc[0].isoformat()}-{','.join(map(str, dataframe.columns))}"
+        )
+
+    @staticmethod
+    def get_data_hash(dataframe: DataFrame) -> str:
+        """
+        Hash of the candle data of one pair.
+        """
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(",".join(map(str, dataframe.columns)).encode("utf-8"))
+        digest.update(hash_pandas_object(dataframe, index=False).to_numpy().tobytes())
+        return digest.hexdigest().lower()
+
+    def _get_filename(self, strategy_name: str, pair: str, key: str) -> Path:
+        return (
+            self._cache_dir
+            / strategy_name
+            / f"{pair_to_filename(pair)}-{self._config['timeframe']}-{key}.feather"
+        )
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Cached equivalent of strategy.advise_all_indicators().
+        Only pairs without a matching cache entry are analyzed.
+        :param strategy: Strategy to analyze the data with
+        :param data: Dictionary of <pair>: <DataFrame> with candle data
+        :return: Dictionary of <pair>: <DataFrame> with indicators
+        """
+        strategy_name = strategy.get_strategy_name()
+        strategy_key = hashlib.sha1(  # noqa: S324
+            (self.get_source_hash(strategy) + self.get_params_hash(strategy)).encode("utf-8")
+        ).hexdigest()
+
+        result: dict[str, DataFrame] = {}
+        missing: dict[str, DataFrame] = {}
+        filenames: dict[str, Path] = {}
+        for pair, pair_data in data.items():
+            key = hashlib.sha1(  # noqa: S324
+                (strategy_key + self.get_data_key(pair, pair_data)).encode("utf-8")
+            ).hexdigest()
+            filenames[pair] = filename = self._get_filename(strategy_name, pair, key)
+            if filename.is_file():
+                try:
+                    cached = self._trim_cached(read_feather(filename), pair_data)
+                    if cached is not None:
+                        result[pair] = cached
+                        # Update modification time - used as "last used" for eviction
+                        os.utime(filename)
+                        continue
+                except Exception as e:
+                    logger.warning(f"Could not load cached indicators for {pair}: {e}")
+            # Missing - or covering fewer candles (the timerange was extended).
+            missing[pair] = pair_data
+
+        logger.info(
+            f"Loaded indicators for {len(result)} of {len(data)} pairs from the indicator cache."
+        )
+        if missing:
+            analyzed = strategy.advise_all_indicators(missing)
+            filenames[next(iter(missing))].parent.mkdir(parents=True, exist_ok=True)
+            for pair, df in analyzed.items():
+                result[pair] = df
+                self._store(filenames[pair], df)
+            self.evict()
+        return {pair: result[pair] for pair in data}
+
+    @staticmethod
+    def _trim_cached(cached: DataFrame, dataframe: DataFrame) -> DataFrame | None:
+        """
+        Trim a cached dataframe to the loaded candles.
+        :return: Analyzed dataframe of the loaded candles - None if the entry doesn't
+            start with exactly these candles.
+        """
+        length = len(dataframe)
+        if len(cached) < length:
+            return None
+        if len(cached) > length:
+            cached = cached.iloc[:length].copy()
+        candles = dataframe.reset_index(drop=True)
+        for column in candles.columns:
+            if column not in cached or not cached[column].equals(candles[column]):
+                return None
+        return cached
+
+    def _store(self, filename: Path, dataframe: DataFrame) -> None:
+        if not dataframe.index.equals(RangeIndex(len(dataframe))):
+            # The index isn't stored - so it must be the default index.
+            return
+        tmp_file = filename.with_suffix(".tmp")
+        try:
+            dataframe.reset_index(drop=True).to_feather(tmp_file, compression="lz4")
+            tmp_file.replace(filename)
+        except Exception as e:
+            # Dataframes with columns feather can't represent are simply not cached.
+            logger.debug(f"Could not cache indicators in {filename.name}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def get_entries(self) -> list[IndicatorCacheEntry]:
+        """
+        List all cache entries.
+        """
+        entries = []
+        for file in self._cache_dir.glob("*/*.feather"):
+            stat = file.stat()
+            pair, timeframe, _ = file.stem.rsplit("-", 2)
+            entries.append(
+                IndicatorCacheEntry(
+                    strategy=file.parent.name,
+                    pair=pair,
+                    timeframe=timeframe,
+                    size=stat.st_size,
+                    last_used=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+                )
+            )
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its size limit.
+        :return: Number of removed entries
+        """
+        files = [(file, file.stat()) for file in self._cache_dir.glob("*/*.feather")]
+        total = sum(stat.st_size for _, stat in files)
+        removed = 0
+        for file, stat in sorted(files, key=lambda x: x[1].st_mtime_ns):
+            if total <= self._max_size:
+                break
+            file.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} entries from the indicator cache.")
+        return removed
+
+    def purge(self) -> int:
+        """
+        Remove all entries.
+        :return: Number of removed entries
+        """
+        removed = 0
+        for file in self._cache_dir.glob("*/*.feather"):
+            file.unlink()
+            removed += 1
+        for directory in self._cache_dir.glob("*/"):
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+        return removed
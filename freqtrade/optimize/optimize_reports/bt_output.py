@@ -193,6 +193,34 @@ def text_table_strategy(strategy_results, stake_currency: str, title: str):
     print_rich_table(output, headers, summary=title)
 
 
+def text_table_callback_profile(profile: list[dict[str, Any]]) -> None:
+    """
+    Print duration statistics of strategy callbacks and backtesting phases.
+    Durations are shown in milliseconds.
+    """
+    headers = [
+        "Name",
+        "Type",
+        "Calls",
+        "Total ms",
+        "Mean ms",
+        "p50 ms",
+        "p95 ms",
+        "p99 ms",
+        "Max ms",
+    ]
+    output = [
+        [
+            stat["name"],
+            stat["type"],
+            stat["calls"],
+            *(f"{stat[key] * 1000:.3f}" for key in ("total", "mean", "p50", "p95", "p99", "max")),
+        ]
+        for stat in profile
+    ]
+    print_rich_table(output, headers, summary="CALLBACK PROFILE")
+
+
 def text_table_add_metrics(strat_results: dict) -> None:
     stake = strat_results["stake_currency"]
     if len(strat_results["trades"]) > 0:
@@ -475,6 +503,9 @@ def show_backtest_result(
 
     text_table_add_metrics(results)
 
+    if profile := results.get("callback_profile"):
+        text_table_callback_profile(profile)
+
     print()
 
 
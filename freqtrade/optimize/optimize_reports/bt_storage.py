@@ -2,12 +2,15 @@ import logging
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Any
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+import rapidjson
 from pandas import DataFrame
+from pyarrow import ArrowException
 
 from freqtrade.configuration import sanitize_config
 from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.data.btanalysis import update_backtest_catalog
 from freqtrade.enums.runmode import RunMode
 from freqtrade.ft_types import BacktestResultType
 from freqtrade.misc import dump_json_to_file, file_dump_json
@@ -17,16 +20,57 @@ from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
 logger = logging.getLogger(__name__)
 
 
-def file_dump_joblib(file_obj: BytesIO, data: Any, log: bool = True) -> None:
+def _dump_trades_parquet(trades: list[dict[str, Any]]) -> bytes:
     """
-    Dump object data into a file
-    :param filename: file to create
-    :param data: Object data to save
-    :return:
+    Convert the trade list of one strategy to parquet.
+    Orders are stored as json strings, as they don't have a fixed schema.
     """
-    import joblib
-
-    joblib.dump(data, file_obj)
+    df = DataFrame(trades)
+    if "orders" in df.columns:
+        df["orders"] = [
+            rapidjson.dumps(orders, default=str, number_mode=rapidjson.NM_NATIVE)
+            for orders in df["orders"]
+        ]
+    buf = BytesIO()
+    df.to_parquet(buf, index=False, compression="zstd")
+    return buf.getvalue()
+
+
+def _store_analysis_feather(
+    zipf: ZipFile, base_name: str, name: str, analysis: dict[str, dict[str, DataFrame]]
+) -> None:
+    """
+    Store one feather member per strategy and pair - so single pairs can be loaded.
+    The member of each strategy / pair is listed in the index member <base_name>_<name>.json.
+    Falls back to a single pickle member <base_name>_<name>.pkl if a dataframe can't be
+    converted to feather (e.g. object columns with mixed types).
+    """
+    index: dict[str, dict[str, str]] = {}
+    members: list[tuple[str, bytes]] = []
+    try:
+        for strategy, pair_data in analysis.items():
+            index[strategy] = {}
+            for pair, df in pair_data.items():
+                member = f"{base_name}_{name}_{len(members):05d}.feather"
+                buf = BytesIO()
+                df.reset_index(drop=True).to_feather(buf, compression="lz4")
+                members.append((member, buf.getvalue()))
+                index[strategy][pair] = member
+    except ArrowException as e:
+        logger.warning(f"Could not store {name} candles as feather, using pickle instead: {e}")
+        import joblib
+
+        pickle_buf = BytesIO()
+        joblib.dump(analysis, pickle_buf)
+        zipf.writestr(f"{base_name}_{name}.pkl", pickle_buf.getvalue())
+        return
+
+    for member, data in members:
+        # Feather is compressed already - storing it uncompressed keeps the member seekable.
+        zipf.writestr(member, data, compress_type=ZIP_STORED)
+    index_buf = StringIO()
+    dump_json_to_file(index_buf, index)
+    zipf.writestr(f"{base_name}_{name}.json", index_buf.getvalue())
 
 
 def _generate_filename(recordfilename: Path, appendix: str, suffix: str) -> Path:
@@ -78,15 +122,28 @@ def store_backtest_results(
 
     # Create zip file and add the files
     with ZipFile(zip_filename, "w", ZIP_DEFLATED) as zipf:
-        # Store stats
+        # Store stats - trades are stored as parquet only, and restored by load_backtest_stats().
         stats_copy = {
-            "strategy": stats["strategy"],
+            "strategy": {
+                strategy_name: {k: v for k, v in strategy_stats.items() if k != "trades"}
+                for strategy_name, strategy_stats in stats["strategy"].items()
+            },
             "strategy_comparison": stats["strategy_comparison"],
         }
         stats_buf = StringIO()
         dump_json_to_file(stats_buf, stats_copy)
         zipf.writestr(json_filename.name, stats_buf.getvalue())
 
+        # Trades of each strategy as parquet - to load trades without parsing the full stats.
+        # Strategies without trades have no parquet member.
+        for strategy_name, strategy_stats in stats["strategy"].items():
+            if strategy_stats["trades"]:
+                zipf.writestr(
+                    f"{base_filename.stem}_{strategy_name}_trades.parquet",
+                    _dump_trades_parquet(strategy_stats["trades"]),
+                    compress_type=ZIP_STORED,
+                )
+
         config_buf = StringIO()
         dump_json_to_file(config_buf, sanitize_config(config["original_config"]))
         zipf.writestr(f"{base_filename.stem}_config.json", config_buf.getvalue())
@@ -131,10 +188,7 @@ def store_backtest_results(
         ):
             for name in ["signals", "rejected", "exited"]:
                 if name in analysis_results:
-                    analysis_name = f"{base_filename.stem}_{name}.pkl"
-                    analysis_buf = BytesIO()
-                    file_dump_joblib(analysis_buf, analysis_results[name])
-                    analysis_buf.seek(0)
-                    zipf.writestr(analysis_name, analysis_buf.getvalue())
+                    _store_analysis_feather(zipf, base_filename.stem, name, analysis_results[name])
 
+    update_backtest_catalog(zip_filename)
     return zip_filename
@@ -8,15 +8,10 @@ from pandas import DataFrame, Series, concat, to_datetime
 
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
 from freqtrade.data.metrics import (
+    MetricsContext,
     calculate_cagr,
-    calculate_calmar,
     calculate_csum,
-    calculate_expectancy,
     calculate_market_change,
-    calculate_max_drawdown,
-    calculate_sharpe,
-    calculate_sortino,
-    calculate_sqn,
 )
 from freqtrade.ft_types import (
     BacktestContentType,
@@ -79,26 +74,22 @@ def _generate_result_line(
     max_date: datetime,
     starting_balance: float,
     first_column: str | list[str],
+    metrics: MetricsContext | None = None,
 ) -> dict:
     """
     Generate one result dict, with "first_column" as key.
+    :param metrics: Metrics of result, if already available
     """
+    if metrics is None:
+        metrics = MetricsContext(result, min_date, max_date, starting_balance)
     # (end-capital - starting capital) / starting capital
-    profit_total = result["profit_abs"].sum() / starting_balance
+    profit_total = metrics.profit_total_abs / starting_balance
     backtest_days = (max_date - min_date).days or 1
-    final_balance = starting_balance + result["profit_abs"].sum()
-    expectancy, expectancy_ratio = calculate_expectancy(result)
-    winning_profit = result.loc[result["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = result.loc[result["profit_abs"] < 0, "profit_abs"].sum()
-    profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
-
-    try:
-        drawdown = calculate_max_drawdown(
-            result, value_col="profit_abs", starting_balance=starting_balance
-        )
-
-    except ValueError:
-        drawdown = None
+    final_balance = starting_balance + metrics.profit_total_abs
+    expectancy, expectancy_ratio = metrics.expectancy
+    losing_profit = metrics.losing_profit
+    profit_factor = metrics.winning_profit / abs(losing_profit) if losing_profit else 0.0
+    drawdown = metrics.max_drawdown
 
     return {
         "key": first_column,
@@ -107,7 +98,7 @@ def _generate_result_line(
         "profit_mean_pct": (
             round(result["profit_ratio"].mean() * 100.0, 2) if len(result) > 0 else 0.0
         ),
-        "profit_total_abs": result["profit_abs"].sum(),
+        "profit_total_abs": metrics.profit_total_abs,
         "profit_total": profit_total,
         "profit_total_pct": round(profit_total * 100.0, 2),
         "duration_avg": (
@@ -128,10 +119,10 @@ def _generate_result_line(
         "cagr": calculate_cagr(backtest_days, starting_balance, final_balance),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
-        "sortino": calculate_sortino(result, min_date, max_date, starting_balance),
-        "sharpe": calculate_sharpe(result, min_date, max_date, starting_balance),
-        "calmar": calculate_calmar(result, min_date, max_date, starting_balance),
-        "sqn": calculate_sqn(result, starting_balance),
+        "sortino": metrics.sortino,
+        "sharpe": metrics.sharpe,
+        "calmar": metrics.calmar,
+        "sqn": metrics.sqn,
         "profit_factor": profit_factor,
         "max_drawdown_account": drawdown.relative_account_drawdown if drawdown else 0.0,
         "max_drawdown_abs": drawdown.drawdown_abs if drawdown else 0.0,
@@ -153,6 +144,7 @@ def generate_pair_metrics(  #
     min_date: datetime,
     max_date: datetime,
     skip_nan: bool = False,
+    metrics: MetricsContext | None = None,
 ) -> list[dict]:
     """
     Generates and returns a list  for the given backtest data and the results dataframe
@@ -161,6 +153,7 @@ def generate_pair_metrics(  #
     :param starting_balance: Starting balance
     :param results: Dataframe containing the backtest results
     :param skip_nan: Print "left open" open trades
+    :param metrics: Metrics of results, if already available - used for the total
     :return: List of Dicts containing the metrics per pair
     """
 
@@ -180,7 +173,7 @@ def generate_pair_metrics(  #
 
     # Append Total
     tabular_data.append(
-        _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL")
+        _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL", metrics)
     )
 
     return tabular_data
@@ -193,12 +186,14 @@ def generate_tag_metrics(
     min_date: datetime,
     max_date: datetime,
     skip_nan: bool = False,
+    metrics: MetricsContext | None = None,
 ) -> list[dict]:
     """
     Generates and returns a list of metrics for the given tag trades and the results dataframe
     :param starting_balance: Starting balance
     :param results: Dataframe containing the backtest results
     :param skip_nan: Print "left open" open trades
+    :param metrics: Metrics of results, if already available - used for the total
     :return: List of Dicts containing the metrics per pair
     """
 
@@ -220,7 +215,7 @@ def generate_tag_metrics(
 
         # Append Total
         tabular_data.append(
-            _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL")
+            _generate_result_line(results, min_date, max_date, starting_balance, "TOTAL", metrics)
         )
         return tabular_data
     else:
@@ -469,6 +464,7 @@ def generate_strategy_stats(
     max_date: datetime,
     market_change: float,
     is_hyperopt: bool = False,
+    metrics: MetricsContext | None = None,
 ) -> dict[str, Any]:
     """
     :param pairlist: List of pairs to backtest
@@ -478,6 +474,7 @@ def generate_strategy_stats(
     :param min_date: Backtest start date
     :param max_date: Backtest end date
     :param market_change: float indicating the market change
+    :param metrics: Metrics of the results - shared with the hyperopt loss function.
     :return: Dictionary containing results per strategy and a strategy summary.
     """
     results: DataFrame = content["results"]
@@ -487,6 +484,8 @@ def generate_strategy_stats(
     max_open_trades = min(config["max_open_trades"], len(pairlist))
     start_balance = get_dry_run_wallet(config)
     stake_currency = config["stake_currency"]
+    if metrics is None:
+        metrics = MetricsContext(results, min_date, max_date, start_balance)
 
     pair_results = generate_pair_metrics(
         pairlist,
@@ -496,6 +495,7 @@ def generate_strategy_stats(
         min_date=min_date,
         max_date=max_date,
         skip_nan=False,
+        metrics=metrics,
     )
 
     enter_tag_stats = generate_tag_metrics(
@@ -505,6 +505,7 @@ def generate_strategy_stats(
         min_date=min_date,
         max_date=max_date,
         skip_nan=False,
+        metrics=metrics,
     )
     exit_reason_stats = generate_tag_metrics(
         "exit_reason",
@@ -513,6 +514,7 @@ def generate_strategy_stats(
         min_date=min_date,
         max_date=max_date,
         skip_nan=False,
+        metrics=metrics,
     )
     mix_tag_stats = generate_tag_metrics(
         ["enter_tag", "exit_reason"],
@@ -521,6 +523,7 @@ def generate_strategy_stats(
         min_date=min_date,
         max_date=max_date,
         skip_nan=False,
+        metrics=metrics,
     )
     left_open_results = generate_pair_metrics(
         pairlist,
@@ -555,11 +558,10 @@ def generate_strategy_stats(
         if len(pair_results) > 1
         else None
     )
-    winning_profit = results.loc[results["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
-    profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
+    losing_profit = metrics.losing_profit
+    profit_factor = metrics.winning_profit / abs(losing_profit) if losing_profit else 0.0
 
-    expectancy, expectancy_ratio = calculate_expectancy(results)
+    expectancy, expectancy_ratio = metrics.expectancy
     backtest_days = (max_date - min_date).days or 1
     trades_dict = results.to_dict(orient="records")
     strat_stats = {
@@ -579,19 +581,19 @@ def generate_strategy_stats(
         "avg_stake_amount": results["stake_amount"].mean() if len(results) > 0 else 0,
         "profit_mean": results["profit_ratio"].mean() if len(results) > 0 else 0,
         "profit_median": results["profit_ratio"].median() if len(results) > 0 else 0,
-        "profit_total": results["profit_abs"].sum() / start_balance,
+        "profit_total": metrics.profit_total_abs / start_balance,
         "profit_total_long": results.loc[~results["is_short"], "profit_abs"].sum() / start_balance,
         "profit_total_short": results.loc[results["is_short"], "profit_abs"].sum() / start_balance,
-        "profit_total_abs": results["profit_abs"].sum(),
+        "profit_total_abs": metrics.profit_total_abs,
         "profit_total_long_abs": results.loc[~results["is_short"], "profit_abs"].sum(),
         "profit_total_short_abs": results.loc[results["is_short"], "profit_abs"].sum(),
         "cagr": calculate_cagr(backtest_days, start_balance, content["final_balance"]),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
-        "sortino": calculate_sortino(results, min_date, max_date, start_balance),
-        "sharpe": calculate_sharpe(results, min_date, max_date, start_balance),
-        "calmar": calculate_calmar(results, min_date, max_date, start_balance),
-        "sqn": calculate_sqn(results, start_balance),
+        "sortino": metrics.sortino,
+        "sharpe": metrics.sharpe,
+        "calmar": metrics.calmar,
+        "sqn": metrics.sqn,
         "profit_factor": profit_factor,
         "backtest_start": min_date.strftime(DATETIME_PRINT_FORMAT),
         "backtest_start_ts": int(min_date.timestamp() * 1000),
@@ -645,14 +647,10 @@ def generate_strategy_stats(
         **trade_stats,
     }
 
-    try:
-        drawdown = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance
-        )
-        # max_relative_drawdown = Underwater
-        underwater = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance, relative=True
-        )
+    drawdown = metrics.max_drawdown
+    # max_relative_drawdown = Underwater
+    underwater = metrics.max_relative_drawdown
+    if drawdown is not None and underwater is not None:
         drawdown_duration = drawdown.low_date - drawdown.high_date
 
         strat_stats.update(
@@ -674,7 +672,7 @@ def generate_strategy_stats(
         csum_min, csum_max = calculate_csum(results, start_balance)
         strat_stats.update({"csum_min": csum_min, "csum_max": csum_max})
 
-    except ValueError:
+    else:
         strat_stats.update(
             {
                 "max_drawdown_account": 0.0,
@@ -691,6 +689,9 @@ def generate_strategy_stats(
             }
         )
 
+    if "callback_profile" in content:
+        strat_stats["callback_profile"] = content["callback_profile"]
+
     return strat_stats
 
 
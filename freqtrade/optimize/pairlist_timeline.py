@@ -0,0 +1,150 @@
+"""
+Precomputed whitelists for backtesting with dynamic pairlists.
+
+The pairlist handlers are evaluated once per main candle before the backtest loop runs.
+The result is stored as the distinct whitelists plus the whitelist index of every candle -
+so the backtest loop only needs a lookup.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import rapidjson
+
+from freqtrade import __version__
+from freqtrade.constants import Config
+from freqtrade.plugins.pairlistmanager import PairListManager
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_pairlist_timeline_dir(config: Config) -> Path:
+    return config["user_data_dir"] / "cache" / "pairlists"
+
+
+class PairlistTimeline:
+    """
+    Whitelist for each main candle of a backtest.
+    """
+
+    def __init__(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_td: timedelta,
+        whitelists: list[list[str]],
+        candles: list[int],
+    ) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self._timeframe_td = timeframe_td
+        self._whitelists = whitelists
+        self._candles = candles
+
+    def matches(self, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Check if the timeline can be used for a backtest from start_date to end_date.
+        Whitelists only depend on the previous candles - so the timeline of a longer
+        timerange with the same start covers shorter timeranges as well.
+        """
+        return self.start_date == start_date and end_date <= self.end_date
+
+    def get_whitelist(self, current_time: datetime) -> list[str]:
+        """
+        Whitelist of the main candle at current_time.
+        """
+        idx = (current_time - self.start_date) // self._timeframe_td - 1
+        return self._whitelists[self._candles[idx]]
+
+    @staticmethod
+    def is_supported(pairlists: PairListManager) -> bool:
+        """
+        Whitelists can only be precomputed if they don't depend on the backtest's trades.
+        """
+        return not any(handler.depends_on_trades for handler in pairlists._pairlist_handlers)
+
+    @classmethod
+    def generate(
+        cls,
+        pairlists: PairListManager,
+        pairs: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_td: timedelta,
+    ) -> "PairlistTimeline":
+        """
+        Refresh the pairlist for every main candle - as the backtest loop would.
+        :param pairs: Pairs with available data
+        """
+        whitelists: dict[tuple[str, ...], int] = {}
+        candles: list[int] = []
+        current_time = start_date + timeframe_td
+        while current_time <= end_date:
+            pairlists.refresh_pairlist(pairs=pairs)
+            candles.append(whitelists.setdefault(tuple(pairlists.whitelist), len(whitelists)))
+            current_time += timeframe_td
+        return cls(start_date, end_date, timeframe_td, [list(wl) for wl in whitelists], candles)
+
+
+class PairlistTimelineCache:
+    """
+    On-disk cache of pairlist timelines.
+    Only used if all pairlist handlers produce the same results on every run.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        self._cache_dir = get_pairlist_timeline_dir(config)
+
+    @staticmethod
+    def is_cacheable(pairlists: PairListManager) -> bool:
+        return all(handler.is_deterministic for handler in pairlists._pairlist_handlers)
+
+    def _get_key(self, pairs: list[str], start_date: datetime, end_date: datetime) -> str:
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(
+            rapidjson.dumps(
+                {
+                    "version": __version__,
+                    "exchange": self._config["exchange"]["name"],
+                    "trading_mode": self._config.get("trading_mode", "spot"),
+                    "timeframe": self._config["timeframe"],
+                    "pairlists": self._config.get("pairlists", []),
+                    "blacklist": self._config["exchange"].get("pair_blacklist", []),
+                    "pairs": pairs,
+                    "start": start_date.isoformat(),
+                    "end": end_date.isoformat(),
+                },
+                sort_keys=True,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def get_timeline(
+        self,
+        pairlists: PairListManager,
+        pairs: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeframe_td: timedelta,
+    ) -> PairlistTimeline:
+        """
+        Load the timeline from the cache - or generate and store it.
+        """
+        file = self._cache_dir / f"{self._get_key(pairs, start_date, end_date)}.json"
+        if file.is_file():
+            logger.info(f"Loading pairlist timeline from {file}.")
+            with file.open("r") as f:
+                content = rapidjson.load(f)
+            return PairlistTimeline(
+                start_date, end_date, timeframe_td, content["whitelists"], content["candles"]
+            )
+
+        timeline = PairlistTimeline.generate(pairlists, pairs, start_date, end_date, timeframe_td)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        with file.open("w") as f:
+            rapidjson.dump({"whitelists": timeline._whitelists, "candles": timeline._candles}, f)
+        return timeline
@@ -0,0 +1,177 @@
+"""
+Lightweight trade and order objects for backtesting.
+
+Orders are not mapped to the database, and use __slots__ - so they carry neither
+SQLAlchemy instance state nor a per-instance __dict__.
+Trades keep an index of their open and filled orders, so lookups don't scan all orders.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+
+from freqtrade.constants import NON_OPEN_EXCHANGE_STATES
+from freqtrade.persistence.trade_model import LocalTrade, Order
+
+
+# All database columns of Order - BacktestOrder provides the same attributes.
+ORDER_FIELDS: tuple[str, ...] = tuple(col.key for col in Order.__table__.columns)
+
+if TYPE_CHECKING:
+    # Type checkers treat BacktestOrder as the Order it stands in for.
+    _OrderBase = Order
+else:
+    _OrderBase = object
+
+
+class BacktestOrder(_OrderBase):
+    """
+    Order used in backtesting.
+    Provides the same attributes, properties and methods as Order.
+    """
+
+    __slots__ = (*ORDER_FIELDS, "_trade_bt")
+
+    # Logic is shared with Order - these only rely on the attributes above.
+    order_date_utc = Order.order_date_utc
+    order_filled_utc = Order.order_filled_utc
+    safe_amount = Order.safe_amount
+    safe_placement_price = Order.safe_placement_price
+    safe_price = Order.safe_price
+    safe_filled = Order.safe_filled
+    safe_cost = Order.safe_cost
+    safe_remaining = Order.safe_remaining
+    safe_fee_base = Order.safe_fee_base
+    safe_amount_after_fee = Order.safe_amount_after_fee
+    stake_amount = Order.stake_amount
+    stake_amount_filled = Order.stake_amount_filled
+    to_ccxt_object = Order.to_ccxt_object
+    to_json = Order.to_json
+    __repr__ = Order.__repr__
+
+    def __init__(self, **kwargs) -> None:
+        for field in ORDER_FIELDS:
+            setattr(self, field, None)
+        self._trade_bt = None  # type: ignore[assignment]
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @property
+    def trade(self) -> LocalTrade:
+        return self._trade_bt
+
+    def close_bt_order(self, close_date: datetime, trade: LocalTrade) -> None:
+        if isinstance(trade, BacktestTrade):
+            # Update the index first - closing the order recalculates the trade.
+            trade._order_filled(self)
+        Order.close_bt_order(self, close_date, trade)
+
+    def to_order(self) -> Order:
+        """
+        Convert to a (not persisted) Order object.
+        """
+        order = Order(**{field: getattr(self, field) for field in ORDER_FIELDS})
+        order._trade_bt = self._trade_bt
+        return order
+
+
+class BacktestTrade(LocalTrade):
+    """
+    Trade used in backtesting.
+    Open and filled orders are indexed - so the order lookups used in the backtesting loop
+    don't need to scan all orders of the trade.
+    Orders must be added and removed through add_order() / remove_order().
+    Changes to orders or amounts are recorded in ``LocalTrade.bt_trades_changed``,
+    so the wallets only need to recalculate the balances of changed trades.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._open_orders: list[Order] = []
+        self._filled_orders: list[Order] = []
+
+    def add_order(self, order: Order) -> None:
+        self.orders.append(order)
+        LocalTrade.bt_trades_changed[self] = None
+        if order.ft_is_open:
+            self._open_orders.append(order)
+        elif self._is_filled(order):
+            self._filled_orders.append(order)
+
+    def remove_order(self, order: Order) -> None:
+        self.orders.remove(order)
+        LocalTrade.bt_trades_changed[self] = None
+        if order in self._open_orders:
+            self._open_orders.remove(order)
+        if order in self._filled_orders:
+            self._filled_orders.remove(order)
+
+    def _order_filled(self, order: Order) -> None:
+        """
+        Move order from the open to the filled orders - called before the order is closed.
+        """
+        LocalTrade.bt_trades_changed[self] = None
+        if order in self._open_orders:
+            self._open_orders.remove(order)
+        if order.amount:
+            self._filled_orders.append(order)
+
+    def recalc_trade_from_orders(self, *, is_closing: bool = False) -> None:
+        super().recalc_trade_from_orders(is_closing=is_closing)
+        LocalTrade.bt_trades_changed[self] = None
+
+    @staticmethod
+    def _is_filled(order: Order) -> bool:
+        return (
+            order.ft_is_open is False
+            and bool(order.filled)
+            and order.status in NON_OPEN_EXCHANGE_STATES
+        )
+
+    @property
+    def open_orders(self) -> list[Order]:
+        """
+        All open orders for this trade
+        """
+        return list(self._open_orders)
+
+    @property
+    def has_open_orders(self) -> bool:
+        """
+        True if there are open orders for this trade
+        """
+        return len(self._open_orders) > 0
+
+    def select_order(
+        self,
+        order_side: str | None = None,
+        is_open: bool | None = None,
+        only_filled: bool = False,
+    ) -> Order | None:
+        if is_open:
+            for order in reversed(self._open_orders):
+                if not order_side or order.ft_order_side == order_side:
+                    return order
+            return None
+        return super().select_order(order_side, is_open, only_filled)
+
+    def select_filled_orders(self, order_side: str | None = None) -> list[Order]:
+        return [
+            o for o in self._filled_orders if order_side is None or o.ft_order_side == order_side
+        ]
+
+    def to_local_trade(self) -> LocalTrade:
+        """
+        Convert to a LocalTrade with Order objects.
+        """
+        trade = LocalTrade(
+            **{
+                key: value
+                for key, value in vars(self).items()
+                if key not in ("orders", "_open_orders", "_filled_orders")
+            }
+        )
+        for bt_order in cast(list[BacktestOrder], self.orders):
+            order = bt_order.to_order()
+            order._trade_bt = trade
+            trade.orders.append(order)
+        return trade
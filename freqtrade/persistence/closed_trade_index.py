@@ -0,0 +1,74 @@
+"""
+Index of closed backtest trades - used to quickly select the trades closed within a lookback
+window (e.g. by protections).
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+
+class ClosedTradeIndex:
+    """
+    Closed trades, bucketed per pair and sorted by close date.
+    Trades appended to the indexed list (usually ``LocalTrade.bt_trades``) are picked up on
+    the next lookup - replacing or shrinking the list rebuilds the index.
+    """
+
+    def __init__(self) -> None:
+        self._reset([])
+
+    def _reset(self, trades: list["LocalTrade"]) -> None:
+        self._trades = trades
+        self._indexed = 0
+        # Close dates and (position, trade) per pair - None holds the trades of all pairs.
+        self._dates: dict[str | None, list[datetime]] = {}
+        self._entries: dict[str | None, list[tuple[int, LocalTrade]]] = {}
+
+    def _add(
+        self, key: str | None, close_date: datetime, position: int, trade: "LocalTrade"
+    ) -> None:
+        dates = self._dates.setdefault(key, [])
+        entries = self._entries.setdefault(key, [])
+        if not dates or dates[-1] <= close_date:
+            # Trades are usually closed in order
+            dates.append(close_date)
+            entries.append((position, trade))
+        else:
+            idx = bisect_right(dates, close_date)
+            dates.insert(idx, close_date)
+            entries.insert(idx, (position, trade))
+
+    def _sync(self, trades: list["LocalTrade"]) -> None:
+        """
+        Index trades added to ``trades`` since the last call.
+        """
+        if trades is not self._trades or len(trades) < self._indexed:
+            self._reset(trades)
+        for position in range(self._indexed, len(trades)):
+            trade = trades[position]
+            if trade.close_date:
+                self._add(trade.pair, trade.close_date, position, trade)
+                self._add(None, trade.close_date, position, trade)
+        self._indexed = len(trades)
+
+    def get_trades(
+        self, trades: list["LocalTrade"], pair: str | None, close_date: datetime
+    ) -> list["LocalTrade"]:
+        """
+        Get trades closed after ``close_date``.
+        :param trades: Closed trades to index
+        :param pair: Filter by pair - None for all pairs
+        :param close_date: Only return trades with close_date > close_date
+        :return: Trades in the order of ``trades``
+        """
+        self._sync(trades)
+        dates = self._dates.get(pair)
+        if not dates:
+            return []
+        window = self._entries[pair][bisect_right(dates, close_date) :]
+        return [trade for _, trade in sorted(window, key=lambda entry: entry[0])]
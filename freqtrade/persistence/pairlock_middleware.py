@@ -1,16 +1,81 @@
+import heapq
 import logging
 from collections.abc import Sequence
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select
 
-from freqtrade.exchange import timeframe_to_next_date
+from freqtrade.exchange import timeframe_to_next_date, timeframe_to_seconds
 from freqtrade.persistence.models import PairLock
 
 
 logger = logging.getLogger(__name__)
 
 
+class PairLockIndex:
+    """
+    Index of the in-memory locks (used if the database is disabled).
+    Locks are stored per pair, and removed from the index once they expire (using a heap
+    on lock_end_time) - so lookups only consider the few locks that may still be active.
+    Expired locks remain available in PairLocks.locks.
+    """
+
+    def __init__(self) -> None:
+        self._reset([])
+
+    def _reset(self, locks: list[PairLock]) -> None:
+        self._locks = locks
+        self._indexed = 0
+        self._by_pair: dict[str, list[PairLock]] = {}
+        # Ordered set of all indexed locks
+        self._all: dict[PairLock, None] = {}
+        self._expiry: list[tuple[datetime, int, PairLock]] = []
+        # Locks ending before this date have been removed from the index
+        self._expired_before: datetime | None = None
+
+    def _sync(self, locks: list[PairLock]) -> None:
+        """
+        Index locks added to ``locks`` since the last call.
+        """
+        if locks is not self._locks or len(locks) < self._indexed:
+            # Locks were reset - start over.
+            self._reset(locks)
+        for lock in locks[self._indexed :]:
+            self._by_pair.setdefault(lock.pair, []).append(lock)
+            self._all[lock] = None
+            heapq.heappush(self._expiry, (lock.lock_end_time, self._indexed, lock))
+            self._indexed += 1
+
+    def _expire(self, until: datetime) -> None:
+        """
+        Remove locks ending before ``until`` from the index.
+        """
+        while self._expiry and self._expiry[0][0] < until:
+            _, _, lock = heapq.heappop(self._expiry)
+            self._by_pair[lock.pair].remove(lock)
+            del self._all[lock]
+        if self._expired_before is None or until > self._expired_before:
+            self._expired_before = until
+
+    def get_locks(
+        self, locks: list[PairLock], pair: str | None, now: datetime
+    ) -> Sequence[PairLock] | None:
+        """
+        Get the locks which may be active at ``now`` - in the order they were created.
+        :return: Candidate locks, or None if the index can't be used for this date.
+        """
+        self._sync(locks)
+        if self._expired_before is not None and now < self._expired_before:
+            # Locks matching this date may already be removed from the index.
+            return None
+        # Keep locks of the last candle - backtesting with a detail timeframe
+        # may query slightly older dates for the next pair.
+        self._expire(now - timedelta(seconds=timeframe_to_seconds(PairLocks.timeframe or "1m")))
+        if pair is None:
+            return list(self._all)
+        return self._by_pair.get(pair, [])
+
+
 class PairLocks:
     """
     Pairlocks middleware class
@@ -20,6 +85,7 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    _index = PairLockIndex()
 
     timeframe: str = ""
 
@@ -82,9 +148,12 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
+            candidates = PairLocks._index.get_locks(PairLocks.locks, pair, now)
+            if candidates is None:
+                candidates = PairLocks.locks
             locks = [
                 lock
-                for lock in PairLocks.locks
+                for lock in candidates
                 if (
                     lock.lock_end_time >= now
                     and lock.active is True
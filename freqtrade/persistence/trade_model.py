@@ -47,6 +47,7 @@ from freqtrade.exchange.exchange_types import CcxtOrder
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.closed_trade_index import ClosedTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none, round_value
 
@@ -390,6 +391,10 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Trades changed since the last wallet update - used as an ordered set
+    bt_trades_changed: dict["LocalTrade", None] = {}
+    # Closed trades (bt_trades) by pair and close date
+    bt_trades_closed_index = ClosedTradeIndex()
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
     realized_profit: float = 0
@@ -770,6 +775,7 @@ class LocalTrade:
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_changed = {}
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
 
@@ -1296,6 +1302,18 @@ class LocalTrade:
                 return o
         return None
 
+    def add_order(self, order: Order) -> None:
+        """
+        Add an order to this trade.
+        """
+        self.orders.append(order)
+
+    def remove_order(self, order: Order) -> None:
+        """
+        Remove an order from this trade.
+        """
+        self.orders.remove(order)
+
     def select_order(
         self,
         order_side: str | None = None,
@@ -1458,6 +1476,14 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            sel_trades = LocalTrade.bt_trades_closed_index.get_trades(
+                LocalTrade.bt_trades, pair or None, close_date
+            )
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
@@ -1486,6 +1512,7 @@ class LocalTrade:
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
+        LocalTrade.bt_trades_changed[trade] = None
 
     @staticmethod
     def add_bt_trade(trade):
@@ -1493,6 +1520,7 @@ class LocalTrade:
             LocalTrade.bt_trades_open.append(trade)
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
+            LocalTrade.bt_trades_changed[trade] = None
         else:
             LocalTrade.bt_trades.append(trade)
 
@@ -1501,6 +1529,7 @@ class LocalTrade:
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
+        LocalTrade.bt_trades_changed[trade] = None
 
     @staticmethod
     def get_open_trades() -> list[Any]:
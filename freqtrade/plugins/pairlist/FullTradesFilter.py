@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 class FullTradesFilter(IPairList):
     supports_backtesting = SupportsBacktesting.NO_ACTION
+    depends_on_trades = True
 
     @property
     def needstickers(self) -> bool:
@@ -72,6 +72,8 @@ class SupportsBacktesting(str, Enum):
 class IPairList(LoggingMixin, ABC):
     is_pairlist_generator = False
     supports_backtesting: SupportsBacktesting = SupportsBacktesting.NO
+    # Result depends on the current trades - so whitelists can't be precomputed in backtesting
+    depends_on_trades = False
 
     def __init__(
         self,
@@ -106,6 +108,14 @@ class IPairList(LoggingMixin, ABC):
         """
         return self.__class__.__name__
 
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        Boolean property defining if the Pairlist Handler produces the same whitelists
+        on every backtest run - so precomputed whitelists can be cached on disk.
+        """
+        return self.supports_backtesting == SupportsBacktesting.YES
+
     @property
     @abstractmethod
     def needstickers(self) -> bool:
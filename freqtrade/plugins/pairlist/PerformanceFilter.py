@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 class PerformanceFilter(IPairList):
     supports_backtesting = SupportsBacktesting.NO_ACTION
+    depends_on_trades = True
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
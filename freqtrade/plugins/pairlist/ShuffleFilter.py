@@ -48,6 +48,13 @@ class ShuffleFilter(IPairList):
         """
         return False
 
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        Shuffled whitelists only repeat with a seed.
+        """
+        return self._seed is not None
+
     def short_desc(self) -> str:
         """
         Short whitelist method description - used for startup-messages
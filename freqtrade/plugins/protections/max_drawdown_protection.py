@@ -4,7 +4,7 @@ from typing import Any
 
 import pandas as pd
 
-from freqtrade.constants import Config, LongShort
+from freqtrade.constants import DATETIME_PRINT_FORMAT, Config, LongShort
 from freqtrade.data.metrics import calculate_max_drawdown
 from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
@@ -50,7 +50,18 @@ class MaxDrawdown(IProtection):
 
         trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
 
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        # Only the columns used by calculate_max_drawdown - as provided by trade.to_json()
+        trades_df = pd.DataFrame(
+            [
+                {
+                    "close_date": trade.close_date.strftime(DATETIME_PRINT_FORMAT)
+                    if trade.close_date
+                    else None,
+                    "close_profit": trade.close_profit,
+                }
+                for trade in trades
+            ]
+        )
 
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
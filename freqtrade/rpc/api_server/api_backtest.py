@@ -5,10 +5,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from fastapi.exceptions import HTTPException
 
-from freqtrade.configuration import remove_exchange_credentials
+from freqtrade.configuration import TimeRange, remove_exchange_credentials
 from freqtrade.configuration.config_validation import validate_config_consistency
 from freqtrade.constants import Config
 from freqtrade.data.btanalysis import (
@@ -263,9 +263,31 @@ def api_backtest_abort():
 
 
 @router.get("/backtest/history", response_model=list[BacktestHistoryEntry])
-def api_backtest_history(config=Depends(get_config)):
-    # Get backtest result history, read from metadata files
-    return get_backtest_resultlist(config["user_data_dir"] / "backtest_results")
+def api_backtest_history(
+    strategy: str | None = Query(None, description="Only return results of this strategy"),
+    timerange: str | None = Query(
+        None, description="Only return backtests within this timerange (e.g. 20240101-20240301)"
+    ),
+    since: int | None = Query(None, description="Only return backtests run after this timestamp"),
+    until: int | None = Query(None, description="Only return backtests run before this timestamp"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip for pagination"),
+    config=Depends(get_config),
+):
+    # Get backtest result history, read from the backtest catalog
+    try:
+        parsed_timerange = TimeRange.parse_timerange(timerange) if timerange else None
+    except ConfigurationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return get_backtest_resultlist(
+        config["user_data_dir"] / "backtest_results",
+        strategy=strategy,
+        timerange=parsed_timerange,
+        since=since,
+        until=until,
+        limit=limit,
+        offset=offset,
+    )
 
 
 @router.get("/backtest/history/result", response_model=BacktestResponse)
@@ -16,6 +16,7 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    SignalParameters,
 )
 from freqtrade.strategy.strategy_helper import (
     merge_informative_pair,
@@ -37,6 +38,7 @@ __all__ = [
     "DecimalParameter",
     "IntParameter",
     "RealParameter",
+    "SignalParameters",
     # timeframe helpers
     "timeframe_to_minutes",
     "timeframe_to_next_date",
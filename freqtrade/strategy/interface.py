@@ -7,7 +7,9 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
+from typing import Any
 
+import numpy as np
 from pandas import DataFrame
 from pydantic import ValidationError
 
@@ -39,6 +41,7 @@ from freqtrade.strategy.informative_decorator import (
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
+from freqtrade.strategy.parameters import SignalParameters
 from freqtrade.strategy.strategy_validation import StrategyResultValidator
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now, dt_ts
@@ -47,6 +50,36 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Callbacks which can be skipped if the strategy doesn't implement them,
+# together with the (legacy) callbacks their default implementation calls.
+SKIPPABLE_CALLBACKS: dict[str, tuple[str, ...]] = {
+    "bot_loop_start": (),
+    "check_entry_timeout": ("check_buy_timeout",),
+    "check_exit_timeout": ("check_sell_timeout",),
+    "confirm_trade_entry": (),
+    "confirm_trade_exit": (),
+    "order_filled": (),
+    "custom_stoploss": (),
+    "custom_roi": (),
+    "custom_entry_price": (),
+    "custom_exit_price": (),
+    "custom_exit": ("custom_sell",),
+    "custom_stake_amount": (),
+    "adjust_trade_position": (),
+    "adjust_order_price": ("adjust_entry_price", "adjust_exit_price"),
+    "leverage": (),
+    "populate_entry_conditions": (),
+    "populate_exit_conditions": (),
+}
+
+# Signal columns populate_entry_conditions() / populate_exit_conditions() can set.
+ENTRY_SIGNAL_COLUMNS = (SignalType.ENTER_LONG.value, SignalType.ENTER_SHORT.value)
+EXIT_SIGNAL_COLUMNS = (SignalType.EXIT_LONG.value, SignalType.EXIT_SHORT.value)
+CONDITION_METHODS = (
+    ("populate_entry_conditions", ENTRY_SIGNAL_COLUMNS),
+    ("populate_exit_conditions", EXIT_SIGNAL_COLUMNS),
+)
+
 
 class IStrategy(ABC, HyperStrategyMixin):
     """
@@ -176,6 +209,23 @@ class IStrategy(ABC, HyperStrategyMixin):
                     informative_data.candle_type = config["candle_type_def"]
                 self._ft_informative.append((informative_data, cls_method))
 
+        # Callbacks implemented by the strategy class.
+        self._ft_implemented_callbacks: set[str] = {
+            name
+            for name, aliases in SKIPPABLE_CALLBACKS.items()
+            if any(getattr(type(self), cb) is not getattr(IStrategy, cb) for cb in (name, *aliases))
+        }
+
+    def ft_has_callback(self, name: str) -> bool:
+        """
+        Check if the strategy implements the callback ``name`` (one of SKIPPABLE_CALLBACKS).
+        If it doesn't, the call can be skipped - and the default result used instead.
+        """
+        if name in self._ft_implemented_callbacks:
+            return True
+        # Callbacks assigned to the instance
+        return any(cb in self.__dict__ for cb in (name, *SKIPPABLE_CALLBACKS[name]))
+
     def load_freqAI_model(self) -> None:
         if self.config.get("freqai", {}).get("enabled", False):
             # Import here to avoid importing this if freqAI is disabled
@@ -271,6 +321,37 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return self.populate_sell_trend(dataframe, metadata)
 
+    def populate_entry_conditions(
+        self, dataframe: DataFrame, metadata: dict, params: SignalParameters
+    ) -> dict[str, Any]:
+        """
+        Entry conditions - an alternative to populate_entry_trend() for strategies whose entry
+        signals only compare indicators against parameter values.
+        If implemented, populate_entry_trend() is not used.
+        Hyperopt evaluates these conditions for a batch of parameter values at once - so use
+        `params` (not the parameter objects) for parameter values, and `params.column()`
+        for dataframe columns. The dataframe must not be modified.
+        :param dataframe: DataFrame
+        :param metadata: Additional information, like the currently traded pair
+        :param params: Parameter values
+        :return: Dictionary of <signal column>: <condition> (enter_long, enter_short)
+        """
+        return {}
+
+    def populate_exit_conditions(
+        self, dataframe: DataFrame, metadata: dict, params: SignalParameters
+    ) -> dict[str, Any]:
+        """
+        Exit conditions - an alternative to populate_exit_trend(),
+        see populate_entry_conditions().
+        If implemented, populate_exit_trend() is not used.
+        :param dataframe: DataFrame
+        :param metadata: Additional information, like the currently traded pair
+        :param params: Parameter values
+        :return: Dictionary of <signal column>: <condition> (exit_long, exit_short)
+        """
+        return {}
+
     def bot_start(self, **kwargs) -> None:
         """
         Called only once after bot instantiation.
@@ -1032,6 +1113,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         wrapper around adjust_trade_position to handle the return value
         """
+        if not self.ft_has_callback("adjust_trade_position"):
+            return None, ""
         resp = strategy_safe_wrapper(
             self.adjust_trade_position, default_retval=(None, ""), supress_error=True
         )(
@@ -1461,7 +1544,9 @@ class IStrategy(ABC, HyperStrategyMixin):
             if exit_ and not enter:
                 exit_signal = ExitType.EXIT_SIGNAL
             else:
-                reason_cust = strategy_safe_wrapper(self.custom_exit, default_retval=False)(
+                reason_cust = self.ft_has_callback("custom_exit") and strategy_safe_wrapper(
+                    self.custom_exit, default_retval=False
+                )(
                     pair=trade.pair,
                     trade=trade,
                     current_time=current_time,
@@ -1548,15 +1633,19 @@ class IStrategy(ABC, HyperStrategyMixin):
         bound = low if trade.is_short else high
         bound_profit = current_profit if not bound else trade.calc_profit_ratio(bound)
         if self.use_custom_stoploss and dir_correct:
-            stop_loss_value_custom = strategy_safe_wrapper(
-                self.custom_stoploss, default_retval=None, supress_error=True
-            )(
-                pair=trade.pair,
-                trade=trade,
-                current_time=current_time,
-                current_rate=(bound or current_rate),
-                current_profit=bound_profit,
-                after_fill=after_fill,
+            stop_loss_value_custom = (
+                strategy_safe_wrapper(
+                    self.custom_stoploss, default_retval=None, supress_error=True
+                )(
+                    pair=trade.pair,
+                    trade=trade,
+                    current_time=current_time,
+                    current_rate=(bound or current_rate),
+                    current_profit=bound_profit,
+                    after_fill=after_fill,
+                )
+                if self.ft_has_callback("custom_stoploss")
+                else self.stoploss
             )
             # Sanity check - error cases will return None
             if stop_loss_value_custom and not (
@@ -1661,7 +1750,7 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         # Get custom ROI if use_custom_roi is set to True
         custom_roi = None
-        if self.use_custom_roi:
+        if self.use_custom_roi and self.ft_has_callback("custom_roi"):
             custom_roi = strategy_safe_wrapper(
                 self.custom_roi, default_retval=None, supress_error=True
             )(
@@ -1721,11 +1810,10 @@ class IStrategy(ABC, HyperStrategyMixin):
             timedout = order.status == "open" and order.order_date_utc <= timeout_threshold
             if timedout:
                 return True
-        time_method = (
-            self.check_exit_timeout
-            if order.ft_order_side == trade.exit_side
-            else self.check_entry_timeout
-        )
+        is_exit = order.ft_order_side == trade.exit_side
+        if not self.ft_has_callback("check_exit_timeout" if is_exit else "check_entry_timeout"):
+            return False
+        time_method = self.check_exit_timeout if is_exit else self.check_entry_timeout
 
         return strategy_safe_wrapper(time_method, default_retval=False)(
             pair=trade.pair, trade=trade, order=order, current_time=current_time
@@ -1750,20 +1838,84 @@ class IStrategy(ABC, HyperStrategyMixin):
             validator.assert_df(res[pair])
         return res
 
-    def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def ft_advise_signals(
+        self, dataframe: DataFrame, metadata: dict, signals: dict[str, np.ndarray] | None = None
+    ) -> DataFrame:
         """
         Call advise_entry and advise_exit and return the resulting dataframe.
         :param dataframe: Dataframe containing data from exchange, as well as pre-calculated
                           indicators
         :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :param signals: Signals already evaluated from the strategy's conditions
+            (see populate_entry_conditions()) - used instead of evaluating the conditions.
         :return: DataFrame of candle (OHLCV) data with indicator data and signals added
 
         """
 
+        if signals is not None:
+            dataframe = self.advise_entry(dataframe, metadata, signals)
+            return self.advise_exit(dataframe, metadata, signals)
+
         dataframe = self.advise_entry(dataframe, metadata)
         dataframe = self.advise_exit(dataframe, metadata)
         return dataframe
 
+    def ft_signal_parameters(self, values: dict[str, np.ndarray] | None = None) -> SignalParameters:
+        """
+        Parameter values for populate_entry_conditions() / populate_exit_conditions().
+        :param values: Values of a batch of candidates - None for the current parameter values
+        """
+        return SignalParameters(dict(self.enumerate_parameters()), values)
+
+    def ft_evaluate_conditions(
+        self, dataframe: DataFrame, metadata: dict, params: SignalParameters
+    ) -> dict[str, Any]:
+        """
+        Evaluate the entry and exit conditions the strategy implements.
+        :return: Dictionary of <signal column>: <condition>
+        """
+        conditions: dict[str, Any] = {}
+        for method, columns in CONDITION_METHODS:
+            if self.ft_has_callback(method):
+                conditions.update(
+                    self._evaluate_conditions(method, columns, dataframe, metadata, params)
+                )
+        return conditions
+
+    def _evaluate_conditions(
+        self,
+        method: str,
+        columns: tuple[str, ...],
+        dataframe: DataFrame,
+        metadata: dict,
+        params: SignalParameters,
+    ) -> dict[str, Any]:
+        conditions = getattr(self, method)(dataframe, metadata, params)
+        invalid = set(conditions) - set(columns)
+        if invalid:
+            raise OperationalException(
+                f"{method} returned invalid signal columns {', '.join(sorted(invalid))}. "
+                f"Expected {', '.join(columns)}."
+            )
+        return conditions
+
+    def _set_signals(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        signals: dict[str, Any] | None,
+        method: str,
+        columns: tuple[str, ...],
+    ) -> DataFrame:
+        if signals is None:
+            signals = self._evaluate_conditions(
+                method, columns, dataframe, metadata, self.ft_signal_parameters()
+            )
+        for column in columns:
+            if column in signals:
+                dataframe[column] = np.asarray(signals[column], dtype=bool).astype(int)
+        return dataframe
+
     def _if_enabled_populate_trades(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         use_public_trades = self.config.get("exchange", {}).get("use_public_trades", False)
         if use_public_trades:
@@ -1816,37 +1968,51 @@ class IStrategy(ABC, HyperStrategyMixin):
             dataframe = reduce_dataframe_footprint(dataframe)
         return dataframe
 
-    def advise_entry(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def advise_entry(
+        self, dataframe: DataFrame, metadata: dict, signals: dict[str, Any] | None = None
+    ) -> DataFrame:
         """
         Based on TA indicators, populates the entry order signal for the given dataframe
         This method should not be overridden.
         :param dataframe: DataFrame
         :param metadata: Additional information dictionary, with details like the
             currently traded pair
+        :param signals: Signals already evaluated from populate_entry_conditions()
         :return: DataFrame with buy column
         """
 
         logger.debug(f"Populating enter signals for pair {metadata.get('pair')}.")
         # Initialize column to work around Pandas bug #56503.
         dataframe.loc[:, "enter_tag"] = ""
+        if self.ft_has_callback("populate_entry_conditions"):
+            return self._set_signals(
+                dataframe, metadata, signals, "populate_entry_conditions", ENTRY_SIGNAL_COLUMNS
+            )
         df = self.populate_entry_trend(dataframe, metadata)
         if "enter_long" not in df.columns:
             df = df.rename({"buy": "enter_long", "buy_tag": "enter_tag"}, axis="columns")
 
         return df
 
-    def advise_exit(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def advise_exit(
+        self, dataframe: DataFrame, metadata: dict, signals: dict[str, Any] | None = None
+    ) -> DataFrame:
         """
         Based on TA indicators, populates the exit order signal for the given dataframe
         This method should not be overridden.
         :param dataframe: DataFrame
         :param metadata: Additional information dictionary, with details like the
             currently traded pair
+        :param signals: Signals already evaluated from populate_exit_conditions()
         :return: DataFrame with exit column
         """
         # Initialize column to work around Pandas bug #56503.
         dataframe.loc[:, "exit_tag"] = ""
         logger.debug(f"Populating exit signals for pair {metadata.get('pair')}.")
+        if self.ft_has_callback("populate_exit_conditions"):
+            return self._set_signals(
+                dataframe, metadata, signals, "populate_exit_conditions", EXIT_SIGNAL_COLUMNS
+            )
         df = self.populate_exit_trend(dataframe, metadata)
         if "exit_long" not in df.columns:
             df = df.rename({"sell": "exit_long"}, axis="columns")
@@ -5,10 +5,12 @@ This module defines a base class for auto-hyperoptable strategies.
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
 from typing import Any, Union
 
+import numpy as np
+
 from freqtrade.enums import HyperoptState
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
 
@@ -26,6 +28,27 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Parameters whose value was read while tracking is active (see track_parameter_access()).
+_accessed_parameters: set["BaseParameter"] | None = None
+
+
+@contextmanager
+def track_parameter_access() -> Iterator[set["BaseParameter"]]:
+    """
+    Record all parameters whose value is read within the context.
+    Used by hyperopt to determine the parameters the indicators depend on.
+    """
+    global _accessed_parameters
+    previous = _accessed_parameters
+    accessed: set[BaseParameter] = set()
+    _accessed_parameters = accessed
+    try:
+        yield accessed
+    finally:
+        _accessed_parameters = previous
+        if previous is not None:
+            previous.update(accessed)
+
 
 class BaseParameter(ABC):
     """
@@ -34,7 +57,6 @@ class BaseParameter(ABC):
 
     space: str | None
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -70,6 +92,16 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        if _accessed_parameters is not None:
+            _accessed_parameters.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Any) -> None:
+        self._value = new_value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
@@ -264,6 +296,8 @@ class DecimalParameter(NumericParameter):
 
     @property
     def value(self) -> float:
+        if _accessed_parameters is not None:
+            _accessed_parameters.add(self)
         return self._value
 
     @value.setter
@@ -383,3 +417,50 @@ class BooleanParameter(CategoricalParameter):
             load=load,
             **kwargs,
         )
+
+
+class SignalParameters:
+    """
+    Parameter values for populate_entry_conditions() and populate_exit_conditions().
+    Attributes are the values of the strategy's parameters. When hyperopt evaluates a batch of
+    candidates at once, each attribute is a row vector with one value per candidate, and
+    column() turns dataframe columns into column vectors - so conditions broadcast to
+    one column per candidate.
+    """
+
+    def __init__(
+        self,
+        parameters: dict[str, BaseParameter],
+        values: dict[str, np.ndarray] | None = None,
+    ) -> None:
+        """
+        :param parameters: Parameters of the strategy, by name
+        :param values: Values of a batch of candidates, by parameter name (shape (1, candidates)).
+            None to use the current parameter values.
+        """
+        self._parameters = parameters
+        self._values = values
+
+    @property
+    def batched(self) -> bool:
+        return self._values is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            if self._values is not None:
+                return self._values[name]
+            return self._parameters[name].value
+        except KeyError:
+            raise AttributeError(f"Strategy has no parameter named {name}.") from None
+
+    def column(self, values: Any) -> Any:
+        """
+        Dataframe column (or array) to compare against parameter values.
+        :param values: Column of the dataframe
+        :return: The column itself - or a column vector when evaluating a batch of candidates
+        """
+        if self._values is None:
+            return values
+        return np.asarray(values)[:, None]
@@ -5,6 +5,7 @@ from functools import wraps
 from typing import Any, TypeVar, cast
 
 from freqtrade.exceptions import StrategyError
+from freqtrade.util.callback_profiler import CallbackProfiler
 
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,14 @@ logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Records the duration of all calls through strategy_safe_wrapper (--profile-callbacks).
+_callback_profiler: CallbackProfiler | None = None
+
+
+def set_callback_profiler(profiler: CallbackProfiler | None) -> None:
+    global _callback_profiler
+    _callback_profiler = profiler
+
 
 def __format_traceback(error: Exception) -> str:
     """Format the traceback of an exception into a formatted string."""
@@ -43,6 +52,9 @@ def strategy_safe_wrapper(f: F, message: str = "", default_retval=None, supress_
                 if "trade" in kwargs:
                     # Protect accidental modifications from within the strategy
                     kwargs["trade"] = deepcopy(kwargs["trade"])
+            if _callback_profiler is not None:
+                with _callback_profiler.measure(getattr(f, "__name__", str(f))):
+                    return f(*args, **kwargs)
             return f(*args, **kwargs)
         except ValueError as error:
             traceback = __format_traceback(error)
@@ -1,3 +1,4 @@
+from freqtrade.util.callback_profiler import CallbackProfiler
 from freqtrade.util.datetime_helpers import (
     dt_floor_day,
     dt_from_ts,
@@ -35,6 +36,7 @@ from freqtrade.util.template_renderer import render_template, render_template_wi
 
 
 __all__ = [
+    "CallbackProfiler",
     "dt_floor_day",
     "dt_from_ts",
     "dt_humanize_delta",
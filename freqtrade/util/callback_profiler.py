@@ -0,0 +1,117 @@
+import random
+import time
+from array import array
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Literal, TypedDict
+
+import numpy as np
+
+
+ProfileType = Literal["callback", "phase"]
+
+
+class ProfileStats(TypedDict):
+    name: str
+    type: ProfileType
+    calls: int
+    total: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+# Number of durations kept per callback / phase for the percentiles.
+RESERVOIR_SIZE = 10_000
+
+
+class _Durations:
+    """
+    Call count, total and maximum of all durations of one callback / phase, and a uniform
+    sample (reservoir sampling) of up to RESERVOIR_SIZE durations for the percentiles.
+    Memory usage doesn't grow with the number of calls.
+    """
+
+    __slots__ = ("calls", "max", "sample", "total")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.sample = array("d")
+
+
+class CallbackProfiler:
+    """
+    Record duration and call count of strategy callbacks and backtesting phases.
+    Durations are in seconds.
+    Percentiles are exact for up to RESERVOIR_SIZE calls, and estimated from a uniform
+    sample of the durations above that.
+    """
+
+    def __init__(self) -> None:
+        self._durations: dict[tuple[str, ProfileType], _Durations] = {}
+        # Seeded, so the sample (and the percentiles) are reproducible.
+        self._random = random.Random(0)  # noqa: S311
+
+    def record(self, name: str, duration: float, type_: ProfileType = "callback") -> None:
+        key = (name, type_)
+        if (durations := self._durations.get(key)) is None:
+            durations = self._durations[key] = _Durations()
+        durations.calls += 1
+        durations.total += duration
+        if duration > durations.max:
+            durations.max = duration
+        if durations.calls <= RESERVOIR_SIZE:
+            durations.sample.append(duration)
+        elif (idx := self._random.randrange(durations.calls)) < RESERVOIR_SIZE:
+            durations.sample[idx] = duration
+
+    @contextmanager
+    def measure(self, name: str, type_: ProfileType = "callback") -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, type_)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap func, so each call is recorded as phase ``name``.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start, "phase")
+
+        return wrapper
+
+    def get_stats(self) -> list[ProfileStats]:
+        """
+        Summary per callback / phase - sorted by total duration.
+        """
+        stats: list[ProfileStats] = []
+        for (name, type_), durations in self._durations.items():
+            values = np.frombuffer(durations.sample, dtype=np.float64)
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            stats.append(
+                {
+                    "name": name,
+                    "type": type_,
+                    "calls": durations.calls,
+                    "total": durations.total,
+                    "mean": durations.total / durations.calls,
+                    "p50": float(p50),
+                    "p95": float(p95),
+                    "p99": float(p99),
+                    "max": durations.max,
+                }
+            )
+        return sorted(stats, key=lambda s: s["total"], reverse=True)
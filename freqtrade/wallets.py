@@ -3,11 +3,12 @@
 
 import logging
 from datetime import datetime, timedelta
+from math import fsum
 from typing import Literal, NamedTuple
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
 from freqtrade.enums import RunMode, TradingMode
-from freqtrade.exceptions import DependencyException
+from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import Exchange
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence import LocalTrade, Trade
@@ -33,7 +34,50 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class TradeBalance(NamedTuple):
+    """Balances held by one open trade - see Wallets._get_trade_balance()"""
+
+    pair: str
+    currency: str
+    realized_profit: float
+    stake_amount: float
+    entry_stake: float
+    amount: float
+    pending: float
+    leverage: float
+    side: str
+
+
+class ExactSum:
+    """
+    Running sum of floats, adjusted by adding / removing single values - without rounding.
+    Every float is an integer multiple of 2 ** -1074, so the sum is kept as an integer
+    number of these units. The value is identical to math.fsum() of the current values.
+    """
+
+    __slots__ = ("_units",)
+
+    _EXPONENT = 1074
+
+    def __init__(self) -> None:
+        self._units = 0
+
+    def add(self, value: float, sign: int = 1) -> None:
+        numerator, denominator = value.as_integer_ratio()
+        # The denominator is a power of two
+        self._units += sign * (numerator << (self._EXPONENT + 1 - denominator.bit_length()))
+
+    @property
+    def value(self) -> float:
+        # Integer division is correctly rounded
+        return self._units / (1 << self._EXPONENT)
+
+
 class Wallets:
+    # Compare incrementally updated backtest balances against a full recalculation.
+    # Slow - only meant for tests.
+    verify_backtest_balances: bool = False
+
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
         self._is_backtest = is_backtest
@@ -41,6 +85,10 @@ class Wallets:
         self._wallets: dict[str, Wallet] = {}
         self._positions: dict[str, PositionWallet] = {}
         self._start_cap: dict[str, float] = {}
+        # Balances of open backtest trades, in the order of LocalTrade.bt_trades_open
+        self._bt_balances: dict[LocalTrade, TradeBalance] = {}
+        self._bt_trades_open: list[LocalTrade] | None = None
+        self._reset_bt_totals()
 
         self._stake_currency = self._exchange.get_proxy_coin()
 
@@ -102,6 +150,150 @@ class Wallets:
             return pos.position
         return 0
 
+    def _get_trade_balance(self, trade: LocalTrade) -> TradeBalance:
+        """
+        Balances held by one open trade.
+        """
+        entry_stake = 0.0
+        pending = 0.0
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            entry_stake = sum(
+                o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
+            )
+            pending = sum(
+                o.amount
+                for o in trade.open_orders
+                if o.amount and o.ft_order_side == trade.exit_side
+            )
+        return TradeBalance(
+            pair=trade.pair,
+            currency=self._exchange.get_pair_base_currency(trade.pair),
+            realized_profit=trade.realized_profit,
+            stake_amount=trade.stake_amount,
+            entry_stake=entry_stake,
+            amount=trade.amount,
+            pending=pending,
+            leverage=trade.leverage,
+            side=trade.trade_direction,
+        )
+
+    def _get_balance_wallet(self, balance: TradeBalance) -> Wallet:
+        curr_wallet_bal = self._start_cap.get(balance.currency, 0)
+        return Wallet(
+            balance.currency,
+            curr_wallet_bal + balance.amount - balance.pending,
+            balance.pending,
+            balance.amount + curr_wallet_bal,
+        )
+
+    @staticmethod
+    def _get_balance_position(balance: TradeBalance) -> PositionWallet:
+        return PositionWallet(
+            balance.pair,
+            position=balance.amount,
+            leverage=balance.leverage,
+            collateral=balance.stake_amount,
+            side=balance.side,
+        )
+
+    def _reset_bt_totals(self) -> None:
+        """
+        Reset the running totals of the open backtest trades.
+        """
+        self._bt_realized_profit = ExactSum()
+        self._bt_stake_amount = ExactSum()
+        self._bt_entry_stake = ExactSum()
+        # Balances by currency (spot) or pair (futures) - the last open trade sets the wallet
+        self._bt_groups: dict[str, dict[LocalTrade, TradeBalance]] = {}
+        self._bt_wallets: dict[str, Wallet] = {}
+        self._bt_positions: dict[str, PositionWallet] = {}
+
+    def _add_bt_totals(self, balance: TradeBalance, sign: int = 1) -> None:
+        self._bt_realized_profit.add(balance.realized_profit, sign)
+        self._bt_stake_amount.add(balance.stake_amount, sign)
+        self._bt_entry_stake.add(balance.entry_stake, sign)
+
+    def _set_bt_balance(self, trade: LocalTrade, balance: TradeBalance | None) -> None:
+        """
+        Replace the balance of an open backtest trade, adjusting the running totals
+        and the wallet (or position) of the trade by the difference.
+        :param balance: New balance - None if the trade is no longer open
+        """
+        futures = self._config.get("trading_mode", "spot") == TradingMode.FUTURES
+        if (old := self._bt_balances.get(trade)) is not None:
+            self._add_bt_totals(old, -1)
+        if balance is None:
+            if old is None:
+                return
+            del self._bt_balances[trade]
+            key = old.pair if futures else old.currency
+            del self._bt_groups[key][trade]
+        else:
+            # Updating existing keys keeps their position - so balances stay
+            # in the order of the open trades.
+            self._bt_balances[trade] = balance
+            self._add_bt_totals(balance)
+            key = balance.pair if futures else balance.currency
+            self._bt_groups.setdefault(key, {})[trade] = balance
+
+        group = self._bt_groups[key]
+        if not group:
+            del self._bt_groups[key]
+            self._bt_positions.pop(key, None)
+            self._bt_wallets.pop(key, None)
+        elif futures:
+            self._bt_positions[key] = self._get_balance_position(next(reversed(group.values())))
+        else:
+            self._bt_wallets[key] = self._get_balance_wallet(next(reversed(group.values())))
+
+    def _update_backtest_trade_balances(self) -> None:
+        """
+        Update the balances and running totals of all open backtest trades.
+        Only trades changed since the last call (see LocalTrade.bt_trades_changed)
+        are recalculated.
+        """
+        trades_open = LocalTrade.bt_trades_open
+        if trades_open is self._bt_trades_open:
+            for trade in LocalTrade.bt_trades_changed:
+                if trade.is_open and trade in LocalTrade.bt_trades_open_pp[trade.pair]:
+                    self._set_bt_balance(trade, self._get_trade_balance(trade))
+                else:
+                    self._set_bt_balance(trade, None)
+        LocalTrade.bt_trades_changed.clear()
+
+        if trades_open is not self._bt_trades_open or len(self._bt_balances) != len(trades_open):
+            # Trades were reset, or the open trades were modified without
+            # LocalTrade.add_bt_trade() / remove_bt_trade() - recalculate all balances.
+            self._bt_trades_open = trades_open
+            self._bt_balances = {}
+            self._reset_bt_totals()
+            for trade in trades_open:
+                balance = self._get_trade_balance(trade)
+                if trade in self._bt_balances:
+                    # Trade listed more than once - counted for every occurrence.
+                    # Recalculated again on the next update, as the lengths differ.
+                    self._add_bt_totals(balance)
+                self._set_bt_balance(trade, balance)
+
+        if self.verify_backtest_balances:
+            expected = [self._get_trade_balance(trade) for trade in LocalTrade.bt_trades_open]
+            balances = [self._bt_balances.get(trade) for trade in LocalTrade.bt_trades_open]
+            totals = [
+                self._bt_realized_profit.value,
+                self._bt_stake_amount.value,
+                self._bt_entry_stake.value,
+            ]
+            expected_totals = [
+                fsum(b.realized_profit for b in expected),
+                fsum(b.stake_amount for b in expected),
+                fsum(b.entry_stake for b in expected),
+            ]
+            if balances != expected or totals != expected_totals:
+                raise OperationalException(
+                    "Backtest wallet balances out of sync with open trades. "
+                    f"Expected {expected}, got {balances}."
+                )
+
     def _update_dry(self) -> None:
         """
         Update from database in dry-run mode
@@ -110,49 +302,38 @@ class Wallets:
         - update balances for currencies currently in trades
         """
         # Recreate _wallets to reset closed trade balances
-        _wallets = {}
-        _positions = {}
-        open_trades = Trade.get_trades_proxy(is_open=True)
+        _wallets: dict[str, Wallet] = {}
+        _positions: dict[str, PositionWallet] = {}
+        futures = self._config.get("trading_mode", "spot") == TradingMode.FUTURES
         if not self._is_backtest:
             # Live / Dry-run mode
+            balances = [
+                self._get_trade_balance(trade) for trade in Trade.get_trades_proxy(is_open=True)
+            ]
             tot_profit = Trade.get_total_closed_profit()
+            tot_profit += sum(balance.realized_profit for balance in balances)
+            tot_in_trades = sum(balance.stake_amount for balance in balances)
+            used_stake = 0.0
+
+            if not futures:
+                for balance in balances:
+                    used_stake += balance.entry_stake
+                    _wallets[balance.currency] = self._get_balance_wallet(balance)
+            else:
+                for balance in balances:
+                    _positions[balance.pair] = self._get_balance_position(balance)
+                used_stake = tot_in_trades
         else:
-            # Backtest mode
-            tot_profit = LocalTrade.bt_total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
-        used_stake = 0.0
-
-        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
-            for trade in open_trades:
-                curr = self._exchange.get_pair_base_currency(trade.pair)
-                used_stake += sum(
-                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
-                )
-                pending = sum(
-                    o.amount
-                    for o in trade.open_orders
-                    if o.amount and o.ft_order_side == trade.exit_side
-                )
-                curr_wallet_bal = self._start_cap.get(curr, 0)
-
-                _wallets[curr] = Wallet(
-                    curr,
-                    curr_wallet_bal + trade.amount - pending,
-                    pending,
-                    trade.amount + curr_wallet_bal,
-                )
-        else:
-            for position in open_trades:
-                _positions[position.pair] = PositionWallet(
-                    position.pair,
-                    position=position.amount,
-                    leverage=position.leverage,
-                    collateral=position.stake_amount,
-                    side=position.trade_direction,
-                )
-
-            used_stake = tot_in_trades
+            # Backtest mode - running totals of the open trades, adjusted by each change.
+            self._update_backtest_trade_balances()
+            tot_profit = LocalTrade.bt_total_profit + self._bt_realized_profit.value
+            tot_in_trades = self._bt_stake_amount.value
+            if not futures:
+                _wallets = self._bt_wallets.copy()
+                used_stake = self._bt_entry_stake.value
+            else:
+                _positions = self._bt_positions.copy()
+                used_stake = tot_in_trades
 
         cross_margin = 0.0
         if self._config.get("margin_mode") == "cross":
@@ -274,6 +455,12 @@ class Wallets:
 
         return True
 
+    def _get_total_closed_profit(self) -> float:
+        if self._is_backtest:
+            # Closed backtest trades may no longer be available (--stream-trades)
+            return LocalTrade.bt_total_profit
+        return Trade.get_total_closed_profit()
+
     def get_starting_balance(self) -> float:
         """
         Retrieves starting balance - based on either available capital,
@@ -282,7 +469,7 @@ class Wallets:
         if "available_capital" in self._config:
             return self._config["available_capital"]
         else:
-            tot_profit = Trade.get_total_closed_profit()
+            tot_profit = self._get_total_closed_profit()
             open_stakes = Trade.total_open_trades_stakes()
             available_balance = self.get_free(self._stake_currency)
             return (available_balance - tot_profit + open_stakes) * self._config[
@@ -299,7 +486,7 @@ class Wallets:
         val_tied_up = Trade.total_open_trades_stakes()
         if "available_capital" in self._config:
             starting_balance = self._config["available_capital"]
-            tot_profit = Trade.get_total_closed_profit()
+            tot_profit = self._get_total_closed_profit()
             available_amount = starting_balance + tot_profit
 
         else:
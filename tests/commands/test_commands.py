@@ -19,6 +19,7 @@ from freqtrade.commands import (
     start_edge,
     start_hyperopt_list,
     start_hyperopt_show,
+    start_indicator_cache,
     start_install_ui,
     start_list_data,
     start_list_exchanges,
@@ -1270,20 +1271,18 @@ def test_start_test_pairlist(mocker, caplog, tickers, default_conf, capsys):
         pytest.fail(f"Expected well formed JSON, but failed to parse: {captured.out}")
 
 
-def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
-    saved_hyperopt_results = hyperopt_test_result()
-    csv_file = tmp_path / "test.csv"
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist",
-        return_value=True,
-    )
+def write_hyperopt_results(mocker, tmp_path) -> Path:
+    results_file = tmp_path / "hyperopt_results.fthypt"
+    with results_file.open("w") as f:
+        for epoch in hyperopt_test_result():
+            f.write(json.dumps(epoch, default=str) + "\n")
+    mocker.patch("freqtrade.data.btanalysis.get_latest_hyperopt_file", return_value=results_file)
+    return results_file
 
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
 
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
-    )
+def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
+    csv_file = tmp_path / "test.csv"
+    write_hyperopt_results(mocker, tmp_path)
 
     args = [
         "hyperopt-list",
@@ -1640,23 +1639,16 @@ def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
         or "Best,1,2,-1.25%,-1.2222,-0.00125625,BTC,-2.51,2 days 17:30:00,2,0,-0.00125625,23.00%,"
         "0.43662"
         in line
+        # Durations are stored as strings in results files
+        or 'Best,1,2,-1.25%,-1.2222,-0.00125625,BTC,-2.51,"2 days, 17:30:00",2,0,-0.00125625,'
+        "23.00%,0.43662"
+        in line
     )
     csv_file.unlink()
 
 
-def test_hyperopt_show(mocker, capsys):
-    saved_hyperopt_results = hyperopt_test_result()
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist",
-        return_value=True,
-    )
-
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
-
-    mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
-    )
+def test_hyperopt_show(mocker, capsys, tmp_path):
+    write_hyperopt_results(mocker, tmp_path)
     mocker.patch("freqtrade.optimize.optimize_reports.show_backtest_result")
 
     args = [
@@ -1980,6 +1972,26 @@ def test_backtesting_show(mocker, testdatadir, capsys):
     assert "Pairs for Strategy" in out
 
 
+def test_start_indicator_cache(user_dir, capsys, caplog):
+    cache_dir = user_dir / "cache" / "indicators" / "SampleStrategy"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "ETH_BTC-5m-abcdef.feather").write_bytes(b"x" * 1024)
+    (cache_dir / "ETH_BTC-5m-123456.feather").write_bytes(b"x" * 1024)
+    args = ["indicator-cache", "--userdir", str(user_dir)]
+    pargs = get_args(args)
+    pargs["config"] = None
+    start_indicator_cache(pargs)
+    out, _err = capsys.readouterr()
+    assert "Indicator cache: 2 entries" in out
+    assert "SampleStrategy" in out
+
+    pargs = get_args([*args, "--purge"])
+    pargs["config"] = None
+    start_indicator_cache(pargs)
+    assert log_has("Removed 2 entries from the indicator cache.", caplog)
+    assert not cache_dir.exists()
+
+
 def test_start_convert_db(fee, tmp_path):
     db_src_file = tmp_path / "db.sqlite"
     db_from = f"sqlite:///{db_src_file}"
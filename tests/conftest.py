@@ -23,6 +23,7 @@ from freqtrade.persistence import LocalTrade, Order, Trade, init_db
 from freqtrade.resolvers import ExchangeResolver
 from freqtrade.system import set_mp_start_method
 from freqtrade.util import dt_now, dt_ts
+from freqtrade.wallets import Wallets
 from freqtrade.worker import Worker
 from tests.conftest_trades import (
     leverage_trade,
@@ -547,6 +548,12 @@ def user_dir(mocker, tmp_path) -> Path:
     return user_dir
 
 
+@pytest.fixture(autouse=True)
+def verify_backtest_balances(mocker) -> None:
+    # Verify incrementally updated backtest wallets against a full recalculation.
+    mocker.patch.object(Wallets, "verify_backtest_balances", True)
+
+
 @pytest.fixture()
 def keep_log_config_loggers(mocker):
     # Mock the _handle_existing_loggers function to prevent it from disabling all loggers.
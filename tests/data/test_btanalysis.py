@@ -4,14 +4,18 @@ from unittest.mock import MagicMock
 from zipfile import ZipFile
 
 import pytest
+import rapidjson
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.constants import BT_CATALOG_FN, LAST_BT_RESULT_FN
 from freqtrade.data.btanalysis import (
     BT_DATA_COLUMNS,
     analyze_trade_parallelism,
+    bt_fileutils,
+    delete_backtest_result,
     extract_trades_of_period,
+    get_backtest_resultlist,
     get_latest_backtest_filename,
     get_latest_hyperopt_file,
     load_backtest_data,
@@ -19,9 +23,11 @@ from freqtrade.data.btanalysis import (
     load_file_from_zip,
     load_trades,
     load_trades_from_db,
+    update_backtest_metadata,
 )
 from freqtrade.data.history import load_data, load_pair_history
 from freqtrade.data.metrics import (
+    MetricsContext,
     calculate_cagr,
     calculate_calmar,
     calculate_csum,
@@ -38,7 +44,7 @@ from freqtrade.data.metrics import (
 )
 from freqtrade.exceptions import OperationalException
 from freqtrade.util import dt_utc
-from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
+from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades, log_has_re
 from tests.conftest_trades import MOCK_TRADE_COUNT
 
 
@@ -103,6 +109,121 @@ def test_load_backtest_data_old_format(testdatadir, mocker):
         load_backtest_data(filename)
 
 
+def _write_backtest_result(dirname: Path, name: str, metadata: dict) -> Path:
+    filename = dirname / f"{name}.json"
+    filename.write_text("{}")
+    filename.with_suffix(".meta.json").write_text(rapidjson.dumps(metadata))
+    return filename
+
+
+def test_get_backtest_resultlist(tmp_path, mocker, caplog):
+    def _meta(start_time, start, end, notes=None):
+        return {
+            "run_id": f"run_{start_time}",
+            "backtest_start_time": start_time,
+            "backtest_start_ts": int(dt_utc(*start).timestamp() * 1000),
+            "backtest_end_ts": int(dt_utc(*end).timestamp() * 1000),
+            "timeframe": "5m",
+            **({"notes": notes} if notes else {}),
+        }
+
+    _write_backtest_result(
+        tmp_path,
+        "backtest-result-2024-01-01_10-00-00",
+        {"StratA": _meta(1704103200, (2023, 1, 1), (2023, 6, 1), "first")},
+    )
+    _write_backtest_result(
+        tmp_path,
+        "backtest-result-2024-02-01_10-00-00",
+        {
+            "StratA": _meta(1706781600, (2023, 6, 1), (2023, 12, 1)),
+            "StratB": _meta(1706781600, (2023, 6, 1), (2023, 12, 1)),
+        },
+    )
+    _write_backtest_result(
+        tmp_path,
+        "backtest-result-2024-03-01_10-00-00",
+        {"StratB": _meta(1709287200, (2023, 1, 1), (2024, 1, 1))},
+    )
+    # Not a backtest result
+    _write_backtest_result(
+        tmp_path, "other-result", {"StratC": _meta(1709287200, (2023, 1, 1), (2024, 1, 1))}
+    )
+    extract_spy = mocker.spy(bt_fileutils, "_extract_backtest_result")
+
+    res = get_backtest_resultlist(tmp_path)
+    assert [(r["filename"], r["strategy"]) for r in res] == [
+        ("backtest-result-2024-03-01_10-00-00", "StratB"),
+        ("backtest-result-2024-02-01_10-00-00", "StratA"),
+        ("backtest-result-2024-02-01_10-00-00", "StratB"),
+        ("backtest-result-2024-01-01_10-00-00", "StratA"),
+    ]
+    assert res[3]["notes"] == "first"
+    assert res[0]["timeframe"] == "5m"
+    assert res[0]["timeframe_detail"] is None
+    assert extract_spy.call_count == 3
+    assert (tmp_path / BT_CATALOG_FN).is_file()
+
+    # Results are only read once
+    extract_spy.reset_mock()
+    assert get_backtest_resultlist(tmp_path) == res
+    assert extract_spy.call_count == 0
+
+    # Filtering and paging
+    res_b = get_backtest_resultlist(tmp_path, strategy="StratB")
+    assert [r["filename"] for r in res_b] == [
+        "backtest-result-2024-03-01_10-00-00",
+        "backtest-result-2024-02-01_10-00-00",
+    ]
+    res_tr = get_backtest_resultlist(
+        tmp_path, timerange=TimeRange.parse_timerange("20230101-20230701")
+    )
+    assert [r["filename"] for r in res_tr] == ["backtest-result-2024-01-01_10-00-00"]
+    res_tr = get_backtest_resultlist(tmp_path, timerange=TimeRange.parse_timerange("20230501-"))
+    assert len(res_tr) == 2
+    assert get_backtest_resultlist(tmp_path, since=1706781600, until=1706781600) == res[1:3]
+    assert get_backtest_resultlist(tmp_path, limit=2) == res[:2]
+    assert get_backtest_resultlist(tmp_path, limit=2, offset=3) == res[3:]
+    assert extract_spy.call_count == 0
+
+    # Updated metadata
+    update_backtest_metadata(
+        tmp_path / "backtest-result-2024-01-01_10-00-00.json", "StratA", {"notes": "updated"}
+    )
+    assert get_backtest_resultlist(tmp_path)[3]["notes"] == "updated"
+    assert extract_spy.call_count == 1
+
+    # Results added / removed without catalog update
+    extract_spy.reset_mock()
+    _write_backtest_result(
+        tmp_path,
+        "backtest-result-2024-04-01_10-00-00",
+        {"StratA": _meta(1711965600, (2023, 1, 1), (2024, 1, 1))},
+    )
+    (tmp_path / "backtest-result-2024-03-01_10-00-00.json").unlink()
+    res = get_backtest_resultlist(tmp_path)
+    assert [r["filename"] for r in res][:2] == [
+        "backtest-result-2024-04-01_10-00-00",
+        "backtest-result-2024-02-01_10-00-00",
+    ]
+    assert extract_spy.call_count == 1
+
+    delete_backtest_result(tmp_path / "backtest-result-2024-04-01_10-00-00.json")
+    assert len(get_backtest_resultlist(tmp_path)) == 3
+
+    # Rebuilt when deleted
+    (tmp_path / BT_CATALOG_FN).unlink()
+    extract_spy.reset_mock()
+    assert len(get_backtest_resultlist(tmp_path)) == 3
+    assert extract_spy.call_count == 2
+
+    # Catalog can't be used
+    (tmp_path / BT_CATALOG_FN).unlink()
+    (tmp_path / BT_CATALOG_FN).mkdir()
+    assert len(get_backtest_resultlist(tmp_path)) == 3
+    assert log_has_re(r"Could not use backtest catalog in .*", caplog)
+
+
 def test_load_backtest_data_new_format(testdatadir):
     filename = testdatadir / "backtest_results/backtest-result.json"
     bt_data = load_backtest_data(filename)
@@ -507,6 +628,51 @@ def test_calculate_sqn_cases(profits, starting_balance, expected_sqn, descriptio
     assert pytest.approx(sqn, rel=1e-4) == expected_sqn
 
 
+def test_metrics_context(mocker, testdatadir):
+    filename = testdatadir / "backtest_results/backtest-result.json"
+    bt_data = load_backtest_data(filename)
+    min_date = bt_data["open_date"].min()
+    max_date = bt_data["close_date"].max()
+
+    drawdown = calculate_max_drawdown(bt_data, value_col="profit_abs", starting_balance=0.01)
+    relative_drawdown = calculate_max_drawdown(
+        bt_data, value_col="profit_abs", starting_balance=0.01, relative=True
+    )
+    calmar = calculate_calmar(bt_data, min_date, max_date, 0.01)
+
+    drawdown_mock = mocker.patch(
+        "freqtrade.data.metrics.calculate_max_drawdown", wraps=calculate_max_drawdown
+    )
+    ctx = MetricsContext(bt_data, min_date, max_date, 0.01)
+    assert ctx.profit_total_abs == bt_data["profit_abs"].sum()
+    assert (
+        pytest.approx(ctx.winning_profit - ctx.losing_profit) == bt_data["profit_abs"].abs().sum()
+    )
+    assert ctx.expectancy == calculate_expectancy(bt_data)
+    assert ctx.sharpe == calculate_sharpe(bt_data, min_date, max_date, 0.01)
+    assert ctx.sortino == calculate_sortino(bt_data, min_date, max_date, 0.01)
+    assert ctx.sqn == calculate_sqn(bt_data, 0.01)
+    assert drawdown_mock.call_count == 0
+
+    assert ctx.max_drawdown == drawdown
+    assert drawdown_mock.call_count == 1
+    # Calmar and the relative account drawdown reuse the drawdown
+    assert pytest.approx(ctx.calmar) == calmar
+    assert ctx.relative_account_drawdown == drawdown.relative_account_drawdown
+    assert drawdown_mock.call_count == 1
+    assert ctx.max_relative_drawdown == relative_drawdown
+    assert ctx.max_relative_drawdown is ctx.max_relative_drawdown
+    assert drawdown_mock.call_count == 2
+
+    ctx = MetricsContext(DataFrame(columns=BT_DATA_COLUMNS), None, None, 0)
+    assert ctx.profit_total_abs == 0
+    assert ctx.max_drawdown is None
+    assert ctx.max_relative_drawdown is None
+    assert ctx.relative_account_drawdown == 0.0
+    assert ctx.sharpe == 0.0
+    assert ctx.calmar == 0.0
+
+
 @pytest.mark.parametrize(
     "start,end,days, expected",
     [
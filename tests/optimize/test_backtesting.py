@@ -15,7 +15,11 @@ from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
 from freqtrade.configuration import TimeRange
 from freqtrade.data import history
-from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
+from freqtrade.data.btanalysis import (
+    BT_DATA_COLUMNS,
+    evaluate_result_multi,
+    trade_list_to_dataframe,
+)
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
@@ -23,21 +27,31 @@ from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
+from freqtrade.optimize import bt_parallel
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtesting import HEADERS, Backtesting
+from freqtrade.optimize.bt_columnar import ColumnarPairData, DetailPairData
+from freqtrade.optimize.bt_exit_scan import ExitScan
+from freqtrade.optimize.bt_funding_fees import FundingFeeSeries
+from freqtrade.optimize.bt_parallel import dump_shared_data, load_shared_data
+from freqtrade.optimize.bt_trade_sink import TradeSink
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy import strategy_wrapper
 from freqtrade.util import dt_now, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
     generate_test_data,
     get_args,
+    get_markets,
+    get_patched_exchange,
     log_has,
     log_has_re,
     patch_exchange,
     patched_configuration_load_config_file,
 )
+from tests.conftest_trades_usdt import mock_trade_usdt_1, mock_trade_usdt_2, mock_trade_usdt_3
 
 
 ORDER_TYPES = [
@@ -521,6 +535,16 @@ def test_backtesting_pairlist_list(default_conf, mocker, tickers) -> None:
     ):
         Backtesting(default_conf)
 
+    del default_conf["strategy_list"]
+    default_conf["pairlists"] = [{"method": "StaticPairList"}, {"method": "PerformanceFilter"}]
+    default_conf["enable_dynamic_pairlist"] = True
+    default_conf["backtest_stream_trades"] = True
+    with pytest.raises(
+        OperationalException,
+        match=r"PerformanceFilter requires all closed trades.*--stream-trades\.",
+    ):
+        Backtesting(default_conf)
+
 
 def test_backtest__enter_trade(default_conf, fee, mocker) -> None:
     default_conf["use_exit_signal"] = False
@@ -873,6 +897,57 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
         ) < round(t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6)
 
 
+def test_backtest_profile_callbacks(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+    default_conf["backtest_profile_callbacks"] = True
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    def confirm_trade_entry(*args, **kwargs):
+        return True
+
+    backtesting.strategy.confirm_trade_entry = confirm_trade_entry
+    result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+    assert len(result["results"]) > 0
+    stats = {(stat["name"], stat["type"]): stat for stat in result["callback_profile"]}
+    assert stats[("backtest_loop", "phase")]["calls"] > 0
+    assert stats[("populate_signals", "phase")]["calls"] == 1
+    assert stats[("enter_trade", "phase")]["calls"] > 0
+    assert stats[("wallets_update", "phase")]["calls"] > 0
+    assert stats[("confirm_trade_entry", "callback")]["calls"] == len(result["results"])
+
+    # Profiling is stopped after the backtest
+    assert backtesting.callback_profiler is None
+    assert strategy_wrapper._callback_profiler is None
+    assert "backtest_loop" not in backtesting.__dict__
+    assert "update" not in backtesting.wallets.__dict__
+
+    # ... also when the backtest is aborted
+    backtesting.abort = True
+    with pytest.raises(DependencyException, match="Stop requested"):
+        backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+    assert backtesting.callback_profiler is None
+    assert strategy_wrapper._callback_profiler is None
+    assert "backtest_loop" not in backtesting.__dict__
+    assert "update" not in backtesting.wallets.__dict__
+
+    default_conf["backtest_profile_callbacks"] = False
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+    assert "callback_profile" not in result
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt["use_exit_signal"] = False
@@ -1005,7 +1080,7 @@ def test_backtest_one_detail_futures(
     default_conf_usdt["max_open_trades"] = 10
 
     backtesting = Backtesting(default_conf_usdt)
-    ff_spy = mocker.spy(backtesting.exchange, "calculate_funding_fees")
+    ff_spy = mocker.spy(backtesting, "_calculate_funding_fees")
 
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.strategy.populate_entry_trend = advise_entry
@@ -1132,7 +1207,7 @@ def test_backtest_one_detail_futures_funding_fees(
     default_conf_usdt["max_open_trades"] = 1
 
     backtesting = Backtesting(default_conf_usdt)
-    ff_spy = mocker.spy(backtesting.exchange, "calculate_funding_fees")
+    ff_spy = mocker.spy(backtesting, "_calculate_funding_fees")
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.strategy.populate_entry_trend = advise_entry
     backtesting.strategy.adjust_trade_position = adjust_trade_position
@@ -1518,6 +1593,8 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
 
     backtesting = Backtesting(default_conf)
     vr_spy = mocker.spy(backtesting, "validate_row")
+    # Process every pair on every candle - see test_backtest_entry_schedule
+    mocker.patch.object(backtesting, "_get_entry_schedule", return_value=None)
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.strategy.bot_loop_start = MagicMock()
     backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
@@ -1590,6 +1667,77 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("tres", [0, 20])
+def test_backtest_entry_schedule(default_conf, fee, mocker, tres, testdatadir):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf["runmode"] = "backtest"
+    default_conf["timeframe"] = "5m"
+    default_conf["max_open_trades"] = 3
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+    if tres > 0:
+        data["LTC/BTC"] = data["LTC/BTC"][tres:].reset_index()
+
+    def run(use_schedule: bool):
+        backtesting = Backtesting(default_conf)
+        if not use_schedule:
+            mocker.patch.object(backtesting, "_get_entry_schedule", return_value=None)
+        vr_spy = mocker.spy(backtesting, "validate_row")
+        backtesting._set_strategy(backtesting.strategylist[0])
+        strategy = backtesting.strategy
+        strategy.advise_entry = _trend_alternate_hold  # Override
+        strategy.advise_exit = _trend_alternate_hold  # Override
+        # Candles of all pairs as seen by callbacks
+        seen = []
+
+        def _seen(pair, current_time):
+            seen.append(
+                (
+                    pair,
+                    current_time,
+                    [len(strategy.dp.get_analyzed_dataframe(p, "5m")[0]) for p in pairs],
+                )
+            )
+
+        strategy.bot_loop_start = MagicMock(
+            side_effect=lambda current_time, **kwargs: _seen(None, current_time)
+        )
+        strategy.confirm_trade_entry = MagicMock(
+            side_effect=lambda pair, current_time, **kwargs: _seen(pair, current_time) or True
+        )
+        processed = strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        # Dataframes after the backtest
+        _seen(None, max_date)
+        return results["results"], seen, vr_spy.call_count
+
+    results, seen, vr_calls = run(True)
+    results_seq, seen_seq, vr_calls_seq = run(False)
+
+    assert vr_calls_seq == 2495
+    # Pairs without open trades are only processed on candles with an entry signal
+    assert vr_calls < vr_calls_seq / 2
+    assert len(results) > 0
+    pd.testing.assert_frame_equal(results, results_seq)
+    assert len(seen) > 499
+    assert seen == seen_seq
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
@@ -1674,14 +1822,18 @@ def test_backtest_multi_pair_detail(
 
     # bot_loop_start is called once per candle.
     assert backtesting.strategy.bot_loop_start.call_count == 199
-    # Validated row once per candle and pair
-    assert vr_spy.call_count == 995
+    # Validated row once per candle for pairs with open trades or an entry signal
+    if tres == 0:
+        assert vr_spy.call_count == 134
+    else:
+        assert vr_spy.call_count == (132 if pair == "ADA/USDT" else 131)
 
     if use_detail:
-        # Backtest loop is called once per candle per pair
-        # Exact numbers depend on trade state - but should be around 3_800
-        assert bl_spy.call_count > 1_220
-        assert bl_spy.call_count < 1_300
+        # Backtest loop is called once per detail candle for pairs with open trades or
+        # an entry signal - idle pairs are skipped.
+        # Exact numbers depend on trade state - but should be around 490
+        assert bl_spy.call_count > 480
+        assert bl_spy.call_count < 510
     else:
         assert bl_spy.call_count < 995
 
@@ -1798,8 +1950,8 @@ def test_backtest_multi_pair_detail_simplified(
 
     # bot_loop_start is called once per candle.
     # assert backtesting.strategy.bot_loop_start.call_count == 83
-    # Validated row once per candle and pair
-    assert vr_spy.call_count == 415
+    # Validated row once per candle for pairs with open trades or an entry signal
+    assert vr_spy.call_count == {0: 315, 20: 295, 30: 285}[tres]
 
     if use_detail:
         # Backtest loop is called once per candle per pair
@@ -1933,14 +2085,14 @@ def test_backtest_multi_pair_long_short_switch(
 
     # bot_loop_start is called once per candle.
     assert backtesting.strategy.bot_loop_start.call_count == 499
-    # Validated row once per candle and pair
-    assert vr_spy.call_count == 499
+    # Validated row once per candle with open trades or an entry signal
+    assert vr_spy.call_count == 261
 
     if use_detail:
-        # Backtest loop is called once per candle per pair
-        assert bl_spy.call_count == 1511
+        # Backtest loop is called once per candle with open trades or entry signal
+        assert bl_spy.call_count == 1293
     else:
-        assert bl_spy.call_count == 508
+        assert bl_spy.call_count == 290
 
     # Make sure we have parallel trades
     assert len(evaluate_result_multi(results["results"], "5m", 0)) > 0
@@ -1951,6 +2103,634 @@ def test_backtest_multi_pair_long_short_switch(
     assert len(results["results"]) == 53
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_engine_columnar(default_conf_usdt, fee, mocker, use_detail):
+    """
+    The columnar engine must produce exactly the same trades as the list engine.
+    """
+
+    def _signals(dataframe, metadata):
+        multi = 7 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 11
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 3) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % 2 == 0, "even", None)
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "stoploss": -0.05,
+            "minimal_roi": {"0": 0.03, "20": 0.01},
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {}
+    detail_data = {}
+    for idx, pair in enumerate(pairs):
+        candles_1m = generate_test_data("1m", 1500, "2022-01-03 12:00:00+00:00", random_seed=idx)
+        detail_data[pair] = candles_1m
+        data[pair] = ohlcv_fill_up_missing_data(candles_1m, "5m", "dummy")
+    # Missing start for one pair
+    data["LTC/USDT"] = data["LTC/USDT"][25:].reset_index(drop=True)
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = detail_data
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _signals
+        backtesting.strategy.advise_exit = _signals
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        Backtesting.cleanup()
+
+    assert len(results["lists"]["results"]) > 20
+    pd.testing.assert_frame_equal(results["lists"]["results"], results["columnar"]["results"])
+    assert results["lists"]["final_balance"] == results["columnar"]["final_balance"]
+    assert results["lists"]["rejected_signals"] == results["columnar"]["rejected_signals"]
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"stoploss": -0.2, "minimal_roi": {"0": 0.3, "30": 0.2, "90": 0.05}},
+        {"stoploss": -0.15, "minimal_roi": {}, "use_exit_signal": False},
+        {
+            "stoploss": -0.2,
+            "minimal_roi": {"0": 0.3},
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.05,
+            "trailing_stop_positive_offset": 0.1,
+            "trailing_only_offset_is_reached": True,
+        },
+        {"stoploss": -0.2, "minimal_roi": {"0": 0.25}, "trailing_stop": True},
+    ],
+)
+def test_backtest_exit_scan(default_conf_usdt, fee, mocker, settings):
+    """
+    Skipping exit checks must produce exactly the same trades as checking every candle.
+    """
+
+    def _signals(dataframe, metadata):
+        dataframe["enter_long"] = np.where(dataframe.index % 13 == 0, 1, 0)
+        dataframe["exit_long"] = np.where(dataframe.index % 97 == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {"runmode": "backtest", "timeframe": "5m", "max_open_trades": 3, **settings}
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT"]
+    data = {
+        pair: generate_test_data("5m", 1000, "2022-01-03 12:00:00+00:00", random_seed=idx)
+        for idx, pair in enumerate(pairs)
+    }
+
+    results = {}
+    check_count = {}
+    for use_scan in (True, False):
+        if not use_scan:
+            mocker.patch.object(Backtesting, "_init_exit_scan", return_value=None)
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _signals
+        backtesting.strategy.advise_exit = _signals
+        check_spy = mocker.spy(backtesting, "_check_trade_exit")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[use_scan] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        assert (backtesting.exit_scan is not None) == use_scan
+        check_count[use_scan] = check_spy.call_count
+        Backtesting.cleanup()
+
+    assert len(results[True]["results"]) > 20
+    pd.testing.assert_frame_equal(results[True]["results"], results[False]["results"])
+    assert results[True]["final_balance"] == results[False]["final_balance"]
+    assert check_count[True] < check_count[False]
+
+
+def test_backtest_exit_scan_unsupported(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert isinstance(backtesting._init_exit_scan(), ExitScan)
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert backtesting._init_exit_scan() is None
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.position_adjustment_enable = True
+    assert backtesting._init_exit_scan() is None
+    backtesting.strategy.position_adjustment_enable = False
+
+    backtesting.strategy.custom_exit = MagicMock(return_value=False)
+    assert backtesting._init_exit_scan() is None
+    del backtesting.strategy.custom_exit
+
+    backtesting.timeframe_detail = "1m"
+    assert backtesting._init_exit_scan() is None
+
+
+@pytest.mark.parametrize("protections", [False, True])
+def test_backtest_stream_trades(default_conf_usdt, fee, mocker, protections) -> None:
+    """
+    Streaming closed trades to disk must produce the same results as keeping them in memory.
+    """
+
+    def _signals(dataframe, metadata):
+        dataframe["enter_long"] = np.where(dataframe.index % 7 == 0, 1, 0)
+        dataframe["exit_long"] = np.where(dataframe.index % 11 == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "stake_amount": "unlimited",
+            "available_capital": 1000,
+            "backtest_stream_batch_size": 5,
+            "enable_protections": protections,
+            "_strategy_protections": [
+                {"method": "CooldownPeriod", "stop_duration_candles": 2},
+                {
+                    "method": "StoplossGuard",
+                    "lookback_period_candles": 20,
+                    "trade_limit": 2,
+                    "stop_duration_candles": 10,
+                    "only_per_pair": True,
+                },
+            ],
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT"]
+    data = {
+        pair: generate_test_data("5m", 500, "2022-01-03 12:00:00+00:00", random_seed=idx)
+        for idx, pair in enumerate(pairs)
+    }
+
+    results = {}
+    for stream_trades in (True, False):
+        default_conf_usdt["backtest_stream_trades"] = stream_trades
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _signals
+        backtesting.strategy.advise_exit = _signals
+        sink_spy = mocker.spy(TradeSink, "flush")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[stream_trades] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        # Closed trades were written in batches - only the last ones stay in memory
+        assert (sink_spy.call_count > 2) == stream_trades
+        mocker.stop(sink_spy)
+        Backtesting.cleanup()
+
+    assert len(results[True]["results"]) > 20
+    pd.testing.assert_frame_equal(results[True]["results"], results[False]["results"])
+    assert results[True]["final_balance"] == results[False]["final_balance"]
+
+
+def test_trade_sink(fee) -> None:
+    trades = [
+        mock_trade_usdt_1(fee, False),
+        mock_trade_usdt_2(fee, False),
+        mock_trade_usdt_3(fee, False),
+    ]
+    closed = sorted(trades, key=lambda t: t.close_date_utc)
+    expected = trade_list_to_dataframe(closed)
+
+    sink = TradeSink(batch_size=2, retention=timedelta(minutes=5))
+    LocalTrade.bt_trades = closed[:1]
+    # Not enough trades for a batch
+    sink.maybe_flush(closed[0].close_date_utc + timedelta(minutes=5))
+    assert sink.trade_count == 0
+
+    # Only trades closed before the retention period are written
+    LocalTrade.bt_trades = list(closed)
+    sink.maybe_flush(closed[0].close_date_utc + timedelta(minutes=5))
+    assert sink.trade_count == 1
+    assert LocalTrade.bt_trades == closed[1:]
+
+    result = sink.load()
+    assert sink.trade_count == len(closed)
+    assert LocalTrade.bt_trades == []
+    pd.testing.assert_frame_equal(result, expected)
+    sink.close()
+
+    empty_sink = TradeSink(batch_size=2, retention=timedelta(0))
+    assert empty_sink.load().empty
+    empty_sink.close()
+
+
+def test_columnar_pair_data() -> None:
+    df = generate_test_data("5m", 10, "2022-01-03 12:00:00+00:00")
+    df["enter_long"] = 1.0
+    df["exit_long"] = 0.0
+    df["enter_short"] = 0.0
+    df["exit_short"] = 0.0
+    df["enter_tag"] = "tag"
+    df["exit_tag"] = None
+    headers = ["date", "open", "high", "low", "close", *df.columns[6:]]
+    rows = df[headers].values.tolist()
+    columnar = ColumnarPairData(df, headers)
+
+    assert len(columnar) == len(rows) == 10
+    for idx in (0, 4, 9, -1, -10):
+        row = columnar[idx]
+        assert len(row) == len(headers)
+        assert list(row) == rows[idx]
+        assert row == rows[idx]
+        assert row[0] == rows[idx][0]
+        assert isinstance(row[1], float)
+        assert row[5:] == rows[idx][5:]
+
+    with pytest.raises(IndexError):
+        columnar[10]
+    with pytest.raises(IndexError):
+        columnar[-11]
+    assert columnar.column(1) is columnar.column(1)
+    assert columnar.column(1).flags["C_CONTIGUOUS"]
+
+
+def test_funding_fee_series(default_conf_usdt, mocker) -> None:
+    exchange = get_patched_exchange(mocker, default_conf_usdt)
+    dates = pd.date_range("2022-01-01", periods=60, freq="8h", tz="UTC")
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "date": dates,
+            "open_fund": rng.normal(0.0001, 0.0002, size=60),
+            "open_mark": rng.normal(20, 1, size=60),
+        }
+    )
+    series = FundingFeeSeries(df)
+    assert series.source is df
+
+    for open_idx, close_idx in [(0, 59), (3, 3), (10, 25), (40, 59)]:
+        for is_short in (True, False):
+            for open_offset in (timedelta(0), timedelta(hours=1)):
+                kwargs = {
+                    "amount": 12.5,
+                    "is_short": is_short,
+                    "open_date": dates[open_idx].to_pydatetime() - open_offset,
+                    "close_date": dates[close_idx].to_pydatetime() + timedelta(hours=2),
+                }
+                assert series.calculate(**kwargs) == pytest.approx(
+                    exchange.calculate_funding_fees(df, **kwargs)
+                )
+
+    # Outside of the data
+    assert series.calculate(10, True, dt_utc(2021, 1, 1), dt_utc(2021, 6, 1)) == 0.0
+    assert FundingFeeSeries(df.iloc[0:0]).calculate(10, True, dates[0], dates[-1]) == 0.0
+
+    # Missing funding rates void the sum - like Exchange.calculate_funding_fees()
+    df.loc[20, "open_fund"] = np.nan
+    series = FundingFeeSeries(df)
+    assert series.calculate(10, True, dates[10], dates[30]) == 0.0
+    assert series.calculate(10, True, dates[10], dates[19]) == pytest.approx(
+        exchange.calculate_funding_fees(df, 10, True, dates[10], dates[19])
+    )
+    assert series.calculate(10, True, dates[21], dates[30]) != 0.0
+
+
+def test_detail_pair_data() -> None:
+    candles_1m = generate_test_data("1m", 100, "2022-01-03 12:00:00+00:00")
+    # Missing detail candles within one main candle, and for a full main candle
+    candles_1m = candles_1m.drop(index=[7, 8, *range(20, 25)]).reset_index(drop=True)
+    candles_5m = ohlcv_fill_up_missing_data(
+        generate_test_data("1m", 110, "2022-01-03 11:50:00+00:00"), "5m", "dummy"
+    )
+    detail = DetailPairData(candles_1m)
+    assert detail.source is candles_1m
+
+    starts, ends = detail.get_offsets(candles_5m["date"], timedelta(minutes=5))
+    assert len(starts) == len(ends) == len(candles_5m)
+    signals = [1.0, 0.0, 0.0, 0.0, "tag", None]
+    for idx, candle_date in enumerate(candles_5m["date"]):
+        # Reference: filter the detail dataframe
+        expected = candles_1m.loc[
+            (candles_1m["date"] >= candle_date)
+            & (candles_1m["date"] < candle_date + timedelta(minutes=5))
+        ]
+        assert ends[idx] - starts[idx] == len(expected)
+        rows = detail.get_rows(starts[idx], ends[idx], signals)
+        expected_rows = expected[["date", "open", "high", "low", "close"]].values.tolist()
+        assert rows == [r + signals for r in expected_rows]
+
+    # Before the detail data starts
+    assert starts[0] == ends[0] == 0
+    # Main candle without detail candles (12:20 - 12:25)
+    assert starts[6] == ends[6]
+
+
+@pytest.mark.parametrize("can_short", [True, False])
+def test_get_entry_candles(default_conf, mocker, can_short) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting._can_short = can_short
+
+    # All combinations of the 4 signal columns
+    combinations = np.array(np.meshgrid([0, 1], [0, 1], [0, 1], [0, 1])).T.reshape(-1, 4)
+    df = generate_test_data("5m", len(combinations), "2022-01-03 12:00:00+00:00")
+    df[["enter_long", "exit_long", "enter_short", "exit_short"]] = combinations
+    df["enter_tag"] = None
+    df["exit_tag"] = None
+
+    entries = backtesting._get_entry_candles(df)
+    assert len(entries) == len(df)
+    assert entries.sum() == 4
+    for row, has_entry in zip(df[HEADERS].values.tolist(), entries, strict=True):
+        assert (backtesting.check_for_trade_entry(row) is not None) == has_entry
+
+
+class SequentialParallel:
+    """Stand-in for joblib.Parallel - runs all tasks in the current process."""
+
+    def __init__(self, n_jobs):
+        self.n_jobs = n_jobs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def _effective_n_jobs(self):
+        return self.n_jobs
+
+    def __call__(self, tasks):
+        return [func(*args, **kwargs) for func, args, kwargs in tasks]
+
+
+def test_shared_data(tmp_path, testdatadir) -> None:
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC", "ETH/BTC"])
+    files = dump_shared_data(data, tmp_path)
+    assert list(files.keys()) == ["UNITTEST/BTC", "ETH/BTC"]
+    assert all(f.parent == tmp_path for f in files.values())
+
+    loaded = load_shared_data(files)
+    assert list(loaded.keys()) == ["UNITTEST/BTC", "ETH/BTC"]
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+        # Not copied - but read from the memory-mapped file
+        assert not loaded[pair]["close"].to_numpy().flags.writeable
+
+    empty = load_shared_data(dump_shared_data({"XRP/BTC": data["ETH/BTC"].iloc[:0]}, tmp_path))
+    pd.testing.assert_frame_equal(empty["XRP/BTC"], data["ETH/BTC"].iloc[:0])
+
+
+def test_backtest_strategies_parallel(default_conf, mocker, caplog, testdatadir) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    default_conf.update(
+        {
+            "strategy_list": [CURRENT_TEST_STRATEGY, "StrategyTestV2"],
+            "datadir": testdatadir,
+            "timeframe": "5m",
+            "timerange": "20180110-20180120",
+            "export": "signals",
+            "tradable_balance_ratio": 1.0,
+            "amend_last_stake_amount": False,
+            "runmode": RunMode.BACKTEST,
+        }
+    )
+    mocker.patch("freqtrade.optimize.backtesting.Parallel", SequentialParallel)
+    load_mock = mocker.spy(bt_parallel, "load_shared_data")
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+
+    backtesting = Backtesting(default_conf)
+    data, timerange = backtesting.load_bt_data()
+    dates = backtesting.backtest_strategies_parallel(backtesting.strategylist, data, 2)
+    # Candle data and detail data for both strategies
+    assert load_mock.call_count == 4
+    assert log_has("Running 2 backtest tasks using 2 parallel workers.", caplog)
+    assert backtesting.exchange._api is None
+
+    parallel_content = backtesting.all_bt_content
+    parallel_signals = backtesting.analysis_results["signals"]
+    assert set(parallel_content.keys()) == {CURRENT_TEST_STRATEGY, "StrategyTestV2"}
+    assert set(parallel_signals.keys()) == {CURRENT_TEST_STRATEGY, "StrategyTestV2"}
+    assert len(parallel_content[CURRENT_TEST_STRATEGY]["results"]) > 0
+
+    backtesting.all_bt_content = {}
+    backtesting.analysis_results = defaultdict(dict)
+    for strat in backtesting.strategylist:
+        assert backtesting.backtest_one_strategy(strat, data, timerange) == dates
+        name = strat.get_strategy_name()
+        pd.testing.assert_frame_equal(
+            parallel_content[name]["results"], backtesting.all_bt_content[name]["results"]
+        )
+        assert (
+            parallel_content[name]["final_balance"]
+            == backtesting.all_bt_content[name]["final_balance"]
+        )
+
+
+def test_backtest_strategies_parallel_processes(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    default_conf.update(
+        {
+            "strategy_list": [CURRENT_TEST_STRATEGY, "StrategyTestV2"],
+            "datadir": testdatadir,
+            "timeframe": "5m",
+            "timerange": "20180110-20180120",
+            "tradable_balance_ratio": 1.0,
+            "amend_last_stake_amount": False,
+            "runmode": RunMode.BACKTEST,
+        }
+    )
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["ETH/BTC"]),
+    )
+
+    backtesting = Backtesting(default_conf)
+    # Mocks don't exist in the worker processes
+    backtesting.exchange._markets = get_markets()
+    data, timerange = backtesting.load_bt_data()
+    # Real worker processes - pickling the backtesting object and the strategies
+    backtesting.backtest_strategies_parallel(backtesting.strategylist, data, 2)
+    parallel_content = backtesting.all_bt_content
+
+    backtesting.all_bt_content = {}
+    for strat in backtesting.strategylist:
+        backtesting.backtest_one_strategy(strat, data, timerange)
+        name = strat.get_strategy_name()
+        assert len(parallel_content[name]["results"]) > 0
+        pd.testing.assert_frame_equal(
+            parallel_content[name]["results"], backtesting.all_bt_content[name]["results"]
+        )
+
+
+@pytest.mark.parametrize(
+    "conf,expected",
+    [
+        ({}, True),
+        ({"backtest_shard_pairs": False}, False),
+        ({"backtest_jobs": 1}, False),
+        ({"max_open_trades": 3}, False),
+        ({"enable_protections": True}, False),
+        ({"position_stacking": True}, False),
+        ({"dry_run_wallet": 0.004}, True),
+    ],
+)
+def test_use_pair_shards(default_conf, mocker, caplog, conf, expected) -> None:
+    patch_exchange(mocker)
+    default_conf.update(
+        {
+            "max_open_trades": float("inf"),
+            "backtest_jobs": 2,
+            "backtest_shard_pairs": True,
+            "tradable_balance_ratio": 1.0,
+        }
+    )
+    default_conf.update(conf)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+
+    assert backtesting._use_pair_shards(5) is expected
+    # Sharding a single pair is pointless
+    assert backtesting._use_pair_shards(1) is False
+    if conf.get("backtest_shard_pairs", True) and conf.get("backtest_jobs", 2) > 1:
+        assert log_has_re(r"Pairs can't be backtested in parallel, as .*", caplog) != expected
+    assert log_has_re(r"Backtesting pairs in parallel, although .*", caplog) == (
+        "dry_run_wallet" in conf
+    )
+
+
+def _get_pair_shards_backtesting(default_conf, fee, mocker, testdatadir, conf):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": float("inf"),
+            "tradable_balance_ratio": 1.0,
+            "backtest_jobs": 2,
+        }
+    )
+    default_conf.update(conf)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.backtesting.Parallel", SequentialParallel)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+    backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+    processed = backtesting.strategy.advise_all_indicators(data)
+    return backtesting, processed
+
+
+def test_backtest_pair_shards(default_conf, fee, mocker, caplog, testdatadir) -> None:
+    backtesting, processed = _get_pair_shards_backtesting(
+        default_conf, fee, mocker, testdatadir, {"backtest_shard_pairs": True}
+    )
+    min_date, max_date = get_timerange(processed)
+
+    assert backtesting._use_pair_shards(len(processed))
+    sharded = backtesting.backtest_pair_shards(deepcopy(processed), min_date, max_date)
+    assert log_has("Backtesting 5 pairs in 2 independent shards.", caplog)
+    assert backtesting.pair_shard is None
+    assert set(sharded["results"]["pair"]) == set(processed)
+
+    result = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    sort_cols = ["close_date", "open_date", "pair"]
+    pd.testing.assert_frame_equal(
+        sharded["results"].sort_values(sort_cols, ignore_index=True),
+        result["results"].sort_values(sort_cols, ignore_index=True),
+    )
+    assert sharded["final_balance"] == pytest.approx(result["final_balance"])
+    assert sharded["rejected_signals"] == result["rejected_signals"]
+
+
+def test_backtest_pair_shards_low_wallet(default_conf, fee, mocker, caplog, testdatadir) -> None:
+    # The wallet covers 2 of 5 stakes - entries of other pairs are rejected while trades are open.
+    backtesting, processed = _get_pair_shards_backtesting(
+        default_conf, fee, mocker, testdatadir, {"dry_run_wallet": 0.0025}
+    )
+    min_date, max_date = get_timerange(processed)
+    shards_mock = mocker.spy(backtesting, "backtest_pair_shards")
+    backtest_mock = mocker.spy(backtesting, "backtest")
+
+    # Parallel workers alone don't split the pairs - the result equals a sequential backtest.
+    assert not backtesting._use_pair_shards(len(processed))
+    strategy = backtesting.strategylist[0]
+    backtesting.backtest_one_strategy(strategy, deepcopy(processed), TimeRange())
+    parallel = backtesting.all_bt_content[strategy.get_strategy_name()]
+    assert shards_mock.call_count == 0
+
+    backtesting.backtest_jobs = 1
+    backtesting.backtest_one_strategy(strategy, deepcopy(processed), TimeRange())
+    sequential = backtesting.all_bt_content[strategy.get_strategy_name()]
+    assert backtest_mock.call_count == 2
+    pd.testing.assert_frame_equal(parallel["results"], sequential["results"])
+    assert parallel["final_balance"] == sequential["final_balance"]
+    result = backtesting.backtest(deepcopy(processed), min_date, max_date)
+
+    # Shards start with the full balance each - and open trades the sequential backtest rejects.
+    backtesting.config["backtest_shard_pairs"] = True
+    backtesting.backtest_jobs = 2
+    assert backtesting._use_pair_shards(len(processed))
+    assert log_has_re(r"Backtesting pairs in parallel, although .*", caplog)
+    sharded = backtesting.backtest_pair_shards(deepcopy(processed), min_date, max_date)
+    assert len(sharded["results"]) > len(result["results"])
+    assert sharded["final_balance"] != pytest.approx(result["final_balance"])
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
     patch_exchange(mocker)
     mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest")
@@ -2747,6 +3527,79 @@ def test_time_pair_generator_refresh_pairlist(mocker, default_conf, dynamic_pair
         assert refresh_mock.call_count == 0
 
 
+def test_prepare_pairlist_timeline(mocker, default_conf, tmp_path, caplog):
+    patch_exchange(mocker)
+    default_conf["runmode"] = RunMode.BACKTEST
+    default_conf["enable_dynamic_pairlist"] = True
+    default_conf["pairlists"] = [
+        {"method": "StaticPairList"},
+        {"method": "ShuffleFilter", "seed": 42},
+    ]
+    start_date = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
+    end_date = start_date + timedelta(minutes=50)
+
+    # Whitelists when refreshing the pairlist on each candle
+    backtesting = Backtesting(default_conf)
+    backtesting.available_pairs = default_conf["exchange"]["pair_whitelist"]
+    expected = []
+    for _ in backtesting._time_generator(start_date, end_date):
+        backtesting.pairlists.refresh_pairlist(pairs=backtesting.available_pairs)
+        expected.append(backtesting.pairlists.whitelist)
+    assert len(expected) == 10
+    assert len({tuple(wl) for wl in expected}) > 1
+
+    backtesting = Backtesting(default_conf)
+    backtesting.available_pairs = default_conf["exchange"]["pair_whitelist"]
+    timeline = backtesting.prepare_pairlist_timeline(start_date, end_date)
+    assert timeline is not None
+    dates = backtesting._time_generator(start_date, end_date)
+    assert [timeline.get_whitelist(date) for date in dates] == expected
+
+    # Reused for the same timerange
+    refresh_mock = mocker.spy(backtesting.pairlists, "refresh_pairlist")
+    assert backtesting.prepare_pairlist_timeline(start_date, end_date) is timeline
+    assert refresh_mock.call_count == 0
+    # ... and for shorter timeranges with the same start (partial hyperopt backtests)
+    assert backtesting.prepare_pairlist_timeline(start_date, end_date - timedelta(minutes=20)) is (
+        timeline
+    )
+    assert refresh_mock.call_count == 0
+    assert backtesting.prepare_pairlist_timeline(
+        start_date, end_date + timedelta(minutes=5)
+    ) is not (timeline)
+
+    # Stored on disk with the indicator cache
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["backtest_indicator_cache"] = True
+    for _ in range(2):
+        backtesting = Backtesting(default_conf)
+        backtesting.available_pairs = default_conf["exchange"]["pair_whitelist"]
+        timeline = backtesting.prepare_pairlist_timeline(start_date, end_date)
+        dates = backtesting._time_generator(start_date, end_date)
+        assert [timeline.get_whitelist(date) for date in dates] == expected
+    assert len(list((tmp_path / "cache" / "pairlists").glob("*.json"))) == 1
+    assert log_has_re(r"Loading pairlist timeline from .*\.json\.", caplog)
+
+    # Not stored without a seed - every run shuffles differently
+    default_conf["pairlists"][1].pop("seed")
+    timelines = []
+    for _ in range(2):
+        backtesting = Backtesting(default_conf)
+        backtesting.available_pairs = default_conf["exchange"]["pair_whitelist"]
+        assert not backtesting.pairlists._pairlist_handlers[1].is_deterministic
+        timelines.append(backtesting.prepare_pairlist_timeline(start_date, end_date))
+    dates = list(backtesting._time_generator(start_date, end_date))
+    assert [timelines[0].get_whitelist(date) for date in dates] != [
+        timelines[1].get_whitelist(date) for date in dates
+    ]
+    assert len(list((tmp_path / "cache" / "pairlists").glob("*.json"))) == 1
+
+    # Not available if the pairlist depends on trades
+    default_conf["pairlists"].append({"method": "FullTradesFilter"})
+    backtesting = Backtesting(default_conf)
+    assert backtesting.prepare_pairlist_timeline(start_date, end_date) is None
+
+
 @pytest.mark.parametrize("dynamic_pairlist", [True, False])
 def test_time_pair_generator_open_trades_first(mocker, default_conf, dynamic_pairlist):
     patch_exchange(mocker)
@@ -2773,7 +3626,9 @@ def test_time_pair_generator_open_trades_first(mocker, default_conf, dynamic_pai
     start_date = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
     end_date = start_date + timedelta(minutes=5)
     dummy_row = (end_date, 1.0, 1.1, 0.9, 1.0, 0, 0, 0, 0, None, None)
-    data = {pair: [dummy_row] for pair in pairs}
+    # Pairs without open trades need an entry signal - otherwise they're skipped
+    entry_row = (end_date, 1.0, 1.1, 0.9, 1.0, 1, 0, 0, 0, None, None)
+    data = {pair: [dummy_row if pair in ("XRP/BTC", "NEO/BTC") else entry_row] for pair in pairs}
 
     def mock_refresh(self, **kwargs):
         # Simulate shuffle
@@ -2790,3 +3645,57 @@ def test_time_pair_generator_open_trades_first(mocker, default_conf, dynamic_pai
         assert processed_pairs == ["XRP/BTC", "NEO/BTC", "ETH/BTC", "LTC/BTC"]
     else:
         assert processed_pairs == ["XRP/BTC", "NEO/BTC", "LTC/BTC", "ETH/BTC"]
+
+
+def test_backtest_one_strategy_indicator_cache(
+    default_conf, fee, mocker, caplog, testdatadir, tmp_path
+) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    default_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "datadir": testdatadir,
+            "timeframe": "5m",
+            "timerange": "20180110-20180120",
+            "runmode": RunMode.BACKTEST,
+            "backtest_indicator_cache": True,
+        }
+    )
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    backtesting = Backtesting(default_conf)
+    assert backtesting.indicator_cache is not None
+    data, timerange = backtesting.load_bt_data()
+    strat = backtesting.strategylist[0]
+    advise_mock = mocker.spy(strat, "advise_all_indicators")
+
+    backtesting.backtest_one_strategy(strat, data, timerange)
+    assert advise_mock.call_count == 1
+    assert log_has("Loaded indicators for 0 of 1 pairs from the indicator cache.", caplog)
+    first = backtesting.all_bt_content[strat.get_strategy_name()]["results"]
+
+    backtesting.backtest_one_strategy(strat, data, timerange)
+    assert advise_mock.call_count == 1
+    assert log_has("Loaded indicators for 1 of 1 pairs from the indicator cache.", caplog)
+    pd.testing.assert_frame_equal(
+        first, backtesting.all_bt_content[strat.get_strategy_name()]["results"]
+    )
+
+    # Earlier end of the timerange - trimmed from the cached entry
+    short_data = {pair: df.iloc[:-1500] for pair, df in data.items()}
+    backtesting.backtest_one_strategy(strat, short_data, timerange)
+    assert advise_mock.call_count == 1
+    cached = backtesting.all_bt_content[strat.get_strategy_name()]["results"]
+    assert len(cached) < len(first)
+
+    backtesting.indicator_cache = None
+    backtesting.backtest_one_strategy(strat, short_data, timerange)
+    assert advise_mock.call_count == 2
+    pd.testing.assert_frame_equal(
+        cached, backtesting.all_bt_content[strat.get_strategy_name()]["results"]
+    )
@@ -1,4 +1,7 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import logging
+import os
+from copy import deepcopy
 from datetime import datetime, timedelta
 from functools import partial, wraps
 from pathlib import Path
@@ -6,18 +9,21 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pandas as pd
 import pytest
-from filelock import Timeout
+from filelock import FileLock, Timeout
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt import Hyperopt, hyperopt_optimizer
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_signal_batch import evaluate_signal_batch
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.pairlist_timeline import PairlistTimeline
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
-from freqtrade.strategy import IntParameter
+from freqtrade.strategy import IntParameter, IStrategy
 from freqtrade.util import dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -29,6 +35,8 @@ from tests.conftest import (
     patch_exchange,
     patched_configuration_load_config_file,
 )
+from tests.optimize.test_backtesting import SequentialParallel
+from tests.optimize.test_hyperopt_signal_batch import entry_conditions, exit_conditions
 
 
 def generate_result_metrics():
@@ -290,6 +298,32 @@ def test_start_filelock(mocker, hyperopt_conf, caplog) -> None:
     assert log_has("Another running instance of freqtrade Hyperopt detected.", caplog)
 
 
+def test_start_study_no_filelock(mocker, hyperopt_conf, tmp_path, caplog) -> None:
+    hyperopt_conf["user_data_dir"] = tmp_path
+    patched_configuration_load_config_file(mocker, hyperopt_conf)
+    mocker.patch("freqtrade.optimize.hyperopt.Hyperopt.__init__", return_value=None)
+    start_mock = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt.start")
+    patch_exchange(mocker)
+
+    args = [
+        "hyperopt",
+        "--config",
+        "config.json",
+        "--strategy",
+        "HyperoptableStrategy",
+        "--hyperopt-loss",
+        "SharpeHyperOptLossDaily",
+        "--study",
+        "test_study",
+    ]
+    pargs = get_args(args)
+    # Processes joining a study run side by side.
+    with FileLock(Hyperopt.get_lock_filename(hyperopt_conf)):
+        start_hyperopt(pargs)
+    assert start_mock.call_count == 1
+    assert not log_has("Another running instance of freqtrade Hyperopt detected.", caplog)
+
+
 def test_log_results_if_loss_improves(hyperopt, capsys) -> None:
     hyperopt.current_best_loss = 2
     hyperopt.total_epochs = 2
@@ -636,6 +670,27 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     generate_optimizer_value = hyperopt.hyperopter.generate_optimizer(optimizer_param)
     assert generate_optimizer_value == response_expected
 
+    # Loss only (partial backtests) - backtest statistics are only generated on access
+    stats_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.generate_strategy_stats",
+        wraps=generate_strategy_stats,
+    )
+    hyperopter = hyperopt.hyperopter
+    args = (backtest_result, hyperopter.min_date, hyperopter.max_date, optimizer_param, {}, 1)
+    res = hyperopter._get_results_dict(*args, loss_only=True)
+    assert res == {"loss": response_expected["loss"]}
+    assert stats_mock.call_count == 0
+
+    def stats_loss(*args, backtest_stats, **kwargs):
+        return -backtest_stats["profit_total"]
+
+    hyperopter.calculate_loss = stats_loss
+    res = hyperopter._get_results_dict(*args, loss_only=True)
+    assert stats_mock.call_count == 1
+    full = hyperopter._get_results_dict(*args)
+    assert stats_mock.call_count == 2
+    assert res == {"loss": -full["results_metrics"]["profit_total"]}
+
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
@@ -648,7 +703,7 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 4
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -1139,6 +1194,42 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
         opt.get_optimizer(42)
 
 
+def test_hyperopt_dynamic_pairlist(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 3,
+            "enable_dynamic_pairlist": True,
+            "pairlists": [
+                {"method": "StaticPairList"},
+                {"method": "ShuffleFilter", "seed": 42},
+            ],
+        }
+    )
+    generate_mock = mocker.spy(PairlistTimeline, "generate")
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    whitelist_mock = mocker.spy(opt.backtesting, "_get_whitelist")
+
+    hyperopt.start()
+    assert hyperopt.num_epochs_saved == 3
+    assert opt.backtesting.pairlists is None
+    # Precomputed once - and used by every epoch
+    assert generate_mock.call_count == 1
+    timeline = opt.backtesting.pairlist_timeline
+    assert timeline is not None
+    assert whitelist_mock.call_count > 0
+    assert all(c.args[2] is timeline for c in whitelist_mock.call_args_list)
+
+
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
 def test_in_strategy_auto_hyperopt_with_parallel(
     mocker, hyperopt_conf, tmp_path, fee, caplog
@@ -1235,6 +1326,302 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
     assert go.call_count == 3
 
 
+def test_hyperopt_pruning(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 12,
+            "hyperopt_pruning_rungs": 2,
+            "hyperopt_pruning_reduction_factor": 2,
+        }
+    )
+
+    def generate_optimizer(params_dict, fraction=1.0, signals=None):
+        return {
+            "loss": params_dict["buy_rsi"] * fraction,
+            "results_explanation": "foo result",
+            "params": {},
+            "results_metrics": generate_result_metrics(),
+        }
+
+    go = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.HyperOptimizer.generate_optimizer",
+        side_effect=generate_optimizer,
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.start()
+
+    fractions = [c.kwargs["fraction"] for c in go.call_args_list]
+    assert set(fractions) == {0.25, 0.5, 1.0}
+    assert fractions.count(0.25) == 12
+    # Only epochs which passed both partial backtests ran on the full timerange
+    assert fractions.count(1.0) == hyperopt.num_epochs_saved
+    assert 0 < hyperopt.num_epochs_saved < fractions.count(0.5) < 12
+    assert hyperopt.count_pruned_epochs == 12 - hyperopt.num_epochs_saved
+    trials = hyperopt.opt.get_trials(deepcopy=False)
+    assert len([t for t in trials if t.state == TrialState.PRUNED]) == (
+        hyperopt.count_pruned_epochs
+    )
+    assert len([t for t in trials if t.state == TrialState.COMPLETE]) == (hyperopt.num_epochs_saved)
+
+
+@pytest.mark.parametrize("storage", [None, "sqlite"])
+def test_hyperopt_study(mocker, hyperopt_conf, tmp_path, caplog, storage) -> None:
+    patch_exchange(mocker)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy"],
+            "epochs": 5,
+            "hyperopt_study": "test_study",
+        }
+    )
+    if storage:
+        hyperopt_conf["hyperopt_study_storage"] = f"sqlite:///{tmp_path / 'study.sqlite'}"
+
+    def generate_optimizer(params_dict, fraction=1.0, signals=None):
+        return {
+            "loss": params_dict["buy_rsi"] + params_dict["buy_plusdi"],
+            "results_explanation": "foo result",
+            "params": params_dict,
+            "results_metrics": generate_result_metrics(),
+        }
+
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.HyperOptimizer.generate_optimizer",
+        side_effect=generate_optimizer,
+    )
+    results_file = tmp_path / "hyperopt_results" / "strategy_HyperoptableStrategy_test_study.fthypt"
+
+    # Two "processes" joining the same study
+    hostname_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt.socket.gethostname", return_value="host1"
+    )
+    hyperopt1 = Hyperopt(hyperopt_conf)
+    assert hyperopt1.results_file == results_file
+    assert hyperopt1.data_pickle_file.name == f"hyperopt_tickerdata_host1_{os.getpid()}.pkl"
+    assert hyperopt1.optimizer_file.name == f"hyperopt_optimizer_host1_{os.getpid()}.pkl"
+    hyperopt1.start()
+    assert log_has("Ignoring the random state - processes joining a study must differ.", caplog)
+    assert log_has("Joining hyperopt study 'test_study'.", caplog)
+    # Per-process files are removed
+    assert not hyperopt1.data_pickle_file.is_file()
+    assert (tmp_path / "hyperopt_results" / "study_test_study.log").is_file() is not bool(storage)
+
+    hyperopt_conf["epochs"] = 4
+    # Same pid on another machine
+    hostname_mock.return_value = "host2"
+    hyperopt2 = Hyperopt(hyperopt_conf)
+    assert hyperopt2.data_pickle_file.name == f"hyperopt_tickerdata_host2_{os.getpid()}.pkl"
+    # The shared results file is kept
+    assert results_file.is_file()
+    hyperopt2.start()
+
+    epochs = [e for batch in HyperoptTools._read_results(results_file) for e in batch]
+    assert len(epochs) == 9
+    # Epochs are numbered by the trial number of the study
+    assert len({e["current_epoch"] for e in epochs}) == 9
+    assert min(e["current_epoch"] for e in epochs[5:]) > 5
+    trials = hyperopt2.opt.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
+    assert len(trials) == 9
+    # The best epoch of all processes
+    best_loss = min(e["loss"] for e in epochs)
+    assert hyperopt2.current_best_epoch["loss"] == best_loss
+    assert hyperopt2.opt.best_value == best_loss
+
+
+def test_generate_optimizer_partial(hyperopt, testdatadir) -> None:
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC"])
+    hyperopt.hyperopter.min_date = dt_utc(2018, 1, 10)
+    hyperopt.hyperopter.max_date = dt_utc(2018, 1, 20)
+    end_date, partial = hyperopt.hyperopter._get_partial_data(data, 0.25)
+    assert end_date == dt_utc(2018, 1, 12, 12)
+    for pair, df in partial.items():
+        assert df["date"].max() == end_date
+        assert df["date"].min() == data[pair]["date"].min()
+        assert len(df) < len(data[pair])
+
+    end_date, _ = hyperopt.hyperopter._get_partial_data(data, 0.33)
+    # Aligned to the timeframe
+    assert end_date == dt_utc(2018, 1, 13, 7, 10)
+
+
+@pytest.mark.parametrize("memo_size,advise_calls", [(512, 2), (0, 3)])
+def test_hyperopt_per_epoch_indicator_memo(
+    mocker, hyperopt_conf, tmp_path, fee, memo_size, advise_calls
+) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._indicator_memo", None)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._indicator_memo_key", None)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy", "sell"],
+            "epochs": 3,
+            "analyze_per_epoch": True,
+            "hyperopt_indicator_memo_size": memo_size,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    advise_mock = mocker.spy(IStrategy, "advise_all_indicators")
+
+    hyperopt.start()
+    assert hyperopt.num_epochs_saved == 3
+    # Without the memo, indicators are populated once per epoch.
+    # The indicators don't depend on any parameter - so with the memo,
+    # they're populated once per pair (ETH/BTC and LTC/BTC).
+    assert advise_mock.call_count == advise_calls
+
+
+@pytest.mark.parametrize("pruning_rungs", [0, 1])
+def test_hyperopt_signal_batching(mocker, hyperopt_conf, tmp_path, fee, caplog, pruning_rungs):
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    # Batches of 2 epochs - evaluated in this process
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Parallel", SequentialParallel)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["buy", "sell"],
+            "epochs": 4,
+            "hyperopt_jobs": 2,
+            "hyperopt_pruning_rungs": pruning_rungs,
+        }
+    )
+
+    def run_hyperopt(batching: bool) -> list[float]:
+        hyperopt = Hyperopt(deepcopy(hyperopt_conf))
+        opt = hyperopt.hyperopter
+        opt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+        opt.backtesting.strategy.populate_entry_conditions = entry_conditions
+        opt.backtesting.strategy.populate_exit_conditions = exit_conditions
+        opt.signal_batching = batching
+        hyperopt.start()
+        assert hyperopt.num_epochs_saved + hyperopt.count_pruned_epochs == 4
+        assert opt.signal_batching is batching
+        epochs = [e for batch in HyperoptTools._read_results(hyperopt.results_file) for e in batch]
+        return [e["loss"] for e in epochs]
+
+    batch_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.evaluate_signal_batch",
+        wraps=evaluate_signal_batch,
+    )
+    losses = run_hyperopt(False)
+    assert len(losses) > 0
+    assert batch_mock.call_count == 0
+
+    assert run_hyperopt(True) == losses
+    assert batch_mock.call_count == 2
+    assert [len(c.args[2]) for c in batch_mock.call_args_list] == [2, 2]
+    assert log_has("Evaluating the strategy's conditions for batches of epochs.", caplog)
+
+    # Data is loaded once for all batches - but not sent to the jobs
+    hyperopt = Hyperopt(deepcopy(hyperopt_conf))
+    opt = hyperopt.hyperopter
+    opt.backtesting.strategy.populate_entry_conditions = entry_conditions
+    opt.signal_batching = True
+    opt.prepare_hyperopt_data()
+    load_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", wraps=hyperopt_optimizer.load
+    )
+    assert len(opt.get_batch_signals([{"buy_rsi": 20}, {"buy_rsi": 30}])) == 2
+    assert len(opt.get_batch_signals([{"buy_rsi": 25}])) == 1
+    assert load_mock.call_count == 1
+    assert opt.batch_data is not None
+    assert opt.__getstate__()["batch_data"] is None
+
+    # Conditions which can't be evaluated for a batch are evaluated for each epoch
+    def entry_conditions_no_column(dataframe, metadata, params):
+        return {"enter_long": dataframe["rsi"] < params.buy_rsi}
+
+    caplog.clear()
+    hyperopt = Hyperopt(deepcopy(hyperopt_conf))
+    opt = hyperopt.hyperopter
+    opt.backtesting.strategy.populate_entry_conditions = entry_conditions_no_column
+    opt.signal_batching = True
+    opt.prepare_hyperopt_data()
+    assert opt.get_batch_signals([{"buy_rsi": 20}, {"buy_rsi": 30}]) is None
+    assert opt.signal_batching is False
+    assert log_has_re(r"Evaluating conditions for each epoch: Conditions can't be", caplog)
+
+
+def test_in_strategy_auto_hyperopt_worker_pool(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    # Reset the worker state of the (main) process after the test
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._worker_optimizer", None)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer._worker_optimizer_key", None)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 3,
+            "hyperopt_worker_pool": True,
+            "fee": fee.return_value,
+        }
+    )
+    load_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load",
+        wraps=hyperopt_optimizer.load,
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+
+    hyperopt.start()
+    assert hyperopt.optimizer_file.is_file()
+    assert hyperopt.num_epochs_saved == 3
+    # Epochs run on the worker's copy of the strategy
+    assert hyperopt.hyperopter.backtesting.strategy.buy_rsi.value == 35
+    # Data is loaded once, not once per epoch
+    assert load_mock.call_count == 1
+
+    worker_optimizer = hyperopt_optimizer._worker_optimizer
+    assert worker_optimizer is not None
+    assert worker_optimizer is not hyperopt.hyperopter
+    assert worker_optimizer.processed is not None
+    assert set(worker_optimizer.processed.keys()) == {"ETH/BTC", "LTC/BTC"}
+
+    # Jobs only contain the parameters - not the optimizer
+    jobs = hyperopt.run_optimizer_parallel(MagicMock(side_effect=list), [{"buy_rsi": 20}])
+    assert len(jobs) == 1
+    assert jobs[0][0] is hyperopt_optimizer.generate_optimizer_pooled
+    assert jobs[0][1][0] == hyperopt.optimizer_file
+    assert jobs[0][1][-1] == {"buy_rsi": 20}
+
+    # A changed optimizer file is loaded again
+    hyperopt.hyperopter.dump_optimizer(hyperopt.optimizer_file)
+    os.utime(hyperopt.optimizer_file, ns=(0, 0))
+    assert hyperopt_optimizer._get_worker_optimizer(hyperopt.optimizer_file, None, logging.INFO)
+    assert hyperopt_optimizer._worker_optimizer is not worker_optimizer
+    assert load_mock.call_count == 2
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert space._contains(1.5)
@@ -0,0 +1,95 @@
+from freqtrade.data.history import load_data
+from freqtrade.optimize.hyperopt.hyperopt_indicator_memo import IndicatorMemo
+from freqtrade.resolvers import StrategyResolver
+from tests.conftest import CURRENT_TEST_STRATEGY
+
+
+def _get_strategy(default_conf):
+    default_conf["strategy"] = CURRENT_TEST_STRATEGY
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    populate_indicators = strategy.populate_indicators
+
+    def populate_with_parameter(dataframe, metadata):
+        dataframe = populate_indicators(dataframe, metadata)
+        dataframe["sma"] = dataframe["close"].rolling(strategy.buy_rsi.value).mean()
+        return dataframe
+
+    strategy.populate_indicators = populate_with_parameter
+    return strategy
+
+
+def test_indicator_memo_advise_all_indicators(mocker, default_conf, testdatadir):
+    strategy = _get_strategy(default_conf)
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC"])
+    memo = IndicatorMemo(100 * 1024 * 1024)
+    advise_mock = mocker.spy(strategy, "advise_all_indicators")
+
+    res = memo.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 2
+    assert (memo.hits, memo.misses) == (0, 2)
+    assert len(memo) == 2
+    assert memo.size > 0
+    expected = strategy.advise_all_indicators(data)
+    for pair in data:
+        assert res[pair].equals(expected[pair])
+
+    # Parameters not used for indicators don't populate the indicators again
+    advise_mock.reset_mock()
+    strategy.sell_rsi.value = 80
+    strategy.buy_plusdi.value = 0.2
+    res2 = memo.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 0
+    assert (memo.hits, memo.misses) == (2, 2)
+    for pair in data:
+        assert res2[pair].equals(expected[pair])
+        # Results are copies - changes don't modify the memo
+        res2[pair]["enter_long"] = 1
+    assert "enter_long" not in memo.advise_all_indicators(strategy, data)["ETH/BTC"]
+
+    # Changed indicator parameter
+    buy_rsi = strategy.buy_rsi.value
+    strategy.buy_rsi.value = buy_rsi + 10
+    res3 = memo.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 2
+    assert (memo.hits, memo.misses) == (4, 4)
+    assert len(memo) == 4
+    assert not res3["ETH/BTC"]["sma"].equals(expected["ETH/BTC"]["sma"])
+
+    # Back to the previous value
+    strategy.buy_rsi.value = buy_rsi
+    res4 = memo.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 2
+    assert (memo.hits, memo.misses) == (6, 4)
+    assert res4["ETH/BTC"].equals(expected["ETH/BTC"])
+
+
+def test_indicator_memo_max_size(default_conf, testdatadir):
+    strategy = _get_strategy(default_conf)
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC"])
+    size = int(strategy.advise_all_indicators(data)["UNITTEST/BTC"].memory_usage(index=True).sum())
+
+    memo = IndicatorMemo(int(size * 2.5))
+    for value in (10, 20, 30):
+        strategy.buy_rsi.value = value
+        memo.advise_all_indicators(strategy, data)
+    assert len(memo) == 2
+    assert memo.size == size * 2
+
+    # Least recently used entry (10) was evicted
+    strategy.buy_rsi.value = 20
+    memo.advise_all_indicators(strategy, data)
+    assert (memo.hits, memo.misses) == (1, 3)
+    strategy.buy_rsi.value = 10
+    memo.advise_all_indicators(strategy, data)
+    assert (memo.hits, memo.misses) == (1, 4)
+    # 30 was evicted - 20 was used more recently.
+    strategy.buy_rsi.value = 20
+    memo.advise_all_indicators(strategy, data)
+    assert (memo.hits, memo.misses) == (2, 4)
+
+    # Entries above the budget aren't stored
+    memo = IndicatorMemo(size - 1)
+    memo.advise_all_indicators(strategy, data)
+    assert len(memo) == 0
+    assert memo.size == 0
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from freqtrade.data.history import load_data
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt.hyperopt_signal_batch import (
+    evaluate_signal_batch,
+    expand_signals,
+)
+from freqtrade.resolvers import StrategyResolver
+
+
+def entry_conditions(dataframe, metadata, params):
+    col = params.column
+    return {
+        "enter_long": (
+            (col(dataframe["rsi"]) < params.buy_rsi)
+            & (col(dataframe["fastd"]) < 35)
+            & (col(dataframe["adx"]) > 30)
+            & (col(dataframe["plus_di"]) > params.buy_plusdi)
+        )
+        | ((col(dataframe["adx"]) > 65) & (col(dataframe["plus_di"]) > params.buy_plusdi))
+    }
+
+
+def exit_conditions(dataframe, metadata, params):
+    return {"exit_long": params.column(dataframe["rsi"]) > params.sell_rsi}
+
+
+def _get_strategy(default_conf):
+    default_conf["strategy"] = "HyperoptableStrategy"
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    strategy.populate_entry_conditions = entry_conditions
+    strategy.populate_exit_conditions = exit_conditions
+    return strategy
+
+
+def test_evaluate_signal_batch(default_conf, testdatadir):
+    strategy = _get_strategy(default_conf)
+    data = strategy.advise_all_indicators(load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC"]))
+    params_list = [
+        {"buy_rsi": 20, "buy_plusdi": 0.2, "sell_rsi": 60},
+        {"buy_rsi": 40, "buy_plusdi": 0.1, "sell_rsi": 80},
+        # Parameters which are not part of the epoch use the current value
+        {"buy_rsi": 45},
+    ]
+    current = {name: param.value for name, param in strategy.enumerate_parameters()}
+    signals = evaluate_signal_batch(strategy, data, params_list)
+    assert len(signals) == 3
+
+    for params, candidate_signals in zip(params_list, signals, strict=True):
+        assert set(candidate_signals) == {"UNITTEST/BTC", "ETH/BTC"}
+        for name, param in strategy.enumerate_parameters():
+            param.value = params.get(name, current[name])
+        for pair, df in data.items():
+            pair_signals = candidate_signals[pair]
+            assert set(pair_signals) == {"enter_long", "exit_long"}
+            # Indexes of the candles with a signal
+            assert pair_signals["enter_long"].dtype == np.int32
+            expanded = expand_signals(candidate_signals, data)[pair]
+            assert expanded["enter_long"].dtype == bool
+            assert len(expanded["enter_long"]) == len(df)
+            # Identical to evaluating the conditions for each epoch
+            expected = strategy.ft_advise_signals(df.copy(), {"pair": pair})
+            assert np.array_equal(expanded["enter_long"], expected["enter_long"] == 1)
+            assert np.array_equal(expanded["exit_long"], expected["exit_long"] == 1)
+            # ... and to the strategy's populate_entry_trend()
+            populated = strategy.populate_entry_trend(df.copy(), {"pair": pair})
+            assert np.array_equal(expanded["enter_long"], populated["enter_long"] == 1)
+    assert len(signals[0]["ETH/BTC"]["enter_long"]) != len(signals[1]["ETH/BTC"]["enter_long"])
+
+
+def test_expand_signals():
+    data = {"ETH/BTC": DataFrame({"close": range(5)}), "LTC/BTC": DataFrame({"close": range(3)})}
+    signals = {
+        "ETH/BTC": {"enter_long": np.array([0, 3], dtype=np.int32)},
+        # Cut short by pruning
+        "LTC/BTC": {"enter_long": np.array([1, 4], dtype=np.int32)},
+        "XRP/BTC": {"enter_long": np.array([1], dtype=np.int32)},
+    }
+    expanded = expand_signals(signals, data)
+    assert set(expanded) == {"ETH/BTC", "LTC/BTC"}
+    assert expanded["ETH/BTC"]["enter_long"].tolist() == [True, False, False, True, False]
+    assert expanded["LTC/BTC"]["enter_long"].tolist() == [False, True, False]
+
+
+def test_evaluate_signal_batch_errors(default_conf, testdatadir):
+    strategy = _get_strategy(default_conf)
+    data = strategy.advise_all_indicators(load_data(testdatadir, "5m", ["UNITTEST/BTC"]))
+    params_list = [{"buy_rsi": 20}, {"buy_rsi": 40}]
+
+    def conditions_reading_value(dataframe, metadata, params):
+        return {"enter_long": params.column(dataframe["rsi"]) < strategy.buy_rsi.value}
+
+    strategy.populate_entry_conditions = conditions_reading_value
+    with pytest.raises(OperationalException, match=r"read the values of buy_rsi"):
+        evaluate_signal_batch(strategy, data, params_list)
+
+    # Values of parameters not part of the batch can be read
+    assert len(evaluate_signal_batch(strategy, data, [{"sell_rsi": 60}, {"sell_rsi": 80}])) == 2
+
+    def conditions_no_column(dataframe, metadata, params):
+        return {"enter_long": (dataframe["rsi"] < params.buy_rsi) & (dataframe["volume"] > 0)}
+
+    strategy.populate_entry_conditions = conditions_no_column
+    with pytest.raises(OperationalException, match=r"can't be evaluated for a batch"):
+        evaluate_signal_batch(strategy, data, params_list)
+
+    def conditions_wrong_shape(dataframe, metadata, params):
+        return {"enter_long": np.ones((len(dataframe), 3), dtype=bool)}
+
+    strategy.populate_entry_conditions = conditions_wrong_shape
+    with pytest.raises(OperationalException, match=r"has shape \(\d+, 3\)"):
+        evaluate_signal_batch(strategy, data, params_list)
+
+    def conditions_invalid_column(dataframe, metadata, params):
+        return {"exit_long": params.column(dataframe["rsi"]) > params.buy_rsi}
+
+    strategy.populate_entry_conditions = conditions_invalid_column
+    with pytest.raises(OperationalException, match=r"invalid signal columns exit_long"):
+        evaluate_signal_batch(strategy, data, params_list)
@@ -1,3 +1,4 @@
+import json
 import logging
 import re
 from pathlib import Path
@@ -8,8 +9,14 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_results_index import (
+    get_hyperopt_index_filename,
+    open_hyperopt_results_index,
+)
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
+from tests.conftest_hyperopt import hyperopt_test_result
 
 
 # Functions for recurrent object patching
@@ -61,6 +68,128 @@ def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
         HyperoptTools.load_filtered_results(results_file, {})
 
 
+def write_results(results_file: Path, epochs: list[dict]) -> None:
+    with results_file.open("a") as f:
+        for epoch in epochs:
+            f.write(json.dumps(epoch, default=str) + "\n")
+
+
+def get_filteroptions(config: dict) -> dict:
+    return {
+        "only_best": config.get("hyperopt_list_best", False),
+        "only_profitable": config.get("hyperopt_list_profitable", False),
+        "filter_min_trades": config.get("hyperopt_list_min_trades", 0),
+        "filter_max_trades": config.get("hyperopt_list_max_trades", 0),
+        **{
+            f"filter_{bound}_{name}": config.get(f"hyperopt_list_{bound}_{name}")
+            for bound in ("min", "max")
+            for name in ("avg_time", "avg_profit", "total_profit", "objective")
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"hyperopt_list_best": True},
+        {"hyperopt_list_profitable": True},
+        {"hyperopt_list_min_trades": 40, "hyperopt_list_max_trades": 300},
+        {"hyperopt_list_min_avg_time": 2000, "hyperopt_list_max_avg_time": 5000},
+        {"hyperopt_list_min_avg_profit": -0.5, "hyperopt_list_max_avg_profit": 0.4},
+        {"hyperopt_list_min_total_profit": -0.01, "hyperopt_list_max_total_profit": 0.1},
+        {"hyperopt_list_min_objective": 1, "hyperopt_list_max_objective": -1},
+        {"hyperopt_list_profitable": True, "hyperopt_list_min_objective": 0.5},
+    ],
+)
+def test_load_filtered_results_index(tmp_path, config) -> None:
+    results_file = tmp_path / "results.fthypt"
+    write_results(results_file, hyperopt_test_result())
+    epochs = [rapidjson.loads(line) for line in results_file.read_text().splitlines()]
+    expected = hyperopt_filter_epochs(epochs, get_filteroptions(config), log=False)
+
+    results, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    assert total_epochs == 12
+    assert results == expected
+
+    summaries, _ = HyperoptTools.load_filtered_results(results_file, config, details=False)
+    assert [s["current_epoch"] for s in summaries] == [e["current_epoch"] for e in expected]
+    for summary, epoch in zip(summaries, expected, strict=True):
+        assert summary["params_details"] == epoch["params_details"]
+        assert (
+            summary["results_metrics"]["profit_total"] == epoch["results_metrics"]["profit_total"]
+        )
+        assert HyperoptTools.load_epoch_details(results_file, summary) == epoch
+
+
+def test_hyperopt_results_index(tmp_path, mocker, caplog) -> None:
+    results_file = tmp_path / "results.fthypt"
+    epochs = hyperopt_test_result()
+    for epoch in epochs:
+        epoch["results_metrics"]["results_per_pair"] = [{"key": "ETH/BTC"}]
+    write_results(results_file, epochs[:5])
+    # Epoch which is still being written
+    with results_file.open("a") as f:
+        f.write('{"loss": 1')
+
+    with open_hyperopt_results_index(results_file) as index:
+        assert len(index) == 5
+        summaries = index.query(get_filteroptions({}))
+        assert [s["position"] for s in summaries] == [0, 1, 2, 3, 4]
+        # Nested results metrics are only available from the results file
+        assert "results_per_pair" not in summaries[0]["results_metrics"]
+        assert index.get_epoch(4)["results_metrics"]["results_per_pair"] == [{"key": "ETH/BTC"}]
+        best = index.get_best_position()
+        assert index.get_epoch(best)["loss"] == min(e["loss"] for e in epochs[:5])
+        with pytest.raises(OperationalException, match=r"Epoch at position 5 not found\."):
+            index.get_epoch(5)
+    assert get_hyperopt_index_filename(results_file).is_file()
+
+    # Complete the pending epoch, and add more epochs - only new epochs are read.
+    content = results_file.read_text()
+    results_file.write_text(content[: content.rindex("\n") + 1])
+    write_results(results_file, epochs[5:])
+    loads_mock = mocker.spy(rapidjson, "loads")
+    with open_hyperopt_results_index(results_file) as index:
+        assert len(index) == 12
+        assert loads_mock.call_count == 7
+        assert index.get_epoch(11)["current_epoch"] == epochs[11]["current_epoch"]
+
+    # Replaced results file
+    results_file.unlink()
+    write_results(results_file, epochs[3:6])
+    with open_hyperopt_results_index(results_file) as index:
+        assert len(index) == 3
+        assert index.get_epoch(0)["current_epoch"] == epochs[3]["current_epoch"]
+    assert log_has_re("Rebuilding the hyperopt results index of .*", caplog)
+
+
+def test_hyperopt_results_index_fallback(tmp_path, caplog) -> None:
+    results_file = tmp_path / "results.fthypt"
+    write_results(results_file, hyperopt_test_result())
+    # Index can't be created
+    get_hyperopt_index_filename(results_file).mkdir()
+
+    with open_hyperopt_results_index(results_file) as index:
+        assert len(index) == 12
+    assert log_has_re("Could not use hyperopt results index of .*", caplog)
+
+
+def test_hyperopt_results_index_errors(tmp_path) -> None:
+    results_file = tmp_path / "results.fthypt"
+    epochs = hyperopt_test_result()
+    del epochs[0]["results_metrics"]["holding_avg_s"]
+    write_results(results_file, epochs)
+    with pytest.raises(OperationalException, match=r"Holding-average not available.*"):
+        HyperoptTools.load_filtered_results(results_file, {"hyperopt_list_min_avg_time": 1})
+
+    results_file = tmp_path / "results_old.fthypt"
+    del epochs[0]["is_best"]
+    write_results(results_file, epochs)
+    with pytest.raises(OperationalException, match=r"The file with HyperoptTools results is.*"):
+        HyperoptTools.load_filtered_results(results_file, {})
+
+
 @pytest.mark.parametrize(
     "spaces, expected_results",
     [
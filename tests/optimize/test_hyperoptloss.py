@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from freqtrade.data.metrics import MetricsContext, calculate_max_drawdown
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_short_trade_dur import ShortTradeDurHyperOptLoss
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
@@ -238,3 +239,44 @@ def test_loss_functions_better_profits(default_conf, hyperopt_results, lossfunct
     )
     assert over < correct
     assert under > correct
+
+
+@pytest.mark.parametrize(
+    "lossfunction",
+    [
+        "SortinoHyperOptLoss",
+        "SharpeHyperOptLoss",
+        "MaxDrawDownHyperOptLoss",
+        "CalmarHyperOptLoss",
+        "ProfitDrawDownHyperOptLoss",
+        "MultiMetricHyperOptLoss",
+    ],
+)
+def test_loss_functions_metrics_context(mocker, default_conf, hyperopt_results, lossfunction):
+    default_conf.update({"hyperopt_loss": lossfunction})
+    hl = HyperOptLossResolver.load_hyperoptloss(default_conf)
+    kwargs = {
+        "results": hyperopt_results,
+        "trade_count": len(hyperopt_results),
+        "min_date": datetime(2019, 1, 1),
+        "max_date": datetime(2019, 5, 1),
+        "config": default_conf,
+        "processed": None,
+        "backtest_stats": {"profit_total": hyperopt_results["profit_abs"].sum()},
+        "starting_balance": default_conf["dry_run_wallet"],
+    }
+    expected = hl.hyperopt_loss_function(**kwargs)
+
+    metrics = MetricsContext(
+        hyperopt_results,
+        kwargs["min_date"],
+        kwargs["max_date"],
+        default_conf["dry_run_wallet"],
+    )
+    drawdown_mock = mocker.patch(
+        "freqtrade.data.metrics.calculate_max_drawdown", wraps=calculate_max_drawdown
+    )
+    assert hl.hyperopt_loss_function(**kwargs, metrics=metrics) == expected
+    # Metrics already calculated by the context are reused
+    assert hl.hyperopt_loss_function(**kwargs, metrics=metrics) == expected
+    assert drawdown_mock.call_count <= 1
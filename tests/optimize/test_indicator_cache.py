@@ -0,0 +1,105 @@
+import os
+
+import pandas as pd
+
+from freqtrade.data.history import load_data
+from freqtrade.optimize.indicator_cache import IndicatorCache, get_indicator_cache_dir
+from freqtrade.resolvers import StrategyResolver
+from tests.conftest import CURRENT_TEST_STRATEGY, log_has_re
+
+
+def _get_data(testdatadir):
+    return load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC"])
+
+
+def test_indicator_cache_advise_all_indicators(mocker, default_conf, testdatadir, tmp_path, caplog):
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["datadir"] = testdatadir
+    default_conf["strategy"] = CURRENT_TEST_STRATEGY
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    data = _get_data(testdatadir)
+    cache = IndicatorCache(default_conf)
+    advise_mock = mocker.spy(strategy, "advise_all_indicators")
+
+    res = cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    assert set(advise_mock.call_args[0][0].keys()) == {"UNITTEST/BTC", "ETH/BTC"}
+    assert log_has_re(r"Loaded indicators for 0 of 2 pairs from the indicator cache\.", caplog)
+    assert len(cache.get_entries()) == 2
+    assert {e.pair for e in cache.get_entries()} == {"UNITTEST_BTC", "ETH_BTC"}
+
+    # Second run - everything is loaded from the cache
+    advise_mock.reset_mock()
+    res2 = cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 0
+    assert log_has_re(r"Loaded indicators for 2 of 2 pairs from the indicator cache\.", caplog)
+    for pair in data:
+        assert res2[pair].equals(res[pair])
+
+    # Earlier end of the timerange - trimmed from the cached entry
+    full_eth = data["ETH/BTC"]
+    data["ETH/BTC"] = full_eth.iloc[:-10].reset_index(drop=True)
+    res3 = cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 0
+    assert len(res3["ETH/BTC"]) == len(data["ETH/BTC"])
+    pd.testing.assert_frame_equal(res3["ETH/BTC"], res["ETH/BTC"].iloc[:-10])
+
+    # Extended timerange - analyzed again, replacing the shorter entry
+    data["ETH/BTC"] = full_eth
+    cache._store(
+        next(get_indicator_cache_dir(default_conf).glob("*/ETH_BTC-*.feather")),
+        res["ETH/BTC"].iloc[:-10],
+    )
+    cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    assert list(advise_mock.call_args[0][0].keys()) == ["ETH/BTC"]
+    assert len(cache.get_entries()) == 2
+
+    # Changed candles of one pair - only this pair is analyzed again
+    advise_mock.reset_mock()
+    data["ETH/BTC"] = full_eth.copy()
+    data["ETH/BTC"].loc[5, "close"] += 1
+    res4 = cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    assert list(advise_mock.call_args[0][0].keys()) == ["ETH/BTC"]
+    assert res4["ETH/BTC"].loc[5, "close"] == data["ETH/BTC"].loc[5, "close"]
+
+    # Data not loaded from a data file - keyed by the candles
+    default_conf["datadir"] = tmp_path / "nodata"
+    advise_mock.reset_mock()
+    cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    assert len(cache.get_entries()) == 4
+
+    # Changed parameters - new entries for all pairs
+    advise_mock.reset_mock()
+    strategy.buy_rsi.value = strategy.buy_rsi.value + 1
+    cache.advise_all_indicators(strategy, data)
+    assert advise_mock.call_count == 1
+    assert len(advise_mock.call_args[0][0]) == 2
+
+
+def test_indicator_cache_evict_purge(mocker, default_conf, testdatadir, tmp_path, caplog):
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["strategy"] = CURRENT_TEST_STRATEGY
+    strategy = StrategyResolver.load_strategy(default_conf)
+    cache = IndicatorCache(default_conf)
+    cache.advise_all_indicators(strategy, _get_data(testdatadir))
+    entries = sorted(get_indicator_cache_dir(default_conf).glob("*/*.feather"))
+    assert len(entries) == 2
+    # Mark the first entry as the least recently used one
+    os.utime(entries[0], (1, 1))
+
+    cache._max_size = entries[1].stat().st_size
+    assert cache.evict() == 1
+    assert log_has_re(r"Evicted 1 entries from the indicator cache\.", caplog)
+    assert not entries[0].is_file()
+    assert entries[1].is_file()
+    assert cache.evict() == 0
+
+    assert cache.purge() == 1
+    assert cache.get_entries() == []
+    assert not any(get_indicator_cache_dir(default_conf).iterdir())
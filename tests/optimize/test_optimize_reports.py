@@ -14,7 +14,9 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT, LAST_BT_RESULT_FN
 from freqtrade.data import history
 from freqtrade.data.btanalysis import (
+    bt_fileutils,
     get_latest_backtest_filename,
+    load_backtest_analysis_data,
     load_backtest_data,
     load_backtest_stats,
 )
@@ -31,7 +33,10 @@ from freqtrade.optimize.optimize_reports import (
     text_table_bt_results,
     text_table_strategy,
 )
-from freqtrade.optimize.optimize_reports.bt_output import text_table_tags
+from freqtrade.optimize.optimize_reports.bt_output import (
+    text_table_callback_profile,
+    text_table_tags,
+)
 from freqtrade.optimize.optimize_reports.optimize_reports import (
     _get_resample_from_period,
     calc_streak,
@@ -40,7 +45,7 @@ from freqtrade.optimize.optimize_reports.optimize_reports import (
 from freqtrade.resolvers.strategy_resolver import StrategyResolver
 from freqtrade.util import dt_ts, format_duration
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_utc
-from tests.conftest import CURRENT_TEST_STRATEGY, log_has_re
+from tests.conftest import CURRENT_TEST_STRATEGY, generate_test_data, log_has_re
 from tests.data.test_history import _clean_test_file
 
 
@@ -352,7 +357,11 @@ def test_store_backtest_results_real(tmp_path, caplog):
 
 
 def test_write_read_backtest_candles(tmp_path):
-    candle_dict = {"DefStrat": {"UNITTEST/BTC": pd.DataFrame()}}
+    signal_df = generate_test_data("5m", 10, "2022-01-03 12:00:00+00:00")
+    candle_dict = {
+        "DefStrat": {"UNITTEST/BTC": signal_df, "ETH/BTC": pd.DataFrame()},
+        "OtherStrat": {"UNITTEST/BTC": signal_df.iloc[[2, 4]]},
+    }
     bt_results = {"metadata": {}, "strategy": {}, "strategy_comparison": []}
 
     mock_conf = {
@@ -370,29 +379,140 @@ def test_write_read_backtest_candles(tmp_path):
     }
     store_backtest_results(mock_conf, bt_results, sample_date, analysis_results=data)
     stored_file = tmp_path / f"backtest-result-{sample_date}.zip"
-    signals_pkl = f"backtest-result-{sample_date}_signals.pkl"
-    rejected_pkl = f"backtest-result-{sample_date}_rejected.pkl"
-    exited_pkl = f"backtest-result-{sample_date}_exited.pkl"
-    assert not (tmp_path / signals_pkl).is_file()
+    assert not (tmp_path / f"backtest-result-{sample_date}_signals.pkl").is_file()
     assert stored_file.is_file()
 
     with ZipFile(stored_file, "r") as zipf:
-        assert signals_pkl in zipf.namelist()
-        assert rejected_pkl in zipf.namelist()
-        assert exited_pkl in zipf.namelist()
-
-        # open and read the file
-        with zipf.open(signals_pkl) as scp:
-            pickled_signal_candles = joblib.load(scp)
+        for name in ("signals", "rejected", "exited"):
+            assert f"backtest-result-{sample_date}_{name}.json" in zipf.namelist()
+            assert f"backtest-result-{sample_date}_{name}.pkl" not in zipf.namelist()
+        assert len([n for n in zipf.namelist() if n.endswith(".feather")]) == 3
+
+    signal_candles = load_backtest_analysis_data(tmp_path, "signals")
+    assert signal_candles.keys() == candle_dict.keys()
+    assert signal_candles["DefStrat"].keys() == candle_dict["DefStrat"].keys()
+    pd.testing.assert_frame_equal(signal_candles["DefStrat"]["UNITTEST/BTC"], signal_df)
+    assert signal_candles["DefStrat"]["ETH/BTC"].empty
+    pd.testing.assert_frame_equal(
+        signal_candles["OtherStrat"]["UNITTEST/BTC"],
+        signal_df.iloc[[2, 4]].reset_index(drop=True),
+    )
+    assert load_backtest_analysis_data(tmp_path, "rejected") == {}
 
-    assert pickled_signal_candles.keys() == candle_dict.keys()
-    assert pickled_signal_candles["DefStrat"].keys() == pickled_signal_candles["DefStrat"].keys()
-    assert pickled_signal_candles["DefStrat"]["UNITTEST/BTC"].equals(
-        pickled_signal_candles["DefStrat"]["UNITTEST/BTC"]
+    # Projection
+    signal_candles = load_backtest_analysis_data(
+        tmp_path, "signals", strategy="DefStrat", pairs=["UNITTEST/BTC"], columns=["date", "close"]
+    )
+    assert list(signal_candles.keys()) == ["DefStrat"]
+    assert list(signal_candles["DefStrat"].keys()) == ["UNITTEST/BTC"]
+    pd.testing.assert_frame_equal(
+        signal_candles["DefStrat"]["UNITTEST/BTC"], signal_df[["date", "close"]]
+    )
+    signal_candles = load_backtest_analysis_data(
+        tmp_path, "signals", pairs=["ETH/BTC"], columns=["date"]
     )
+    assert signal_candles["OtherStrat"] == {}
+    assert list(signal_candles["DefStrat"].keys()) == ["ETH/BTC"]
 
     _clean_test_file(stored_file)
 
+    # Results with pickled analysis data
+    legacy_file = tmp_path / f"backtest-result-{sample_date}.zip"
+    with ZipFile(legacy_file, "w") as zipf:
+        with zipf.open(f"backtest-result-{sample_date}_signals.pkl", "w") as pkl:
+            joblib.dump(candle_dict, pkl)
+    signal_candles = load_backtest_analysis_data(
+        tmp_path, "signals", f"backtest-result-{sample_date}.zip", pairs=["UNITTEST/BTC"]
+    )
+    assert signal_candles["DefStrat"].keys() == {"UNITTEST/BTC"}
+    assert signal_candles["DefStrat"]["UNITTEST/BTC"].equals(signal_df)
+    with pytest.raises(ValueError, match=r"File .*_exited\.pkl not found in zip"):
+        load_backtest_analysis_data(legacy_file, "exited")
+
+
+def test_write_read_backtest_candles_mixed_types(tmp_path, caplog):
+    signal_df = generate_test_data("5m", 3, "2022-01-03 12:00:00+00:00")
+    # Mixed types can't be stored as feather
+    signal_df["custom"] = ["x", 1.5, None]
+    candle_dict = {"DefStrat": {"UNITTEST/BTC": signal_df}}
+    bt_results = {"metadata": {}, "strategy": {}, "strategy_comparison": []}
+    mock_conf = {
+        "exportdirectory": tmp_path,
+        "export": "signals",
+        "runmode": "backtest",
+        "original_config": {},
+    }
+    sample_date = "2022_01_01_15_05_13"
+    data = {"signals": candle_dict, "rejected": {"DefStrat": {"UNITTEST/BTC": signal_df.iloc[:1]}}}
+    store_backtest_results(mock_conf, bt_results, sample_date, analysis_results=data)
+    assert log_has_re(r"Could not store signals candles as feather, using pickle instead.*", caplog)
+
+    with ZipFile(tmp_path / f"backtest-result-{sample_date}.zip", "r") as zipf:
+        names = zipf.namelist()
+    assert f"backtest-result-{sample_date}_signals.pkl" in names
+    assert f"backtest-result-{sample_date}_signals.json" not in names
+    assert not any(n.startswith(f"backtest-result-{sample_date}_signals_") for n in names)
+    # A single value per column can be stored as feather
+    assert f"backtest-result-{sample_date}_rejected.json" in names
+
+    signal_candles = load_backtest_analysis_data(tmp_path, "signals")
+    pd.testing.assert_frame_equal(signal_candles["DefStrat"]["UNITTEST/BTC"], signal_df)
+    rejected = load_backtest_analysis_data(tmp_path, "rejected")
+    pd.testing.assert_frame_equal(rejected["DefStrat"]["UNITTEST/BTC"], signal_df.iloc[:1])
+
+
+def test_store_backtest_results_trades_parquet(testdatadir, tmp_path, mocker):
+    source = testdatadir / "backtest_results/backtest-result_multistrat.json"
+    stats = load_backtest_stats(source)
+    store_backtest_results(
+        {"exportdirectory": tmp_path, "original_config": {}}, stats, "2022_01_01_15_05_13"
+    )
+    zip_file = tmp_path / "backtest-result-2022_01_01_15_05_13.zip"
+    with ZipFile(zip_file, "r") as zipf:
+        assert "backtest-result-2022_01_01_15_05_13_TestStrategy_trades.parquet" in zipf.namelist()
+        # Trades are only stored as parquet
+        stored_stats = json.loads(zipf.read("backtest-result-2022_01_01_15_05_13.json"))
+        assert all("trades" not in s for s in stored_stats["strategy"].values())
+
+    # ... and restored when loading the stats
+    loaded_stats = load_backtest_stats(zip_file)
+    for strategy in ("StrategyTestV2", "TestStrategy"):
+        assert loaded_stats["strategy"][strategy]["trades"] == stats["strategy"][strategy]["trades"]
+
+    stats_mock = mocker.spy(bt_fileutils, "load_backtest_stats")
+    for strategy in ("StrategyTestV2", "TestStrategy"):
+        trades = load_backtest_data(zip_file, strategy)
+        # Trades are loaded from parquet, without parsing the stats
+        assert stats_mock.call_count == 0
+        pd.testing.assert_frame_equal(trades, load_backtest_data(source, strategy))
+        stats_mock.reset_mock()
+
+    # Column and pair projection - identical for parquet and json results
+    for filename in (zip_file, source):
+        trades = load_backtest_data(
+            filename, "TestStrategy", columns=["pair", "profit_abs"], pairs=["ADA/BTC", "XLM/BTC"]
+        )
+        assert list(trades.columns) == ["pair", "profit_abs"]
+        assert set(trades["pair"]) == {"ADA/BTC", "XLM/BTC"}
+        assert len(trades) == 50
+
+    with pytest.raises(ValueError, match=r"Detected backtest result with more than one strategy"):
+        load_backtest_data(zip_file)
+
+    # Strategies without trades have no parquet member
+    stats["strategy"]["TestStrategy"]["trades"] = []
+    zip_file = store_backtest_results(
+        {"exportdirectory": tmp_path, "original_config": {}}, stats, "2022_01_01_15_05_14"
+    )
+    with ZipFile(zip_file, "r") as zipf:
+        assert "backtest-result-2022_01_01_15_05_14_TestStrategy_trades.parquet" not in (
+            zipf.namelist()
+        )
+    loaded_stats = load_backtest_stats(zip_file)
+    assert loaded_stats["strategy"]["TestStrategy"]["trades"] == []
+    assert len(loaded_stats["strategy"]["StrategyTestV2"]["trades"]) == 179
+    assert load_backtest_data(zip_file, "TestStrategy").empty
+
 
 def test_generate_pair_metrics():
     results = pd.DataFrame(
@@ -494,6 +614,35 @@ def test_calc_streak(testdatadir):
     assert calc_streak(bt_data) == (7, 18)
 
 
+def test_text_table_callback_profile(capsys):
+    profile = [
+        {
+            "name": "custom_exit",
+            "type": "callback",
+            "calls": 120,
+            "total": 0.6,
+            "mean": 0.005,
+            "p50": 0.004,
+            "p95": 0.009,
+            "p99": 0.0125,
+            "max": 0.02,
+        }
+    ]
+    text_table_callback_profile(profile)
+    text = capsys.readouterr().out
+
+    assert "CALLBACK PROFILE" in text
+    assert re.search(
+        r".* Name .* Type .* Calls .* Total ms .* Mean ms .* p50 ms .* p95 ms .* p99 ms .* Max ms",
+        text,
+    )
+    assert re.search(
+        r".* custom_exit .* callback .* 120 .* 600.000 .* 5.000 .* 4.000 .* 9.000 .* 12.500 "
+        r".* 20.000",
+        text,
+    )
+
+
 def test_text_table_exit_reason(capsys):
     results = pd.DataFrame(
         {
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+from freqtrade.persistence import BacktestOrder, BacktestTrade, LocalTrade, Order
+from freqtrade.util import dt_now
+
+
+def _create_order(trade: BacktestTrade, order_id: int, side: str, amount: float, price: float):
+    order = BacktestOrder(
+        id=order_id,
+        ft_trade_id=trade.id,
+        ft_is_open=True,
+        ft_pair=trade.pair,
+        order_id=str(order_id),
+        symbol=trade.pair,
+        ft_order_side=side,
+        side=side,
+        order_type="limit",
+        status="open",
+        order_date=trade.open_date,
+        ft_price=price,
+        price=price,
+        average=price,
+        amount=amount,
+        filled=0,
+        remaining=amount,
+        cost=amount * price,
+    )
+    order._trade_bt = trade
+    trade.add_order(order)
+    return order
+
+
+def test_backtest_order():
+    order = BacktestOrder(ft_order_side="buy", amount=2.0, ft_amount=2.0, ft_price=10.0)
+    assert not hasattr(order, "__dict__")
+    assert order.price is None
+    assert order.safe_price == 10.0
+    assert order.safe_remaining == 2.0
+    assert order.safe_filled == 0.0
+
+    converted = order.to_order()
+    assert isinstance(converted, Order)
+    assert converted.ft_order_side == "buy"
+    assert converted.safe_price == 10.0
+
+
+def test_backtest_trade_order_index(fee):
+    open_date = dt_now() - timedelta(hours=2)
+    trade = BacktestTrade(
+        id=1,
+        pair="ETH/BTC",
+        stake_amount=0.001,
+        open_rate=0.01,
+        amount=0,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        open_date=open_date,
+        exchange="binance",
+    )
+    entry = _create_order(trade, 1, "buy", 0.1, 0.01)
+    assert trade.has_open_orders
+    assert trade.open_orders == [entry]
+    assert trade.select_order("buy", is_open=True) is entry
+    assert trade.select_order("sell", is_open=True) is None
+    assert trade.nr_of_successful_entries == 0
+
+    entry.close_bt_order(open_date, trade)
+    assert not trade.has_open_orders
+    assert trade.open_orders == []
+    assert trade.select_order("buy", is_open=True) is None
+    assert trade.select_order("buy", is_open=False) is entry
+    assert trade.nr_of_successful_entries == 1
+    assert trade.amount == 0.1
+
+    exit_order = _create_order(trade, 2, "sell", 0.1, 0.011)
+    assert trade.select_order(is_open=True) is exit_order
+    trade.remove_order(exit_order)
+    assert not trade.has_open_orders
+    assert trade.orders == [entry]
+
+    exit_order = _create_order(trade, 3, "sell", 0.1, 0.011)
+    exit_order.close_bt_order(open_date + timedelta(hours=1), trade)
+    trade.close(exit_order.ft_price, show_msg=False)
+    assert trade.nr_of_successful_entries == 1
+    assert trade.nr_of_successful_exits == 1
+    assert trade.select_filled_orders() == [entry, exit_order]
+
+    # The index matches the results of the LocalTrade implementation
+    local_trade = trade.to_local_trade()
+    assert type(local_trade) is LocalTrade
+    assert all(type(o) is Order for o in local_trade.orders)
+    assert all(o.trade is local_trade for o in local_trade.orders)
+    assert local_trade.nr_of_successful_entries == trade.nr_of_successful_entries
+    assert local_trade.nr_of_successful_exits == trade.nr_of_successful_exits
+    assert local_trade.to_json() == trade.to_json()
+    assert local_trade.to_json(True) == trade.to_json(True)
@@ -1893,6 +1893,53 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_index(fee):
+    Trade.use_db = False
+    Trade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    # Closed out of order - e.g. when using a detail timeframe
+    close_offsets = [10, 20, 15, 30, 25, 40]
+    for idx, offset in enumerate(close_offsets):
+        trade = LocalTrade(
+            pair="ETH/BTC" if idx % 2 else "XRP/BTC",
+            stake_amount=0.001,
+            amount=1,
+            open_rate=0.01,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            open_date=start + timedelta(minutes=idx),
+            close_date=start + timedelta(minutes=offset),
+            is_open=False,
+            exchange="binance",
+        )
+        LocalTrade.add_bt_trade(trade)
+
+    def expected(pair, close_date):
+        return [
+            t
+            for t in LocalTrade.bt_trades
+            if (not pair or t.pair == pair) and t.close_date and t.close_date > close_date
+        ]
+
+    for pair in (None, "ETH/BTC", "XRP/BTC", "ADA/BTC"):
+        for minutes in (0, 10, 15, 22, 40):
+            close_date = start + timedelta(minutes=minutes)
+            res = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=close_date)
+            assert res == expected(pair, close_date)
+
+    res = Trade.get_trades_proxy(
+        is_open=False, close_date=start, open_date=start + timedelta(minutes=2)
+    )
+    assert res == LocalTrade.bt_trades[3:]
+
+    # Trades added later are picked up, a reset rebuilds the index
+    LocalTrade.bt_trades.append(LocalTrade.bt_trades[0])
+    assert len(Trade.get_trades_proxy(is_open=False, close_date=start)) == 7
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(is_open=False, close_date=start) == []
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2148,6 +2195,8 @@ def test_Trade_object_idem():
         "bt_trades",
         "bt_trades_open",
         "bt_trades_open_pp",
+        "bt_trades_changed",
+        "bt_trades_closed_index",
         "bt_open_open_trade_count",
         "bt_total_profit",
         "from_json",
@@ -158,3 +158,34 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_index_nodb():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    start = datetime(2020, 5, 1, 14, 0, 0, tzinfo=UTC)
+    for i in range(100):
+        PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=5 * i), now=start)
+    PairLocks.lock_pair("XRP/BTC", start + timedelta(minutes=5 * 50), now=start, side="long")
+
+    now = start + timedelta(minutes=5 * 90)
+    assert PairLocks.is_pair_locked("ETH/BTC", now)
+    assert not PairLocks.is_pair_locked("XRP/BTC", now, side="long")
+    # Expired locks are removed from the index - but kept in PairLocks.locks
+    assert len(PairLocks._index._all) < 20
+    assert len(PairLocks.get_all_locks()) == 101
+    assert len(PairLocks.get_pair_locks(None, now)) == 11
+
+    # Earlier dates are still supported
+    assert PairLocks.is_pair_locked("XRP/BTC", start, side="long")
+    assert len(PairLocks.get_pair_locks(None, start)) == 101
+
+    PairLocks.unlock_pair("ETH/BTC", now)
+    assert not PairLocks.is_pair_locked("ETH/BTC", now)
+
+    PairLocks.reset_locks()
+    assert not PairLocks.is_pair_locked("ETH/BTC", start)
+    PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=5), now=start)
+    assert PairLocks.is_pair_locked("ETH/BTC", start)
+    PairLocks.use_db = True
@@ -4,6 +4,7 @@ Unit test file for rpc/api_server.py
 
 import asyncio
 import logging
+import shutil
 import time
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
@@ -3015,13 +3016,15 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         Backtesting.cleanup()
 
 
-def test_api_backtest_history(botclient, mocker, testdatadir):
+def test_api_backtest_history(botclient, mocker, testdatadir, tmp_path: Path):
     ftbot, client = botclient
+    bt_results_base = tmp_path / "backtest_results"
+    shutil.copytree(testdatadir / "backtest_results", bt_results_base)
     mocker.patch(
         "freqtrade.data.btanalysis.bt_fileutils._get_backtest_files",
         return_value=[
-            testdatadir / "backtest_results/backtest-result_multistrat.json",
-            testdatadir / "backtest_results/backtest-result.json",
+            bt_results_base / "backtest-result_multistrat.json",
+            bt_results_base / "backtest-result.json",
         ],
     )
 
@@ -3029,13 +3032,26 @@ def test_api_backtest_history(botclient, mocker, testdatadir):
     assert_response(rc, 503)
     assert rc.json()["detail"] == "Bot is not in the correct state."
 
-    ftbot.config["user_data_dir"] = testdatadir
+    ftbot.config["user_data_dir"] = tmp_path
     ftbot.config["runmode"] = RunMode.WEBSERVER
 
     rc = client_get(client, f"{BASE_URI}/backtest/history")
     assert_response(rc)
     result = rc.json()
     assert len(result) == 3
+
+    rc = client_get(client, f"{BASE_URI}/backtest/history?strategy=TestStrategy")
+    assert_response(rc)
+    assert [r["strategy"] for r in rc.json()] == ["TestStrategy"]
+    rc = client_get(client, f"{BASE_URI}/backtest/history?limit=1&offset=1")
+    assert_response(rc)
+    assert rc.json() == result[1:2]
+    rc = client_get(client, f"{BASE_URI}/backtest/history?since=1648904007")
+    assert_response(rc)
+    assert rc.json() == []
+    rc = client_get(client, f"{BASE_URI}/backtest/history?timerange=2022")
+    assert_response(rc, 400)
+    assert rc.json()["detail"] == 'Incorrect syntax for timerange "2022"'
     fn = result[0]["filename"]
     assert fn == "backtest-result_multistrat"
     assert result[0]["notes"] == ""
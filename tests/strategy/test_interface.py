@@ -5,6 +5,7 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pandas import DataFrame, concat
 
@@ -642,6 +643,84 @@ def test_ft_stoploss_reached(
     strategy.custom_stoploss = original_stopvalue
 
 
+def test_ft_has_callback(default_conf) -> None:
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert strategy.ft_has_callback("leverage")
+    assert strategy.ft_has_callback("adjust_trade_position")
+    assert not strategy.ft_has_callback("custom_exit")
+    assert not strategy.ft_has_callback("check_entry_timeout")
+    assert not strategy.ft_has_callback("order_filled")
+
+    # Callbacks assigned to the instance
+    strategy.custom_exit = MagicMock(return_value=None)
+    assert strategy.ft_has_callback("custom_exit")
+    strategy.check_buy_timeout = MagicMock(return_value=False)
+    assert strategy.ft_has_callback("check_entry_timeout")
+    assert not strategy.ft_has_callback("check_exit_timeout")
+
+    # Legacy callbacks are used by the default implementation
+    class LegacyStrategy(StrategyTestV3):
+        def check_sell_timeout(self, *args, **kwargs) -> bool:
+            return False
+
+    strategy = LegacyStrategy(default_conf)
+    assert strategy.ft_has_callback("check_exit_timeout")
+    assert not strategy.ft_has_callback("check_entry_timeout")
+
+
+def test_populate_conditions(default_conf, testdatadir) -> None:
+    class ConditionStrategy(StrategyTestV3):
+        buy_rsi = IntParameter([0, 50], default=30, space="buy")
+
+        def populate_entry_conditions(self, dataframe, metadata, params):
+            return {"enter_long": params.column(dataframe["rsi"]) < params.buy_rsi}
+
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    strategy = ConditionStrategy(default_conf)
+    strategy.ft_load_hyper_params()
+    strategy.buy_rsi.value = 30
+    assert strategy.ft_has_callback("populate_entry_conditions")
+    assert not strategy.ft_has_callback("populate_exit_conditions")
+
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"], fill_up_missing=True)
+    df = strategy.advise_indicators(data["UNITTEST/BTC"], {"pair": "UNITTEST/BTC"})
+    res = strategy.ft_advise_signals(df.copy(), {"pair": "UNITTEST/BTC"})
+    assert res["enter_long"].sum() == (df["rsi"] < 30).sum() > 0
+    assert set(res["enter_long"].unique()) == {0, 1}
+    assert (res["enter_tag"] == "").all()
+    # Exit signals of populate_exit_trend()
+    expected = StrategyTestV3.populate_exit_trend(strategy, df.copy(), {"pair": "UNITTEST/BTC"})
+    assert res["exit_long"].equals(expected["exit_long"])
+
+    strategy.buy_rsi.value = 40
+    res = strategy.ft_advise_signals(df.copy(), {"pair": "UNITTEST/BTC"})
+    assert res["enter_long"].sum() == (df["rsi"] < 40).sum()
+
+    # Signals evaluated before (by hyperopt)
+    signals = {"enter_long": (df["rsi"] > 70).to_numpy()}
+    res = strategy.ft_advise_signals(df.copy(), {"pair": "UNITTEST/BTC"}, signals)
+    assert res["enter_long"].sum() == (df["rsi"] > 70).sum()
+
+    params = strategy.ft_signal_parameters()
+    assert not params.batched
+    assert params.buy_rsi == 40
+    assert params.column(df["rsi"]) is df["rsi"]
+    with pytest.raises(AttributeError, match=r"no parameter named sell_foo"):
+        _ = params.sell_foo
+
+    params = strategy.ft_signal_parameters({"buy_rsi": np.array([[20, 30, 40]])})
+    assert params.batched
+    assert params.column(df["rsi"]).shape == (len(df), 1)
+    assert (params.column(df["rsi"]) < params.buy_rsi).shape == (len(df), 3)
+
+    strategy.populate_entry_conditions = lambda dataframe, metadata, params: {
+        "exit_long": dataframe["rsi"] > 70
+    }
+    with pytest.raises(OperationalException, match=r"invalid signal columns exit_long"):
+        strategy.ft_advise_signals(df.copy(), {"pair": "UNITTEST/BTC"})
+
+
 def test_custom_exit(default_conf, fee, caplog) -> None:
     strategy = StrategyResolver.load_strategy(default_conf)
     trade = Trade(
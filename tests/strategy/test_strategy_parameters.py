@@ -12,6 +12,7 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    track_parameter_access,
 )
 
 
@@ -133,3 +134,26 @@ def test_hyperopt_categorical_parameter():
     HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
     assert len(list(catpar.range)) == 1
     assert len(list(boolpar.range)) == 1
+
+
+def test_track_parameter_access():
+    intpar = IntParameter(low=0, high=5, default=1, space="buy")
+    decpar = DecimalParameter(low=0, high=1, default=0.5, decimals=2, space="buy")
+    catpar = CategoricalParameter(["a", "b"], default="a", space="sell")
+
+    # Reads outside of a tracking context aren't recorded
+    assert intpar.value == 1
+    with track_parameter_access() as accessed:
+        assert decpar.value == 0.5
+        assert list(intpar.range) == [1]
+        with track_parameter_access() as inner:
+            assert catpar.value == "a"
+        # Setting values is no access
+        intpar.value = 2
+    assert inner == {catpar}
+    # Nested accesses are recorded in the outer context as well
+    assert accessed == {decpar, intpar, catpar}
+
+    with track_parameter_access() as accessed:
+        pass
+    assert accessed == set()
@@ -1,17 +1,21 @@
 # pragma pylint: disable=missing-docstring
 from copy import deepcopy
+from math import fsum
 from unittest.mock import MagicMock
 
 import pytest
 from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
-from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
+from freqtrade.exceptions import DependencyException, OperationalException
+from freqtrade.persistence import BacktestOrder, BacktestTrade, LocalTrade, Trade
+from freqtrade.util import dt_now
+from freqtrade.wallets import ExactSum, Wallets
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
+    get_patched_exchange,
     get_patched_freqtradebot,
     patch_wallet,
 )
@@ -386,6 +390,100 @@ def test_sync_wallet_dry(mocker, default_conf_usdt, fee):
     assert free + used == total
 
 
+def test_exact_sum():
+    values = [0.1, 1e20, 0.2, -1e20, 3.3e-300, 123.456, -0.1]
+    exact = ExactSum()
+    for value in values:
+        exact.add(value)
+    assert exact.value == fsum(values)
+    # Naive summation loses the small values next to 1e20
+    assert exact.value != sum(values)
+
+    # Removing values keeps the sum exact
+    exact.add(1e20, -1)
+    exact.add(-1e20, -1)
+    assert exact.value == fsum([0.1, 0.2, 3.3e-300, 123.456, -0.1])
+    for value in [0.1, 0.2, 3.3e-300, 123.456, -0.1]:
+        exact.add(value, -1)
+    assert exact.value == 0.0
+
+
+def test_sync_wallet_backtest(mocker, default_conf_usdt, fee):
+    default_conf_usdt["dry_run"] = True
+    exchange = get_patched_exchange(mocker, default_conf_usdt)
+    LocalTrade.reset_trades()
+    wallets = Wallets(default_conf_usdt, exchange, is_backtest=True)
+    # Disabled to count recalculations - enabled again below.
+    wallets.verify_backtest_balances = False
+    balance_mock = mocker.spy(wallets, "_get_trade_balance")
+
+    trades = []
+    for idx, pair in enumerate(["ETH/USDT", "XRP/USDT"], start=1):
+        trade = BacktestTrade(
+            id=idx,
+            pair=pair,
+            stake_amount=100.0,
+            open_rate=2.0,
+            amount=0,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            open_date=dt_now(),
+            exchange="binance",
+        )
+        LocalTrade.add_bt_trade(trade)
+        order = BacktestOrder(
+            id=idx,
+            ft_is_open=True,
+            ft_pair=pair,
+            order_id=str(idx),
+            ft_order_side="buy",
+            side="buy",
+            status="open",
+            order_date=trade.open_date,
+            ft_price=2.0,
+            price=2.0,
+            average=2.0,
+            amount=50.0,
+            filled=0,
+            remaining=50.0,
+        )
+        order._trade_bt = trade
+        trade.add_order(order)
+        trades.append(trade)
+
+    wallets.update()
+    assert balance_mock.call_count == 2
+    assert wallets.get_free("USDT") == 800
+    assert wallets.get_used("USDT") == 200
+
+    # Only changed trades are recalculated
+    balance_mock.reset_mock()
+    wallets.update()
+    assert balance_mock.call_count == 0
+    trades[0].orders[0].close_bt_order(dt_now(), trades[0])
+    wallets.update()
+    assert balance_mock.call_count == 1
+    assert wallets.get_used("USDT") == 100
+    assert wallets.get_total("ETH") == 50
+
+    # Totals are adjusted by the changed trade only
+    assert wallets._bt_entry_stake.value == 100
+    assert wallets._bt_stake_amount.value == 200
+
+    LocalTrade.remove_bt_trade(trades[1])
+    wallets.update()
+    assert balance_mock.call_count == 1
+    assert wallets._bt_stake_amount.value == 100
+    assert wallets.get_free("USDT") == 900
+    assert wallets.get_used("USDT") == 0
+
+    # Trades changed without notification are detected by the consistency check
+    trades[0].stake_amount = 50
+    wallets.verify_backtest_balances = True
+    with pytest.raises(OperationalException, match="out of sync"):
+        wallets.update()
+
+
 def test_sync_wallet_futures_dry(mocker, default_conf, fee):
     default_conf["dry_run"] = True
     default_conf["trading_mode"] = "futures"
@@ -0,0 +1,54 @@
+import pytest
+
+from freqtrade.util import CallbackProfiler
+from freqtrade.util.callback_profiler import RESERVOIR_SIZE
+
+
+def test_callback_profiler():
+    profiler = CallbackProfiler()
+    assert profiler.get_stats() == []
+
+    for duration in (0.1, 0.2, 0.3):
+        profiler.record("custom_exit", duration)
+    profiler.record("custom_stoploss", 1.0)
+
+    with profiler.measure("backtest_loop", "phase"):
+        pass
+
+    wrapped = profiler.wrap("enter_trade", lambda a, b=1: a + b)
+    assert wrapped(1, b=2) == 3
+
+    stats = {stat["name"]: stat for stat in profiler.get_stats()}
+    assert set(stats) == {"custom_exit", "custom_stoploss", "backtest_loop", "enter_trade"}
+    assert profiler.get_stats()[0]["name"] == "custom_stoploss"
+
+    assert stats["custom_exit"]["type"] == "callback"
+    assert stats["custom_exit"]["calls"] == 3
+    assert round(stats["custom_exit"]["total"], 6) == 0.6
+    assert round(stats["custom_exit"]["mean"], 6) == 0.2
+    assert round(stats["custom_exit"]["p50"], 6) == 0.2
+    assert stats["custom_exit"]["max"] == 0.3
+
+    assert stats["backtest_loop"]["type"] == "phase"
+    assert stats["backtest_loop"]["calls"] == 1
+    assert stats["enter_trade"]["type"] == "phase"
+    assert stats["enter_trade"]["calls"] == 1
+
+
+def test_callback_profiler_bounded_memory():
+    profiler = CallbackProfiler()
+    calls = RESERVOIR_SIZE * 5
+    for idx in range(calls):
+        profiler.record("backtest_loop", idx / calls, "phase")
+
+    # Only a sample of the durations is kept
+    assert len(profiler._durations[("backtest_loop", "phase")].sample) == RESERVOIR_SIZE
+    stats = profiler.get_stats()[0]
+    assert stats["calls"] == calls
+    assert stats["total"] == pytest.approx((calls - 1) / 2)
+    assert stats["mean"] == pytest.approx(0.5, abs=1e-4)
+    assert stats["max"] == (calls - 1) / calls
+    # Percentiles are estimated from the sample
+    assert stats["p50"] == pytest.approx(0.5, abs=0.02)
+    assert stats["p95"] == pytest.approx(0.95, abs=0.02)
+    assert stats["p99"] == pytest.approx(0.99, abs=0.02)